@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Throughput and latency of the analyzer over the test corpus.
+
+Usage:
+    python benchmarks/bench_analyzer.py run [--repeat N] [--modes cold,warm,batch] [--output FILE]
+    python benchmarks/bench_analyzer.py compare BASELINE CURRENT [--alpha A] [--threshold T]
+
+`run` analyzes every test/<slug>/ solution `--repeat` times in each mode:
+
+- cold: a fresh `bin/run.py` process per analysis, as a one-shot container does;
+- warm: `Exercise.analyze()` in this process, after one untimed analysis per
+  exercise, split into the phases of common/timing.py (read, parse, rules,
+  pylint, details, dump);
+- batch: the whole corpus as one `run.py --batch` style manifest, each run
+  on its own copy of the solutions, reporting throughput and the per-job
+  wall time. Batch groups lint their solutions in one pass before running
+  their jobs, so the per-job times leave that pass out; the throughput
+  includes it.
+
+The lint cache is turned off, so every analysis really runs pylint. It prints
+p50/p95/p99 per exercise and writes the raw samples as JSON (--output), which
+is the baseline a later `compare` reads.
+
+`compare` flags the exercises whose samples got slower: the difference has to
+be significant (Mann-Whitney U, two-sided, p < --alpha) and the median has to
+grow by more than --threshold. It exits with 1 when anything regressed.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import version
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = ROOT.joinpath("test")
+MODES = ("cold", "warm", "batch")
+
+# Every analysis runs pylint; set before common is imported, and inherited by the cold runs.
+os.environ["ANALYZER_LINT_CACHE_ENTRIES"] = "0"
+os.environ.pop("ANALYZER_LINT_CACHE_DIR", None)
+
+sys.path.insert(0, str(ROOT.joinpath("lib")))
+
+
+def corpus(directory: Path = CORPUS):
+    """The exercise slugs with a solution under `directory`."""
+
+    return sorted(path.name for path in directory.iterdir()
+                  if path.is_dir() and any(path.glob("*.py")) and not path.name.startswith("__"))
+
+
+def percentiles(samples):
+    """The p50, p95 and p99 of `samples`, in seconds."""
+
+    if len(samples) < 2:
+        return samples[0], samples[0], samples[0]
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+def run_cold(slugs, repeat, output: Path):
+    """Seconds per fresh one-shot process, by exercise."""
+
+    results = {slug: {"samples": []} for slug in slugs}
+    command = [sys.executable, str(ROOT.joinpath("bin", "run.py"))]
+    for _ in range(repeat):
+        for slug in slugs:
+            start = time.perf_counter()
+            subprocess.run([*command, slug, str(CORPUS.joinpath(slug)), str(output)],
+                           check=True, stderr=subprocess.DEVNULL)
+            results[slug]["samples"].append(time.perf_counter() - start)
+    return results
+
+
+def run_warm(slugs, repeat, output: Path):
+    """Seconds per in-process analysis and its phases, by exercise."""
+
+    from common import Exercise
+    from common.timing import PHASES, record
+
+    exercises = {slug: Exercise.factory(slug, CORPUS.joinpath(slug), output) for slug in slugs}
+    for exercise in exercises.values():
+        exercise.analyze()  # imports, linter set-up and first-use caches
+
+    results = {slug: {"samples": [], "phases": {phase: [] for phase in PHASES}} for slug in slugs}
+    for _ in range(repeat):
+        for slug, exercise in exercises.items():
+            with record() as timings:
+                exercise.analyze()
+            results[slug]["samples"].append(timings.total)
+            for phase in PHASES:
+                results[slug]["phases"][phase].append(timings.phases.get(phase, 0.0))
+    return results
+
+
+def run_batch_mode(slugs, repeat, output: Path):
+    """Per-job wall time by exercise, and the throughput of one manifest of the whole corpus."""
+
+    from common.batch import run_manifest
+
+    manifest = output.joinpath("manifest.jsonl")
+    summary = output.joinpath("summary.jsonl")
+    with open(manifest, "w", encoding="utf-8") as jobs:
+        for index in range(repeat):
+            for slug in slugs:
+                # Identical modules would share one lint result, so each run gets its own copy.
+                solution = output.joinpath("batch", str(index), slug)
+                shutil.copytree(CORPUS.joinpath(slug), solution, ignore=shutil.ignore_patterns("__pycache__"))
+                jobs.write(json.dumps({"exercise": slug, "input": str(solution),
+                                       "output": str(solution)}) + "\n")
+
+    start = time.perf_counter()
+    totals = run_manifest(manifest, summary)
+    elapsed = time.perf_counter() - start
+
+    results = {slug: {"samples": []} for slug in slugs}
+    with open(summary, "r", encoding="utf-8") as records:
+        for line in records:
+            result = json.loads(line)
+            if result["status"] == "ok":
+                results[result["exercise"]]["samples"].append(result["wall_time"])
+
+    return results, {"jobs": sum(totals.values()), "seconds": elapsed, "statuses": totals,
+                     "jobs_per_second": sum(totals.values()) / elapsed}
+
+
+def metadata(repeat):
+    """What the numbers were measured with."""
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {"python": sys.version, "pylint": version("pylint"), "astroid": version("astroid"),
+            "platform": platform.platform(), "cpus": os.cpu_count(), "commit": commit,
+            "repeat": repeat, "time": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def print_mode(mode, results):
+    """Print the percentiles (and phase medians) of one mode."""
+
+    print(f"\n{mode}")
+    print(f"{'exercise':<30} {'n':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for slug, result in results.items():
+        if not result["samples"]:
+            print(f"{slug:<30} {0:>4}  (no successful runs)")
+            continue
+        p50, p95, p99 = percentiles(result["samples"])
+        print(f"{slug:<30} {len(result['samples']):>4} {p50 * 1000:9.1f} {p95 * 1000:9.1f} {p99 * 1000:9.1f}")
+
+    phases = [result["phases"] for result in results.values() if "phases" in result]
+    if phases:
+        medians = {phase: statistics.median(sum((times[phase] for times in phases), []))
+                   for phase in phases[0]}
+        print("median phase times: " + ", ".join(f"{phase} {seconds * 1000:.2f} ms"
+                                                 for phase, seconds in medians.items()))
+
+
+def run(args):
+    slugs = args.exercises or corpus()
+    modes = [mode for mode in args.modes.split(",") if mode]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        sys.exit(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    report = {"meta": metadata(args.repeat), "modes": {}}
+    with tempfile.TemporaryDirectory(prefix="bench-analyzer") as tmp_dir:
+        output = Path(tmp_dir)
+        if "cold" in modes:
+            report["modes"]["cold"] = run_cold(slugs, args.repeat, output)
+        if "warm" in modes:
+            report["modes"]["warm"] = run_warm(slugs, args.repeat, output)
+        if "batch" in modes:
+            report["modes"]["batch"], report["throughput"] = run_batch_mode(slugs, args.repeat, output)
+
+    print(f"{len(slugs)} exercises, {args.repeat} runs each, lint cache off")
+    for mode, results in report["modes"].items():
+        print_mode(mode, results)
+    if "throughput" in report:
+        throughput = report["throughput"]
+        print(f"\nbatch throughput: {throughput['jobs']} jobs in {throughput['seconds']:.2f} s,"
+              f" {throughput['jobs_per_second']:.1f} jobs/s")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nsamples written to {args.output}")
+
+
+def mann_whitney(first, second):
+    """
+    Two-sided p-value of the Mann-Whitney U test between two samples.
+
+    Uses the normal approximation with a tie correction, which is good
+    enough from about eight samples a side.
+    """
+
+    n1, n2 = len(first), len(second)
+    ranked = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+
+    # Average ranks over ties, and collect the tie sizes for the variance.
+    ranks = [0.0] * len(ranked)
+    ties = []
+    index = 0
+    while index < len(ranked):
+        end = index
+        while end + 1 < len(ranked) and ranked[end + 1][0] == ranked[index][0]:
+            end += 1
+        for position in range(index, end + 1):
+            ranks[position] = (index + end) / 2 + 1
+        ties.append(end - index + 1)
+        index = end + 1
+
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, ranked) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    total = n1 + n2
+    variance = n1 * n2 / 12 * ((total + 1) - sum(t ** 3 - t for t in ties) / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def compare(args):
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+
+    regressions = 0
+    print(f"{'mode':<6} {'exercise':<30} {'base p50':>9} {'now p50':>9} {'change':>8} {'p-value':>9}")
+    for mode, results in current["modes"].items():
+        for slug, result in results.items():
+            before = baseline["modes"].get(mode, {}).get(slug, {}).get("samples")
+            after = result["samples"]
+            if not before or not after:
+                continue
+
+            base, now = statistics.median(before), statistics.median(after)
+            change = now / base - 1
+            p_value = mann_whitney(before, after)
+            verdict = ""
+            if p_value < args.alpha and abs(change) > args.threshold:
+                verdict = "REGRESSION" if change > 0 else "improved"
+                regressions += change > 0
+            print(f"{mode:<6} {slug:<30} {base * 1000:9.1f} {now * 1000:9.1f} {change:+8.1%} {p_value:9.4f} {verdict}")
+
+    print(f"\n{regressions} regression(s) at alpha {args.alpha} and threshold {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="measure the corpus")
+    run_parser.add_argument("--repeat", type=int, default=10, help="runs per exercise and mode (default: 10)")
+    run_parser.add_argument("--modes", default=",".join(MODES), help="comma separated (default: %(default)s)")
+    run_parser.add_argument("--exercises", nargs="*", help="only these exercises (default: the whole corpus)")
+    run_parser.add_argument("--output", type=Path, help="write the samples to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--alpha", type=float, default=0.01, help="significance level (default: 0.01)")
+    compare_parser.add_argument("--threshold", type=float, default=0.05,
+                                help="smallest median change reported (default: 0.05)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
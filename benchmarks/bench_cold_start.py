@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare the cold-start wall time of a one-shot run with and without precompiled bytecode.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--repeat N] [--bytecode DIR]
+
+Both sides run `bin/run.py two-fer test/two-fer/ OUT` in a fresh interpreter
+with PYTHONDONTWRITEBYTECODE=1, as in the read-only image:
+
+- source: PYTHONPYCACHEPREFIX points at an empty directory, so nothing can be
+  read from any __pycache__ and every module is compiled from source;
+- bytecode: PYTHONPYCACHEPREFIX points at a tree built by bin/build_bytecode.py
+  (built into a temporary directory unless --bytecode is given).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def cold_start(prefix: Path, output: Path) -> float:
+    """Seconds for one fresh one-shot run using the bytecode under `prefix`."""
+
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONPYCACHEPREFIX=str(prefix))
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT.joinpath("bin", "run.py")), "two-fer",
+                    str(ROOT.joinpath("test", "two-fer")), str(output)],
+                   env=env, check=True, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per layout (default: 5)")
+    parser.add_argument("--bytecode", type=Path, help="an existing bin/build_bytecode.py tree")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-cold-start") as tmp_dir:
+        tmp = Path(tmp_dir)
+        empty = tmp.joinpath("empty")
+        empty.mkdir()
+
+        bytecode = args.bytecode
+        if bytecode is None:
+            bytecode = tmp.joinpath("bytecode")
+            subprocess.run([sys.executable, str(ROOT.joinpath("bin", "build_bytecode.py")), "--output", str(bytecode)],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        results = {"source": [], "bytecode": []}
+        for _ in range(args.repeat):
+            results["source"].append(cold_start(empty, tmp))
+            results["bytecode"].append(cold_start(bytecode, tmp))
+
+    print(f"one-shot two-fer run, {args.repeat} runs each")
+    for name, timings in results.items():
+        print(f"{name:>9}: median {statistics.median(timings) * 1000:7.1f} ms,"
+              f" min {min(timings) * 1000:7.1f} ms, max {max(timings) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare the cost of `import common` with a baseline revision's.
+
+Usage:
+    python benchmarks/bench_import.py [--baseline REV] [--repeat N] [--alpha A] [--threshold T]
+
+Import times depend on the machine (disk cache, CPU, the Python build), so
+there is no fixed budget: the baseline revision (HEAD by default, i.e. the
+working tree against the last commit) is checked out into a temporary git
+worktree, and the two `lib/` trees are imported in alternating fresh
+interpreters started with `-X importtime`. Each sample is the cumulative time
+reported for the `common` package. The script exits with 1 when the working
+tree is slower: significantly (Mann-Whitney U, p < --alpha) and by more than
+--threshold on the median, as `bench_analyzer.py compare` does.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_analyzer import mann_whitney
+
+ROOT = Path(__file__).resolve().parent.parent
+LIBRARY = ROOT.joinpath("lib")
+
+
+def import_time(library: Path, module: str = "common") -> float:
+    """Cumulative milliseconds a fresh interpreter spends importing `module` from `library`."""
+
+    env = dict(os.environ, PYTHONPATH=str(library))
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            env=env, capture_output=True, text=True, check=True).stderr
+
+    for line in output.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def samples(baseline: str, repeat: int):
+    """`repeat` import times of the baseline's lib/ and of the working tree's, taken in turns."""
+
+    with tempfile.TemporaryDirectory(prefix="bench-import-") as tmp_dir:
+        worktree = Path(tmp_dir, "baseline")
+        subprocess.run(["git", "-C", str(ROOT), "worktree", "add", "--detach", "--quiet", str(worktree), baseline],
+                       check=True)
+        try:
+            before, after = [], []
+            for _ in range(repeat):
+                before.append(import_time(worktree.joinpath("lib")))
+                after.append(import_time(LIBRARY))
+            return before, after
+        finally:
+            subprocess.run(["git", "-C", str(ROOT), "worktree", "remove", "--force", str(worktree)], check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default="HEAD", help="git revision to compare with (default: HEAD)")
+    parser.add_argument("--repeat", type=int, default=20, help="interpreters to start for each (default: 20)")
+    parser.add_argument("--alpha", type=float, default=0.01, help="significance level (default: 0.01)")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="smallest median change reported (default: 0.05)")
+    args = parser.parse_args()
+
+    before, after = samples(args.baseline, args.repeat)
+    base, now = statistics.median(before), statistics.median(after)
+    change = now / base - 1
+    p_value = mann_whitney(before, after)
+
+    print(f"import common: {args.baseline} median {base:.1f} ms, working tree median {now:.1f} ms"
+          f" ({change:+.1%}, p={p_value:.4f}) over {args.repeat} runs each")
+
+    if change > args.threshold and p_value < args.alpha:
+        print("slower than the baseline", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare the per-file cost of a fresh pylint Run with the reused Linter.
+
+Usage:
+    python benchmarks/bench_linter.py [--repeat N]
+
+Both sides lint every golden solution under test/ with the analyzer's rcfile.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT.joinpath("lib")))
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from common.exercise import Exercise
+from common.linter import get_linter
+from common.pylint_comments import PYLINTRC
+
+
+def solutions():
+    """The golden test solutions, one per exercise."""
+
+    for golden in sorted(ROOT.glob("test/*/analysis.json")):
+        yield Exercise.factory(golden.parent.name, golden.parent, golden.parent).in_path
+
+
+def fresh_run(path: Path):
+    Run([str(path), f"--rcfile={PYLINTRC}", "--score=n", "--jobs=1"],
+        reporter=CollectingReporter(), exit=False)
+
+
+def reused_linter(path: Path):
+    get_linter().lint(path)
+
+
+def measure(lint, paths, repeat):
+    """Median seconds per file for each path."""
+
+    timings = []
+    for path in paths:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            lint(path)
+            samples.append(time.perf_counter() - start)
+        timings.append(statistics.median(samples))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per file (default: 3)")
+    args = parser.parse_args()
+
+    paths = list(solutions())
+
+    # Build the shared linter outside the timings, as the daemon or a batch worker would.
+    get_linter().lint(paths[0])
+
+    results = {"fresh Run": measure(fresh_run, paths, args.repeat),
+               "reused Linter": measure(reused_linter, paths, args.repeat)}
+
+    print(f"{len(paths)} files, median of {args.repeat} runs each")
+    for name, timings in results.items():
+        print(f"{name:>14}: mean {statistics.mean(timings) * 1000:8.1f} ms/file,"
+              f" max {max(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
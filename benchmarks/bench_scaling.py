@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+How analysis time and memory grow with the size of a solution.
+
+Usage:
+    python benchmarks/bench_scaling.py MANIFEST [--csv FILE] [--memory] [--max-nodes N]
+
+MANIFEST is written by benchmarks/generate_corpus.py. Every variant is
+analyzed in this process with the lint cache off, after a warm-up, and its
+time is split into the phases of common/timing.py. With --memory each
+variant is analyzed a second time under tracemalloc for its peak allocation
+(kept apart, as tracing slows the analysis down).
+
+One row per variant (its features, seconds per phase and peak KiB) goes to
+--csv for charting. The summary fits time ~ nodes^k over octaves of AST node
+count: k near 1 is linear, and the octaves where the local k of pylint goes
+well above 1 are where it turns super-linear.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Every analysis runs pylint; set before common is imported.
+os.environ["ANALYZER_LINT_CACHE_ENTRIES"] = "0"
+os.environ.pop("ANALYZER_LINT_CACHE_DIR", None)
+
+sys.path.insert(0, str(ROOT.joinpath("lib")))
+
+SUPER_LINEAR = 1.2
+
+
+def slope(points):
+    """The least-squares slope of log(y) over log(x)."""
+
+    points = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def measure(jobs, memory):
+    """A row of features, phase times and (optionally) peak memory for each job."""
+
+    from common import Exercise
+    from common.timing import PHASES, record
+
+    rows = []
+    for job in jobs:
+        exercise = Exercise.factory(job["exercise"], Path(job["input"]), Path(job["output"]))
+        features = job["features"]
+        row = {"exercise": job["exercise"], "seed": features["seed"],
+               "mutations": "+".join(features["mutations"]),
+               **{key: features[key] for key in ("bytes", "lines", "nodes", "function_count", "depth")}}
+
+        with record() as timings:
+            exercise.analyze()
+        row["total"] = timings.total
+        row.update((phase, timings.phases.get(phase, 0.0)) for phase in PHASES)
+
+        if memory:
+            tracemalloc.start()
+            exercise.analyze()
+            row["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+
+        rows.append(row)
+        print(f"{len(rows):5d}/{len(jobs)} {row['nodes']:8d} nodes {row['total'] * 1000:9.1f} ms", file=sys.stderr)
+
+    return rows
+
+
+def summarize(rows, memory):
+    """Print the exponents overall and per octave of AST node count."""
+
+    columns = ["total", "pylint", "rules", "parse"] + (["peak_kib"] if memory else [])
+
+    print("fit of value ~ nodes^k over all variants")
+    for column in columns:
+        k = slope([(row["nodes"], row[column]) for row in rows])
+        print(f"  {column:<9} k = {k:.2f}" if k is not None else f"  {column:<9} not enough data")
+
+    octaves = {}
+    for row in rows:
+        octaves.setdefault(int(math.log2(max(row["nodes"], 1))), []).append(row)
+
+    print(f"\n{'nodes':>17} {'n':>5} {'median ms':>10} {'pylint ms':>10} {'ms/knode':>9} {'local k':>8}")
+    previous = None
+    for octave in sorted(octaves):
+        bucket = octaves[octave]
+        nodes = statistics.median(row["nodes"] for row in bucket)
+        total = statistics.median(row["total"] for row in bucket)
+        pylint = statistics.median(row["pylint"] for row in bucket)
+        local = slope([previous, (nodes, pylint)]) if previous else None
+        flag = "  super-linear" if local is not None and local > SUPER_LINEAR else ""
+        local_text = f"{local:8.2f}" if local is not None else f"{'':8}"
+        print(f"{2 ** octave:>8}-{2 ** (octave + 1) - 1:<8} {len(bucket):5d} {total * 1000:10.1f}"
+              f" {pylint * 1000:10.1f} {total * 1e6 / nodes:9.2f} {local_text}{flag}")
+        previous = (nodes, pylint)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("manifest", type=Path, help="manifest.jsonl written by generate_corpus.py")
+    parser.add_argument("--csv", type=Path, help="write one row per variant to this file")
+    parser.add_argument("--memory", action="store_true", help="also measure the peak allocation")
+    parser.add_argument("--max-nodes", type=int, help="skip variants with more AST nodes")
+    args = parser.parse_args()
+
+    with open(args.manifest, "r", encoding="utf-8") as manifest:
+        jobs = [json.loads(line) for line in manifest if line.strip()]
+    if args.max_nodes:
+        jobs = [job for job in jobs if job["features"]["nodes"] <= args.max_nodes]
+    jobs.sort(key=lambda job: job["features"]["nodes"])
+
+    from common.jobs import warm_up
+
+    warm_up()
+    start = time.perf_counter()
+    rows = measure(jobs, args.memory)
+    print(f"{len(rows)} variants analyzed in {time.perf_counter() - start:.1f} s\n")
+
+    if args.csv and rows:
+        with open(args.csv, "w", encoding="utf-8", newline="") as output:
+            writer = csv.DictWriter(output, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if rows:
+        summarize(rows, args.memory)
+
+
+if __name__ == "__main__":
+    main()
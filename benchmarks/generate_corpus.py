@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Generate a large synthetic corpus of solutions from the test corpus.
+
+Usage:
+    python benchmarks/generate_corpus.py OUTPUT [--variants N] [--seed S]
+                                         [--max-copies C] [--max-depth D] [--max-repeat R]
+
+Every solution under test/ (the solution file and .meta/example.py or
+.meta/exemplar.py) is a seed. Each seed gets --variants variants, made by a
+random selection of these mutations:
+
+- rename: local names, arguments and functions renamed, in snake_case or camelCase;
+- style: unused imports, `== None` comparisons, docstrings dropped, overlong
+  lines and trailing whitespace;
+- long: every function body but its last statement repeated up to --max-repeat times;
+- nest: every function body wrapped in `if`/`for` blocks up to --max-depth deep;
+- functions: the module's functions copied up to --max-copies times.
+
+The sizes are drawn log-uniformly, so the corpus spreads over a wide range
+of source sizes. Variants are written to OUTPUT/<slug>/<nnnn>/ alongside
+the seed's other modules and .meta/config.json, and listed in
+OUTPUT/manifest.jsonl: a `run.py --batch` manifest whose lines also carry
+the variant's `features`: the seed, the mutations that changed it and their
+parameters, and its bytes, lines, AST nodes, function count and nesting depth. The same --seed always generates the same corpus.
+"""
+
+import argparse
+import ast
+import builtins
+import copy
+import json
+import math
+import random
+import shutil
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = ROOT.joinpath("test")
+# In the order they are applied: bodies are lengthened before they are nested into a single block.
+MUTATIONS = ("rename", "style", "long", "nest", "functions")
+
+
+def solution_name(directory: Path) -> str:
+    """The file name of the solution in a test/<slug>/ directory, as Exercise.factory finds it."""
+
+    config = directory.joinpath(".meta", "config.json")
+    if config.is_file():
+        return json.loads(config.read_text())["files"]["solution"][0]
+    return f"{directory.name.replace('-', '_')}.py"
+
+
+def seeds(corpus: Path = CORPUS):
+    """(slug, seed path, solution file name) for every seed in the corpus."""
+
+    for directory in sorted(corpus.iterdir()):
+        if not directory.is_dir() or directory.name.startswith("__"):
+            continue
+        name = solution_name(directory)
+        for path in [directory.joinpath(name), *sorted(directory.joinpath(".meta").glob("exampl*.py"))]:
+            if path.is_file():
+                yield directory.name, path, name
+
+
+def log_uniform(rng: random.Random, high: int) -> int:
+    """A whole number in [1, high], as likely to be small as to be large in order of magnitude."""
+
+    return min(high, int(math.exp(rng.uniform(0, math.log(high + 1)))))
+
+
+def functions_of(tree: ast.Module):
+    return [node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+
+class Renamer(ast.NodeTransformer):
+    """Rename the names a module defines itself, leaving builtins, imports and attributes alone."""
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def visit_Name(self, node):
+        node.id = self.mapping.get(node.id, node.id)
+        return node
+
+    def visit_arg(self, node):
+        node.arg = self.mapping.get(node.arg, node.arg)
+        return self.generic_visit(node)
+
+    def visit_keyword(self, node):
+        if node.arg is not None:
+            node.arg = self.mapping.get(node.arg, node.arg)
+        return self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        node.name = self.mapping.get(node.name, node.name)
+        return self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Global(self, node):
+        node.names = [self.mapping.get(name, name) for name in node.names]
+        return node
+
+    visit_Nonlocal = visit_Global
+
+
+def rename(tree, rng, features):
+    imported = {alias.asname or alias.name.split(".")[0]
+                for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+                for alias in node.names}
+    # Reached through attributes, which are left alone.
+    members = {target.id if isinstance(target, ast.Name) else target.name
+               for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+               for item in node.body
+               for target in (item.targets if isinstance(item, ast.Assign) else [item])
+               if isinstance(target, (ast.Name, ast.FunctionDef, ast.AsyncFunctionDef))}
+
+    defined = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            defined.add(node.id)
+        elif isinstance(node, ast.arg):
+            defined.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name not in members:
+            defined.add(node.name)
+
+    keep = imported | members | set(dir(builtins)) | {"self", "cls"}
+    style = rng.choice(("snake", "camel"))
+    mapping = {}
+    for index, name in enumerate(sorted(defined - keep)):
+        if name.startswith("__"):
+            continue
+        mapping[name] = f"renamedValue{index}" if style == "camel" else f"renamed_value_{index}"
+
+    if mapping:
+        features["rename"] = {"names": len(mapping), "style": style}
+    return Renamer(mapping).visit(tree)
+
+
+def style(tree, rng, features):
+    tree.body.insert(0, ast.Import(names=[ast.alias(name=rng.choice(("os", "sys", "re", "math")))]))
+
+    dropped = 0
+    for node in functions_of(tree):
+        if ast.get_docstring(node) is not None and len(node.body) > 1 and rng.random() < 0.5:
+            node.body.pop(0)
+            dropped += 1
+        if node.args.args and rng.random() < 0.5:
+            argument = node.args.args[0].arg
+            node.body.insert(0, ast.If(test=ast.Compare(left=ast.Name(argument, ast.Load()), ops=[ast.Eq()],
+                                                         comparators=[ast.Constant(None)]),
+                                       body=[ast.Pass()], orelse=[]))
+
+    tree.body.append(ast.Assign(targets=[ast.Name("OVERLONG_LINE", ast.Store())],
+                                value=ast.Constant("x" * rng.randint(100, 300))))
+
+    features["style"] = {"docstrings_dropped": dropped, "trailing_whitespace": rng.random() < 0.5}
+    return tree
+
+
+def nest(tree, rng, features, max_depth):
+    depth = log_uniform(rng, max_depth)
+    functions = functions_of(tree)
+    for node in functions:
+        body = node.body
+        for level in range(depth):
+            if level % 4 == 3:
+                body = [ast.For(target=ast.Name("_", ast.Store()),
+                                iter=ast.Call(ast.Name("range", ast.Load()), [ast.Constant(1)], []),
+                                body=body, orelse=[])]
+            else:
+                body = [ast.If(test=ast.Constant(True), body=body, orelse=[])]
+        node.body = body
+
+    if functions:
+        features["nest"] = {"depth": depth}
+    return tree
+
+
+def lengthen(tree, rng, features, max_repeat):
+    repeat = log_uniform(rng, max_repeat)
+    lengthened = 0
+    for node in functions_of(tree):
+        *statements, last = node.body
+        if statements and repeat > 1:
+            node.body = [copy.deepcopy(statement) for _ in range(repeat) for statement in statements] + [last]
+            lengthened += 1
+
+    # Not a "long" variant unless some body was actually repeated.
+    if lengthened:
+        features["long"] = {"repeat": repeat, "functions": lengthened}
+    return tree
+
+
+def copy_functions(tree, rng, features, max_copies):
+    copies = log_uniform(rng, max_copies)
+    originals = [node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    for index in range(1, copies):
+        for node in originals:
+            duplicate = copy.deepcopy(node)
+            duplicate.name = f"{node.name}_{index}"
+            tree.body.append(duplicate)
+
+    if originals and copies > 1:
+        features["functions"] = {"copies": copies}
+    return tree
+
+
+def depth_of(node, depth=0):
+    """The deepest nesting of compound statements under `node`."""
+
+    blocks = (ast.If, ast.For, ast.While, ast.With, ast.Try, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    return max([depth_of(child, depth + isinstance(child, blocks)) for child in ast.iter_child_nodes(node)],
+               default=depth)
+
+
+def mutate(source, rng, args):
+    """A mutated copy of `source` and the features describing it."""
+
+    tree = ast.parse(source)
+    features = {}
+    chosen = [mutation for mutation in MUTATIONS if rng.random() < 0.5]
+
+    for mutation in chosen:
+        if mutation == "rename":
+            tree = rename(tree, rng, features)
+        elif mutation == "style":
+            tree = style(tree, rng, features)
+        elif mutation == "nest":
+            tree = nest(tree, rng, features, args.max_depth)
+        elif mutation == "long":
+            tree = lengthen(tree, rng, features, args.max_repeat)
+        elif mutation == "functions":
+            tree = copy_functions(tree, rng, features, args.max_copies)
+
+    variant = ast.unparse(ast.fix_missing_locations(tree)) + "\n"
+    if features.get("style", {}).get("trailing_whitespace"):
+        variant = "\n".join(line + "  " if line and rng.random() < 0.2 else line
+                            for line in variant.split("\n"))
+
+    final = ast.parse(variant)
+    return variant, {"mutations": [mutation for mutation in chosen if mutation in features], **features,
+                     "bytes": len(variant.encode("utf-8")), "lines": variant.count("\n"),
+                     "nodes": sum(1 for _ in ast.walk(final)),
+                     "function_count": len(functions_of(final)), "depth": depth_of(final)}
+
+
+def generate(output: Path, args) -> int:
+    """Write the corpus and its manifest into `output`, returning the number of variants."""
+
+    rng = random.Random(args.seed)
+    output.mkdir(parents=True, exist_ok=True)
+    count = 0
+
+    with open(output.joinpath("manifest.jsonl"), "w", encoding="utf-8") as manifest:
+        for slug, seed, name in seeds():
+            source = seed.read_text(encoding="utf-8")
+            for _ in range(args.variants):
+                variant, features = mutate(source, rng, args)
+
+                directory = output.joinpath(slug, f"{count:04d}")
+                shutil.copytree(CORPUS.joinpath(slug), directory,
+                                ignore=shutil.ignore_patterns("__pycache__", "*_test.py", "analysis.json",
+                                                              "*.md", "*.j2", "*.toml", "exampl*.py"))
+                directory.joinpath(name).write_text(variant, encoding="utf-8")
+
+                features["seed"] = str(seed.relative_to(CORPUS))
+                manifest.write(json.dumps({"exercise": slug, "input": str(directory), "output": str(directory),
+                                           "features": features}) + "\n")
+                count += 1
+
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", type=Path, help="directory to write the corpus into")
+    parser.add_argument("--variants", type=int, default=20, help="variants per seed (default: 20)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--max-copies", type=int, default=64, help="most copies of the functions (default: 64)")
+    parser.add_argument("--max-depth", type=int, default=32, help="deepest extra nesting (default: 32)")
+    parser.add_argument("--max-repeat", type=int, default=32, help="most repeats of a body (default: 32)")
+    args = parser.parse_args()
+
+    count = generate(args.output, args)
+    print(f"{count} variants written to {args.output}, listed in {args.output.joinpath('manifest.jsonl')}")
+
+
+if __name__ == "__main__":
+    main()
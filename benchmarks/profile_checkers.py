@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Rank pylint's checkers and messages by what they cost on student code.
+
+Usage:
+    python benchmarks/profile_checkers.py [--manifest FILE] [--repeat N] [--limit N] [--no-gates] [--json FILE]
+
+Lints every solution under test/ (or every job of a `--batch` manifest, ie
+one written by benchmarks/generate_corpus.py) with the analyzer's .pylintrc,
+timing each checker's visit_/leave_ callbacks and process_module or
+process_tokens. The report ranks the checkers (with the plugin that loads
+them, for the extensions in load-plugins) and the messages by the time of
+the callbacks that check them, alongside how often each was emitted.
+
+Solutions are linted in passes of --group-size modules, as batches are.
+Checkers a module can't need are left out of its lint, as always (see
+common.checker_gates); with --no-gates every checker runs on every module.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = ROOT.joinpath("test")
+
+sys.path.insert(0, str(ROOT.joinpath("lib")))
+
+from common import Exercise
+from common.checker_profile import CheckerProfile
+from common.exercise import read_solution
+from common.linter import get_linter
+
+
+def solutions(manifest: Path = None):
+    """(in_path, source) of every solution in `manifest`, or in the test corpus."""
+
+    if manifest is None:
+        jobs = [(path.name, path) for path in sorted(CORPUS.iterdir())
+                if path.is_dir() and path.name in Exercise.available_analyzers()]
+    else:
+        with open(manifest, "r", encoding="utf-8") as lines:
+            jobs = [(job["exercise"], Path(job["input"])) for job in map(json.loads, lines)]
+
+    for slug, directory in jobs:
+        in_path = Exercise.factory(slug, directory, directory).in_path
+        if in_path.is_file():
+            yield str(in_path), read_solution(in_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manifest", type=Path, help="lint the solutions of this manifest (default: test/)")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the solutions (default: 3)")
+    parser.add_argument("--group-size", type=int, default=20, help="modules per pylint pass (default: 20)")
+    parser.add_argument("--limit", type=int, default=25, help="rows per table (default: 25)")
+    parser.add_argument("--no-gates", action="store_true", help="run every checker on every module")
+    parser.add_argument("--json", type=Path, help="also write the full profile to this file")
+    args = parser.parse_args()
+
+    modules = list(solutions(args.manifest))
+    linter = get_linter()
+    linter.gating = not args.no_gates
+    linter.lint_many(modules[:1])  # imports and first-use caches stay out of the profile
+
+    linter.profile = profile = CheckerProfile()
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for index in range(0, len(modules), args.group_size):
+            linter.lint_many(modules[index:index + args.group_size])
+    elapsed = time.perf_counter() - start
+    linter.profile = None
+
+    print(f"{len(modules)} solutions x {args.repeat} in {elapsed:.2f} s\n")
+    for line in profile.report(args.limit):
+        print(line)
+
+    if args.json:
+        args.json.write_text(json.dumps(profile.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#! /usr/bin/env python3
+"""
+Precompile the analyzer and its lint stack into a bytecode tree.
+
+Run once when building the image, after the analyzer is in its final place:
+./bin/build_bytecode.py
+
+The image runs read-only and is built without bytecode, so otherwise every
+cold run compiles lib/, pylint and astroid from source. This writes .pyc
+files for them under bytecode/, laid out for PYTHONPYCACHEPREFIX, which
+bin/run.sh sets whenever that directory exists.
+
+Python only looks under the prefix once it is set, so the standard library
+modules an analysis imports are compiled as well: the script analyzes a
+solution first and compiles everything that was imported along the way.
+The .pyc files are unchecked-hash based: they are trusted without looking at
+the sources, which never change in the image.
+"""
+
+
+import argparse
+import compileall
+import importlib.util
+import py_compile
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve(strict=True).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+BYTECODE = ROOT.parent.joinpath("bytecode")
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+# Example snippets shown to students, never imported.
+EXCLUDE = re.compile(r"pylint_data")
+
+# Packages compiled in full, because pylint loads its checkers and astroid its brains from disk.
+LINT_STACK = ("pylint", "astroid", "isort", "mccabe", "dill", "platformdirs", "tomlkit")
+
+
+def package_directories(names):
+    """
+    The source directories of the installed `names` packages.
+    """
+    for name in names:
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.submodule_search_locations:
+            yield from spec.submodule_search_locations
+
+
+def imported_sources():
+    """
+    The source files of every module imported while analyzing a solution.
+    """
+    from common import analyze_source
+    from common.jobs import warm_up
+
+    warm_up()
+    for slug in ("two-fer", "black-jack"):
+        analyze_source(slug, '"""Cold-start training run."""\n\n\ndef answer():\n    return 42\n')
+
+    for module in list(sys.modules.values()):
+        source = getattr(module, "__file__", None)
+        if source and source.endswith(".py"):
+            yield source
+
+
+def build(prefix: Path) -> int:
+    """
+    Compile everything into the `prefix` tree, returning the number of files compiled.
+    """
+    sys.pycache_prefix = str(prefix.resolve())
+    mode = py_compile.PycInvalidationMode.UNCHECKED_HASH
+
+    for directory in [LIBRARY, *package_directories(LINT_STACK)]:
+        compileall.compile_dir(directory, quiet=2, force=True, rx=EXCLUDE, invalidation_mode=mode)
+
+    sources = set(imported_sources())
+    for source in sorted(sources):
+        compileall.compile_file(source, quiet=2, force=True, invalidation_mode=mode)
+
+    return sum(1 for _ in prefix.rglob("*.pyc"))
+
+
+def main():
+    """
+    Parse CLI arguments and build the bytecode tree.
+    """
+
+    parser = argparse.ArgumentParser(description="Precompile the analyzer and its lint stack.")
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=BYTECODE,
+        help="root of the PYTHONPYCACHEPREFIX tree (default: %(default)s)",
+    )
+
+    args = parser.parse_args()
+    count = build(args.output)
+    print(f"{count} modules compiled into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#! /usr/bin/env python3
+"""
+Resolve the lint profile of every exercise from .pylintrc and analyzers.json.
+
+Run once when building the image:
+./bin/build_lint_profiles.py
+
+The analyzer reads lib/common/lint_profiles.json on its first lint when it
+exists, and resolves the profiles from the rcfile otherwise.
+"""
+
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve(strict=True).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.lint_profiles import PROFILES, build_profiles
+
+
+def main():
+    """
+    Parse CLI arguments and build the profiles.
+    """
+
+    parser = argparse.ArgumentParser(description="Resolve the lint profiles of the exercises.")
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=PROFILES,
+        help="where to write the profiles (default: %(default)s)",
+    )
+
+    args = parser.parse_args()
+    count = build_profiles(args.output)
+    print(f"{count} lint profiles written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
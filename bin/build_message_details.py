@@ -0,0 +1,54 @@
+#! /usr/bin/env python3
+"""
+Compile the extended pylint message feedback into a single SQLite bundle.
+
+Run once when building the image:
+./bin/build_message_details.py
+
+The analyzer reads lib/common/pylint_data/messages.sqlite when it exists, and
+falls back to the loose files under lib/common/pylint_data/messages/ otherwise.
+"""
+
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve(strict=True).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.message_details import build_bundle
+
+
+def main():
+    """
+    Parse CLI arguments and build the bundle.
+    """
+
+    parser = argparse.ArgumentParser(description="Compile pylint message details into one SQLite file.")
+
+    parser.add_argument(
+        "--messages",
+        type=Path,
+        default=LIBRARY.joinpath("common", "pylint_data", "messages"),
+        help="directory with one sub-directory of details per message (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=LIBRARY.joinpath("common", "pylint_data", "messages.sqlite"),
+        help="where to write the bundle (default: %(default)s)",
+    )
+
+    args = parser.parse_args()
+    count = build_bundle(args.messages, args.output)
+    print(f"{count} messages written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#! /usr/bin/env python3
+"""
+Compile the analyzer registry manifest from exercise-names.txt and analyzers.json.
+
+Run once when building the image:
+./bin/build_registry.py
+
+The analyzer reads lib/common/registry.json on its first lookup when it
+exists, and falls back to the two source files otherwise.
+"""
+
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve(strict=True).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.registry import MANIFEST, build_manifest
+
+
+def main():
+    """
+    Parse CLI arguments and build the manifest.
+    """
+
+    parser = argparse.ArgumentParser(description="Compile the analyzer registry manifest.")
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=MANIFEST,
+        help="where to write the manifest (default: %(default)s)",
+    )
+
+    args = parser.parse_args()
+    count = build_manifest(args.output)
+    print(f"{count} exercises written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
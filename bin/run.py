@@ -2,14 +2,30 @@
 """
 CLI for the auto-analyzer for the Python track on Exercism.org.
 ./bin/run.sh two_fer ~/solution-238382y7sds7fsadfasj23j/ ~/solution-238382y7sds7fsadfasj23j/output/
+
+Or as a long-running daemon accepting jobs on a Unix socket or local HTTP port:
+./bin/run.py --serve /tmp/analyzer.sock
+./bin/run.py --http 8080
+
+Or over a JSONL manifest of jobs, in one process:
+./bin/run.py --batch jobs.jsonl --summary summary.jsonl
+./bin/run.py --batch jobs.jsonl --workers 8 --max-tasks-per-worker 200 --max-rss-mb 512
+
+Add --fork to --serve, --http or --batch to run every job in its own process,
+forked from a parent that has already imported pylint and every analyzer.
+
+Add --profile-startup to a one-shot run to see where its start-up time goes,
+and --timing file (or log) to any run to emit the time spent in each phase of
+every analysis to a timing.json next to its analysis.json (or to stderr).
+With --deadline SECONDS, pylint is stopped once it has used most of that
+time, and the analysis is written with what was found so far, marked partial.
 """
 
 
 import argparse
-import importlib.util
+import os
 import sys
 from pathlib import Path
-from typing import NamedTuple
 
 ROOT = Path(__file__).resolve(strict=True).parent
 LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
@@ -39,14 +55,15 @@ def main():
     parser.add_argument(
         "exercise",
         metavar="EXERCISE",
+        nargs="?",
         type=str,
-        choices=sorted(Exercise.available_analyzers().keys()),
-        help="name of the exercise to analyze (One of: %(choices)s)",
+        help="name of the exercise to analyze (ie two-fer, see lib/common/exercise-names.txt)",
     )
 
     parser.add_argument(
         "input",
         metavar="IN",
+        nargs="?",
         type=directory,
         help="directory where the [EXERCISE.py] file is located",
     )
@@ -54,14 +71,161 @@ def main():
     parser.add_argument(
         "output",
         metavar="OUT",
+        nargs="?",
         type=directory,
         help="directory where the results.json files will be written",
     )
 
+    mode = parser.add_mutually_exclusive_group()
+
+    mode.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        type=Path,
+        help="run as a daemon, reading JSON jobs from the given Unix socket",
+    )
+
+    mode.add_argument(
+        "--http",
+        metavar="PORT",
+        type=int,
+        help="run as a daemon, accepting JSON jobs via POST /analyze on localhost:PORT",
+    )
+
+    mode.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        type=Path,
+        help="analyze every job in a JSONL manifest of {exercise, input, output} objects",
+    )
+
+    parser.add_argument(
+        "--summary",
+        metavar="FILE",
+        type=Path,
+        help="where --batch writes its per-job status JSONL (default: stdout)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=int,
+        help="spread --batch jobs over N worker processes",
+    )
+
+    parser.add_argument(
+        "--max-tasks-per-worker",
+        metavar="N",
+        type=int,
+        default=100,
+        help="recycle a --workers process after N jobs (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--max-rss-mb",
+        metavar="MB",
+        type=int,
+        help="recycle a --workers process once its resident memory passes MB",
+    )
+
+    parser.add_argument(
+        "--group-size",
+        metavar="N",
+        type=int,
+        default=20,
+        help="lint up to N --batch solutions of the same exercise in one pylint pass (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--fork",
+        action="store_true",
+        help="run each --serve, --http or --batch job in a child forked from a warmed-up parent",
+    )
+
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print the import-time tree and time to first analysis of a one-shot run",
+    )
+
+    parser.add_argument(
+        "--timing",
+        choices=("file", "log"),
+        help="emit per-phase timings of every analysis to timing.json or as a JSON line on stderr",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        metavar="SECONDS",
+        type=float,
+        help="time budget of every analysis; pylint is cut short to stay within it",
+    )
+
     args = parser.parse_args()
+
+    if args.deadline:
+        from common.deadline import DEADLINE_VARIABLE
+
+        # In the environment, so worker and forked processes keep to it as well.
+        os.environ[DEADLINE_VARIABLE] = str(args.deadline * 1000)
+
+    if args.timing:
+        from common.timing import TIMING_VARIABLE
+
+        # In the environment, so worker and forked processes record their analyses as well.
+        os.environ[TIMING_VARIABLE] = args.timing
+
+    if args.profile_startup:
+        if args.serve or args.http or args.batch:
+            parser.error("--profile-startup only profiles a one-shot EXERCISE IN OUT run")
+        if not sys._xoptions.get("importtime"):
+            from common.startup import profile_startup
+
+            sys.exit(profile_startup(sys.argv))
+
+    if args.fork and args.workers:
+        parser.error("--fork and --workers are mutually exclusive")
+
+    runner = None
+    if args.fork:
+        from common.zygote import Zygote
+
+        runner = Zygote().run
+
+    if args.serve or args.http:
+        from common.server import serve
+
+        serve(socket_path=args.serve, port=args.http, runner=runner)
+        return
+
+    if args.batch:
+        from functools import partial
+        from common.batch import run_manifest, run_serially
+        from common.jobs import run_job
+
+        execute = partial(run_serially, runner=runner or run_job, group_size=args.group_size)
+        if args.workers:
+            from common.pool import WorkerPool
+
+            execute = WorkerPool(args.workers, args.max_tasks_per_worker, args.max_rss_mb, args.group_size).run
+
+        run_manifest(args.batch, args.summary, execute)
+        return
+
+    if args.output is None:
+        parser.error("EXERCISE, IN and OUT are required")
+
+    if args.exercise not in Exercise.available_analyzers():
+        parser.error(f"no analyzer for exercise {args.exercise!r}")
+
     exercise = Exercise.factory(args.exercise, args.input, args.output)
     exercise.analyze()
 
+    if args.profile_startup:
+        from common.startup import report_first_analysis
+
+        report_first_analysis()
+
 
 if __name__ == "__main__":
     main()
@@ -3,4 +3,10 @@
 # Usage:
 # ./bin/run.sh two_fer ~/test/
 export PYTHONPATH=/opt/analyzer/lib/$1/
+
+# Use the precompiled bytecode when the image was built with it (see bin/build_bytecode.py).
+if [ -d /opt/analyzer/bytecode ]; then
+    export PYTHONPYCACHEPREFIX=/opt/analyzer/bytecode
+fi
+
 python bin/run.py $1 $2 $3
@@ -1,7 +1,16 @@
 """
 Common utilities for analyis of Exercism exercises.
 """
-from .exercise import Exercise, ExerciseError
+from .exercise import Exercise, ExerciseError, analyze_source
 from .comment  import BaseFeedback, Summary
 from .analysis import Analysis
-from .testing  import BaseExerciseTest
+
+
+def __getattr__(name):
+    # The unit-testing helpers (and their tempfile and abc imports) are only
+    # needed by tests, so they are imported on first use.
+    if name == "BaseExerciseTest":
+        from .testing import BaseExerciseTest
+
+        return BaseExerciseTest
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,8 @@ from pathlib import Path
 from enum import Enum
 from dataclasses import asdict, is_dataclass
 from common.comment import Comment, CommentTypes, Summary
+from common.deadline import current_budget
+from common.timing import span
 
 
 class AnalysisEncoder(json.JSONEncoder):
@@ -32,6 +34,11 @@ class Analysis(dict):
     def __init__(self, summary, comments):
         super(Analysis, self).__init__(summary=summary, comments=comments)
 
+        # PyLint ran out of time, so some of its comments may be missing.
+        budget = current_budget()
+        if budget is not None and budget.partial:
+            self["partial"] = True
+
 
     @property
     def summary(self) -> Summary:
@@ -76,21 +83,27 @@ class Analysis(dict):
         return cls(Summary.INFORM, comments)
 
     @classmethod
-    def summarize_comments(cls, comments, output_file, ideal=False):
+    def summarize_comments(cls, comments, output_file=None, ideal=False):
+        """
+        Create the Analysis matching the most severe of the comments.
+        If output_file is given, the Analysis is also dumped to it.
+        """
         comment_types = [item.type.name for item in comments]
 
         # Summarize "optimal" solutions.
         if (not comments) and ideal is True:
-            return Analysis.celebrate(comments).dump(output_file)
+            analysis = Analysis.celebrate(comments)
 
-        if 'ESSENTIAL' in comment_types:
-            return Analysis.require(comments).dump(output_file)
+        elif 'ESSENTIAL' in comment_types:
+            analysis = Analysis.require(comments)
 
-        if 'ACTIONABLE' in comment_types:
-            return Analysis.direct(comments).dump(output_file)
+        elif 'ACTIONABLE' in comment_types:
+            analysis = Analysis.direct(comments)
 
         else:
-            return Analysis.inform(comments).dump(output_file)
+            analysis = Analysis.inform(comments)
+
+        return analysis.dump(output_file) if output_file else analysis
 
 
     def dump(self, out_path: Path):
@@ -98,6 +111,6 @@ class Analysis(dict):
         Dump's the current state to analysis.json.
         As a convenience returns the Analysis itself.
         """
-        with open(out_path, "w") as dst:
+        with span("dump"), open(out_path, "w") as dst:
             json.dump(self, dst, indent=4, cls=AnalysisEncoder)
         return self
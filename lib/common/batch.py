@@ -0,0 +1,98 @@
+"""
+Batch analysis of many solutions in a single process.
+
+The manifest is a JSONL file with one job per line, e.g.
+`{"exercise": "two-fer", "input": "solutions/1/", "output": "results/1/"}`.
+Every job writes its own analysis.json, and one status record per job is
+appended to the summary JSONL.
+
+Jobs are grouped per exercise so that each group's solutions go through
+pylint in a single pass.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .jobs import Job, run_group, run_job
+
+GROUP_SIZE = 20
+
+
+def read_manifest(manifest_path: Path) -> Iterator:
+    """
+    Yield a Job for each line of the manifest, or an error record for lines that can't be read.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as manifest:
+        for lineno, line in enumerate(manifest, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield Job.from_dict(json.loads(line))
+            except Exception as err:
+                yield {"line": lineno, "status": "error", "error": f"{type(err).__name__}: {err}"}
+
+
+def group_jobs(jobs: Iterable, group_size: int = GROUP_SIZE) -> Iterator:
+    """
+    Gather `jobs` into lists of up to `group_size` jobs for the same exercise.
+
+    Entries that are not Jobs (e.g. manifest errors) are passed through as they come.
+    """
+    groups = {}
+
+    for job in jobs:
+        if not isinstance(job, Job):
+            yield job
+            continue
+
+        group = groups.setdefault(job.exercise, [])
+        group.append(job)
+        if len(group) >= group_size:
+            yield groups.pop(job.exercise)
+
+    yield from groups.values()
+
+
+def run_serially(jobs: Iterable, runner=run_job, group_size: int = GROUP_SIZE) -> Iterator[dict]:
+    """
+    Run the jobs group by group in this process, yielding a status record for each.
+    """
+    for group in group_jobs(jobs, group_size):
+        if isinstance(group, list):
+            yield from run_group(group, runner)
+        else:
+            yield group
+
+
+def run_batch(results: Iterable[dict], summary) -> dict:
+    """
+    Write one status record per job to the `summary` stream as the `results` come in.
+
+    Returns the count of jobs per status.
+    """
+
+    totals = {}
+
+    for result in results:
+        totals[result["status"]] = totals.get(result["status"], 0) + 1
+        summary.write(json.dumps(result) + "\n")
+        summary.flush()
+
+    return totals
+
+
+def run_manifest(manifest_path: Path, summary_path: Path = None, execute=run_serially) -> dict:
+    """
+    Run the jobs in `manifest_path` with `execute`, writing the summary to `summary_path` (stdout if omitted).
+
+    Failures are recorded and never abort the run.
+    """
+    results = execute(read_manifest(manifest_path))
+
+    if summary_path is None:
+        return run_batch(results, sys.stdout)
+
+    with open(summary_path, "w", encoding="utf-8") as summary:
+        return run_batch(results, summary)
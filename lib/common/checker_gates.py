@@ -0,0 +1,162 @@
+"""
+Leave out of a module's lint the checkers that have nothing to check in it.
+
+pylint's walker only calls a checker's visit_classdef on classes, but a
+checker about classes also hooks functions, assignments and attribute
+lookups, and spends time on them to find out they aren't in a class. The
+raw checkers read every module whole: duplicate-code, to compare it with
+the other modules (there are none, every module is linted alone), and the
+unicode checker, to look for characters most solutions don't have.
+
+Before a module is linted, `features()` scans its `ast` tree and text for
+the constructs in it, and CheckerGates leaves the checkers whose GATES none
+of them open out of the pass for that module:
+
+    gates = CheckerGates(**check_astroid_module.keywords)
+    gates.apply(features(tree, source))  # before checking the module
+    gates.reset()                        # after it
+
+A checker is only listed in GATES when every message it is able to emit
+needs one of the constructs of its gate (and nothing it keeps between
+modules depends on seeing the others), so its output is the same either way.
+"""
+
+import ast
+import functools
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Tuple
+
+# Constructs besides the `ast` node type names found by features().
+PRIVATE_ATTRIBUTE = "private attribute"
+ATTRIBUTE_ASSIGNMENT = "attribute assignment"
+UNUSUAL_TEXT = "unusual text"
+
+# Never found: the Linter doesn't compare modules with each other.
+ANOTHER_MODULE = "another module"
+
+# Checker class: the constructs one of which a module needs for the checker to run on it.
+GATES: Dict[str, Tuple[str, ...]] = {
+    "pylint.checkers.imports.ImportsChecker": ("Import", "ImportFrom"),
+    "pylint.checkers.exceptions.ExceptionsChecker": ("Raise", "Try", "TryStar"),
+
+    # protected-access and invalid-class-object look at `obj._name` and `obj.__class__`
+    # anywhere, and assigning-non-slot at any `obj.name = ...`; the rest is about methods.
+    "pylint.checkers.classes.class_checker.ClassChecker": ("ClassDef", PRIVATE_ATTRIBUTE, ATTRIBUTE_ASSIGNMENT),
+    "pylint.checkers.classes.special_methods_checker.SpecialMethodsChecker": ("ClassDef",),
+    "pylint.checkers.newstyle.NewStyleConflictChecker": ("ClassDef",),
+    "pylint.extensions.no_self_use.NoSelfUseChecker": ("ClassDef",),
+
+    "pylint.checkers.unicode.UnicodeChecker": (UNUSUAL_TEXT,),
+    "pylint.checkers.symilar.SimilaritiesChecker": (ANOTHER_MODULE,),
+}
+
+# What the unicode checker reports on: control characters (besides tab and newline)
+# and, in the first two lines, an encoding declaration (PEP 263).
+CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+CODING = re.compile(r"coding[:=]")
+
+
+def features(tree: ast.AST, source: str = "") -> FrozenSet[str]:
+    """
+    The constructs in a module: the names of its node types, PRIVATE_ATTRIBUTE,
+    ATTRIBUTE_ASSIGNMENT, and UNUSUAL_TEXT for non-ASCII or control characters
+    or an encoding declaration in its `source`.
+    """
+    found = set()
+    for node in ast.walk(tree):
+        found.add(type(node).__name__)
+        if isinstance(node, ast.Attribute):
+            if node.attr.startswith("_"):
+                found.add(PRIVATE_ATTRIBUTE)
+            if not isinstance(node.ctx, ast.Load):
+                found.add(ATTRIBUTE_ASSIGNMENT)
+
+    head = source.split("\n", 2)[:2]
+    if not source.isascii() or CONTROL_CHARACTERS.search(source) or any(CODING.search(line) for line in head):
+        found.add(UNUSUAL_TEXT)
+    return frozenset(found)
+
+
+def gate_of(checker) -> Tuple[str, ...]:
+    """
+    The GATES entry of `checker`, or () if it always runs.
+    """
+    return _gate_of_class(type(checker))
+
+
+@functools.lru_cache(maxsize=None)
+def _gate_of_class(checker_class) -> Tuple[str, ...]:
+    return GATES.get(f"{checker_class.__module__}.{checker_class.__qualname__}", ())
+
+
+class CheckerGates:
+    """
+    The checkers of one pylint pass, less those a module doesn't need.
+
+    Takes the arguments `_astroid_module_checker` binds, before anything
+    wraps their callbacks (see common.checker_profile and the deadline
+    checks), which must keep them in place: the checker of each callback,
+    and of each raw and token checker, is told by its position.
+    """
+
+    def __init__(self, walker, rawcheckers: List, tokencheckers: List):
+        self.walker = walker
+        self.events = (walker.visit_events, walker.leave_events)
+        self.checkers = (rawcheckers, tokencheckers)
+
+        # The gate of the checker of every callback, by event and position, and of every raw and token checker.
+        self.event_gates = tuple({cid: [gate_of(getattr(callback, "__self__", None)) for callback in callbacks]
+                                  for cid, callbacks in events.items()}
+                                 for events in self.events)
+        self.checker_gates = tuple([gate_of(checker) for checker in checkers] for checkers in self.checkers)
+        self.distinct = {gate for gates in self.event_gates for cid_gates in gates.values()
+                         for gate in cid_gates if gate}
+        self.distinct.update(gate for gates in self.checker_gates for gate in gates if gate)
+
+        # The raw and token checkers as the pass runs them; taken at the first module,
+        # once anything wrapping them has.
+        self.all_checkers = None
+
+        # The events and checkers for the modules with the same checkers left out.
+        self.variants = {}
+
+    def apply(self, found: FrozenSet[str]):
+        """
+        Check the next module without the checkers no construct in `found` opens the gate of.
+        """
+        if self.all_checkers is None:
+            self.all_checkers = tuple(list(checkers) for checkers in self.checkers)
+
+        closed = frozenset(gate for gate in self.distinct if found.isdisjoint(gate))
+        if not closed:
+            self.reset()
+            return
+
+        variant = self.variants.get(closed)
+        if variant is None:
+            variant = self.variants[closed] = (
+                tuple(self._without(events, gates, closed) for events, gates in zip(self.events, self.event_gates)),
+                tuple([checker for checker, gate in zip(checkers, gates) if gate not in closed]
+                      for checkers, gates in zip(self.all_checkers, self.checker_gates)))
+
+        events, checkers = variant
+        self.walker.visit_events, self.walker.leave_events = events
+        for current, kept in zip(self.checkers, checkers):
+            current[:] = kept
+
+    def reset(self):
+        """
+        Check the next module with every checker.
+        """
+        self.walker.visit_events, self.walker.leave_events = self.events
+        if self.all_checkers is not None:
+            for current, every in zip(self.checkers, self.all_checkers):
+                current[:] = every
+
+    @staticmethod
+    def _without(events, gates, closed):
+        kept = defaultdict(list)
+        for cid, callbacks in events.items():
+            kept[cid] = [callback for callback, gate in zip(callbacks, gates.get(cid, ())) if gate not in closed]
+        return kept
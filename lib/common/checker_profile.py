@@ -0,0 +1,170 @@
+"""
+Per-checker cost of pylint, aggregated over many modules.
+
+A CheckerProfile attached to the Linter wraps every visit_/leave_ callback
+of the AST walker, and the process_module/process_tokens of the raw and
+token checkers, in a timer:
+
+    linter = get_linter()
+    linter.profile = profile = CheckerProfile()
+    linter.lint_many(modules)
+    print("\\n".join(profile.report()))
+
+Callbacks run one after another, so their times don't overlap. Astroid
+infers lazily and caches, though: the inference a callback triggers first
+is counted against it, and whatever later callbacks find cached is not.
+The time of a callback is shared evenly between the messages it is
+declared to check (`only_required_for_messages`); callbacks declaring
+none are counted against the checker alone.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Tuple
+
+
+class CallbackStats:
+    """
+    Calls to one callback of one checker and the time spent in them.
+    """
+
+    __slots__ = ("checker", "plugin", "name", "messages", "calls", "seconds")
+
+    def __init__(self, checker: str, plugin: str, name: str, messages: Tuple[str, ...]):
+        self.checker = checker
+        self.plugin = plugin
+        self.name = name
+        self.messages = messages
+        self.calls = 0
+        self.seconds = 0.0
+
+
+def plugin_of(checker) -> str:
+    """
+    The rcfile `load-plugins` entry that brings in `checker`, or "" for the default checkers.
+    """
+    module = type(checker).__module__
+    return module if module.startswith("pylint.extensions.") else ""
+
+
+class CheckerProfile:
+    """
+    Time and calls per checker, callback and message, over every pass it instruments.
+    """
+
+    def __init__(self):
+        self.callbacks: Dict[Tuple[str, str], CallbackStats] = {}
+        self.emitted: Dict[str, int] = {}
+        self.modules = 0
+        self.seconds = 0.0
+
+    def timed(self, callback, checker):
+        """
+        `callback` of `checker`, counting its calls and time into this profile.
+        """
+        name = checker.name
+        key = (f"{name}:{type(checker).__name__}", callback.__name__)
+        stats = self.callbacks.get(key)
+        if stats is None:
+            stats = self.callbacks[key] = CallbackStats(
+                name, plugin_of(checker), callback.__name__, tuple(getattr(callback, "checks_msgs", ())))
+        clock = time.perf_counter
+
+        def timed_callback(*args):
+            start = clock()
+            try:
+                return callback(*args)
+            finally:
+                stats.seconds += clock() - start
+                stats.calls += 1
+
+        return timed_callback
+
+    def instrument(self, walker, rawcheckers: List, tokencheckers: List):
+        """
+        Time the callbacks of a pass, given the arguments `_astroid_module_checker` binds.
+        """
+        for events in (walker.visit_events, walker.leave_events):
+            for callbacks in events.values():
+                callbacks[:] = [self.timed(callback, callback.__self__) for callback in callbacks]
+
+        # Stand-ins with only the method `check_astroid_module` calls on each.
+        rawcheckers[:] = [SimpleNamespace(process_module=self.timed(checker.process_module, checker))
+                          for checker in rawcheckers]
+        tokencheckers[:] = [SimpleNamespace(process_tokens=self.timed(checker.process_tokens, checker))
+                            for checker in tokencheckers]
+
+    def count(self, messages, seconds: float):
+        """
+        Record the messages emitted for one module and the time it took to lint.
+        """
+        self.modules += 1
+        self.seconds += seconds
+        for message in messages:
+            self.emitted[message.symbol] = self.emitted.get(message.symbol, 0) + 1
+
+    def by_checker(self) -> List[dict]:
+        """
+        Checkers by time spent in them, slowest first.
+        """
+        checkers = {}
+        for stats in self.callbacks.values():
+            total = checkers.setdefault(stats.checker, {"checker": stats.checker, "plugin": stats.plugin,
+                                                        "calls": 0, "seconds": 0.0, "callbacks": []})
+            total["calls"] += stats.calls
+            total["seconds"] += stats.seconds
+            total["plugin"] = total["plugin"] or stats.plugin
+            if stats.calls:
+                total["callbacks"].append({"name": stats.name, "calls": stats.calls, "seconds": stats.seconds})
+
+        for total in checkers.values():
+            total["callbacks"].sort(key=lambda callback: -callback["seconds"])
+        return sorted(checkers.values(), key=lambda total: -total["seconds"])
+
+    def by_message(self) -> List[dict]:
+        """
+        Messages by the time of the callbacks checking them, slowest first.
+        """
+        messages = {}
+        for stats in self.callbacks.values():
+            for symbol in stats.messages:
+                total = messages.setdefault(symbol, {"message": symbol, "checker": stats.checker,
+                                                     "calls": 0, "seconds": 0.0})
+                total["calls"] += stats.calls
+                total["seconds"] += stats.seconds / len(stats.messages)
+
+        for symbol in self.emitted:
+            messages.setdefault(symbol, {"message": symbol, "checker": "", "calls": 0, "seconds": 0.0})
+        for total in messages.values():
+            total["emitted"] = self.emitted.get(total["message"], 0)
+        return sorted(messages.values(), key=lambda total: (-total["seconds"], total["message"]))
+
+    def to_dict(self) -> dict:
+        """
+        The JSON representation of this profile.
+        """
+        return {"modules": self.modules, "seconds": self.seconds,
+                "checkers": self.by_checker(), "messages": self.by_message()}
+
+    def report(self, limit: int = 25) -> Iterator[str]:
+        """
+        Lines of a ranked report: the costliest checkers and messages.
+        """
+        checkers = self.by_checker()
+        checked = sum(total["seconds"] for total in checkers) or 1.0
+        lint = self.seconds or 1.0
+
+        yield (f"{self.modules} modules linted in {self.seconds:.2f} s,"
+               f" {checked:.2f} s ({checked / lint:.0%}) of it in checker callbacks")
+        yield ""
+        yield f"{'checker':<28} {'plugin':<36} {'calls':>9} {'ms':>9} {'share':>6}  costliest callback"
+        for total in checkers[:limit]:
+            costliest = total["callbacks"][0]["name"] if total["callbacks"] else ""
+            yield (f"{total['checker']:<28} {total['plugin']:<36} {total['calls']:>9} "
+                   f"{total['seconds'] * 1000:9.1f} {total['seconds'] / checked:6.1%}  {costliest}")
+
+        yield ""
+        yield f"{'message':<40} {'checker':<28} {'emitted':>8} {'ms':>9} {'share':>6}"
+        for total in self.by_message()[:limit]:
+            yield (f"{total['message']:<40} {total['checker']:<28} {total['emitted']:>8} "
+                   f"{total['seconds'] * 1000:9.1f} {total['seconds'] / checked:6.1%}")
@@ -0,0 +1,122 @@
+"""
+Time budget of an analysis.
+
+With ANALYZER_DEADLINE_MS set (or `bin/run.py --deadline`), every analysis
+runs under a `budget()`:
+
+    with budget() as analysis_budget:
+        exercise.analyze()
+
+pylint gets PYLINT_SHARE of it, counted from the start of the analysis, and
+is stopped once that runs out: by SIGALRM on the main thread, and by checks
+between the callbacks of its checkers anywhere. The analysis then carries on
+with the messages pylint had emitted so far, and is marked partial.
+"""
+
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DEADLINE_VARIABLE = "ANALYZER_DEADLINE_MS"
+
+# The part of the budget pylint may use; the rest is kept for turning what it found into comments.
+PYLINT_SHARE = 0.9
+
+
+class DeadlineExceeded(BaseException):
+    """
+    Raised inside pylint when its time is up.
+
+    A BaseException, so that the `except Exception` clauses of pylint and
+    astroid don't turn it into a lint message.
+    """
+
+
+class Budget:
+    """
+    The time an analysis may take, from its start, and whether it had to cut anything short.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.start = time.perf_counter()
+        self.partial = False
+
+    def remaining(self, share: float = 1.0) -> float:
+        """
+        Seconds left of `share` of this budget (negative once it has run out).
+        """
+        return self.start + self.seconds * share - time.perf_counter()
+
+
+def budget_seconds() -> Optional[float]:
+    """
+    The budget of an analysis in seconds, from ANALYZER_DEADLINE_MS, or None for no limit.
+    """
+    try:
+        milliseconds = float(os.environ.get(DEADLINE_VARIABLE, ""))
+    except ValueError:
+        return None
+    return milliseconds / 1000 if milliseconds > 0 else None
+
+
+# The Budgets of the analyses running, innermost last.
+_budgets = []
+
+
+@contextmanager
+def budget(seconds: float = None) -> Iterator[Optional[Budget]]:
+    """
+    Run the block as an analysis with `seconds` (default: ANALYZER_DEADLINE_MS) to spare.
+
+    Yields the Budget, or None when there is no limit.
+    """
+    seconds = seconds if seconds is not None else budget_seconds()
+    if seconds is None:
+        yield None
+        return
+
+    current = Budget(seconds)
+    _budgets.append(current)
+    try:
+        yield current
+    finally:
+        _budgets.remove(current)
+
+
+def current_budget() -> Optional[Budget]:
+    """
+    The Budget of the innermost running analysis, if any.
+    """
+    return _budgets[-1] if _budgets else None
+
+
+@contextmanager
+def alarm(deadline: float):
+    """
+    Raise DeadlineExceeded in this block once `time.perf_counter()` passes `deadline`.
+
+    Only the main thread receives signals; elsewhere this does nothing, and
+    the cooperative checks are all there is.
+    """
+    if threading.current_thread() is not threading.main_thread() or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    armed = True
+
+    def expire(signum, frame):
+        if armed:
+            raise DeadlineExceeded()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, max(deadline - time.perf_counter(), 1e-6))
+    try:
+        yield
+    finally:
+        armed = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
@@ -1,26 +1,34 @@
 """Helpers for exercise discovery and execution."""
 
-import sys
-import importlib
 import json
+import tokenize
+from io import BytesIO
 from pathlib import Path
 from typing import NamedTuple
 
+from .registry import ExerciseAnalyzer, get_registry, load_implementation
+from .deadline import budget
+from .lint_profiles import selected
+from .timing import emit, record, span, timing_mode
+
 ROOT = Path(__file__).resolve(strict=True).parent
 LIBRARY = ROOT.parent.resolve(strict=True)
 
-# Map each available exercise name to its EXERCISE/analyzer.py module.
-# Use the analyzer at /opt/analyzer/lib/generic/analyzer.py if
-# no specific one is found in the directory.
-ANALYZERS = {analyzer.parent.name: analyzer for analyzer in LIBRARY.glob("*/analyzer.py")}
 
-file_path = Path('/opt/analyzer/lib/common/exercise-names.txt')
+def read_solution(path: Path) -> str:
+    """
+    Read a solution the way Python (and pylint) would: honoring its PEP 263
+    encoding declaration and keeping its line endings intact.
+    """
+    with span("read"):
+        data = path.read_bytes()
 
-with open(file_path, 'r') as file:
-    content = file.read().splitlines()
+    try:
+        encoding, _ = tokenize.detect_encoding(BytesIO(data).readline)
+    except SyntaxError:
+        encoding = "utf-8"
 
-for exercise in content:
-    ANALYZERS.setdefault(exercise, Path('/opt/analyzer/lib/common/generic_analyzer/analyzer.py'))
+    return data.decode(encoding)
 
 
 class ExerciseError(Exception):
@@ -42,17 +50,11 @@ class Exercise(NamedTuple):
     @property
     def analyzer(self):
         """
-        The analyzer.py module for this Exercise, imported lazily.
+        The analyzer for this Exercise: its shared implementation, imported
+        lazily, bound to this Exercise's options.
         """
-        module_name = f"{Exercise.sanitize_name(self.slug)}_analyzer"
-
-        if module_name not in sys.modules:
-            module = self.available_analyzers()[self.slug]
-            spec = importlib.util.spec_from_file_location(module_name, module)
-            analyzer = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(analyzer)
-            sys.modules[module_name] = analyzer
-        return sys.modules[module_name]
+        config = self.available_analyzers()[self.slug]
+        return ExerciseAnalyzer(load_implementation(config.implementation), config.options)
 
     @property
     def comments(self):
@@ -64,8 +66,28 @@ class Exercise(NamedTuple):
     def analyze(self):
         """
         Perform automatic analysis on this Exercise.
+
+        With ANALYZER_TIMING set, the time spent in each phase is emitted as well.
+        With ANALYZER_DEADLINE_MS set, the analysis runs within that budget.
+        pylint lints with this Exercise's lint profile.
+        """
+        mode = timing_mode()
+        with budget(), selected(self.slug):
+            if mode is None:
+                return self.analyzer.analyze(self.in_path, self.out_path)
+
+            with record() as timings:
+                analysis = self.analyzer.analyze(self.in_path, self.out_path)
+
+        emit(timings, mode, self.out_path.parent, exercise=self.slug, solution=str(self.in_path))
+        return analysis
+
+    def analyze_source(self, source: str):
         """
-        return self.analyzer.analyze(self.in_path, self.out_path)
+        Perform automatic analysis on the given source of this Exercise, in memory.
+        """
+        with budget(), selected(self.slug):
+            return self.analyzer.analyze_source(source, self.in_path)
 
     @staticmethod
     def sanitize_name(slug: str) -> str:
@@ -77,9 +99,12 @@ class Exercise(NamedTuple):
     @classmethod
     def available_analyzers(cls):
         """
-        Returns the map of available EXERCISE/analyzer.py files.
+        Returns the map of available exercises to their AnalyzerConfig.
+
+        Exercises without an entry of their own in analyzers.json use the
+        generic analyzer at lib/common/generic_analyzer/analyzer.py.
         """
-        return ANALYZERS
+        return get_registry()
 
     @classmethod
     def factory(cls, slug: str, in_directory: Path, out_directory: Path) -> "Exercise":
@@ -110,3 +135,19 @@ class Exercise(NamedTuple):
             tests_path = in_directory.joinpath(f"{sanitized}_test.py").resolve()
 
         return cls(slug, in_path, out_path, tests_path)
+
+
+def analyze_source(slug: str, source: str, filename: str = None):
+    """
+    Analyze the source text of a solution to `slug` and return its Analysis.
+
+    Nothing is read from or written to disk; `filename` (default: the
+    sanitized slug, ie `two_fer.py`) only names the module for pylint.
+    """
+
+    if slug not in Exercise.available_analyzers():
+        path = LIBRARY.joinpath(slug, "analyzer.py")
+        raise ExerciseError(f"No analyzer discovered at {path}")
+
+    in_path = Path(filename or f"{Exercise.sanitize_name(slug)}.py")
+    return Exercise(slug, in_path, None, None).analyze_source(source)
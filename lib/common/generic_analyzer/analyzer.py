@@ -2,20 +2,19 @@
 Generic Analyzer for the exercises that don't have a specific
 analyzer or specific customizations.
 
-Only Pylint comments are active.
+Only Pylint comments are active. Exercises opt into the general
+recommendations with the `general_recommendations` option in
+common/analyzers.json.
 """
 
-import ast
-
-from io import StringIO
-from pylint.lint import Run
-from pylint import run_pylint
 from pathlib import Path
-from pylint.reporters.text import TextReporter
 
 from common import Analysis, BaseFeedback, Summary
 from common.comment import Comment, CommentTypes
+from common.exercise import read_solution
+from common.parsing import parse
 from common.pylint_comments import generate_pylint_comments
+from common.timing import span
 
 
 class Comments(BaseFeedback):
@@ -26,44 +25,55 @@ class Comments(BaseFeedback):
     GENERAL_RECS = ("general", "general_recommendations")
 
 
-def analyze(in_path: Path, out_path: Path):
+def analyze_source(user_solution: str, in_path: Path, general_recommendations: bool = False) -> Analysis:
     """
-    Analyze the user's Two Fer solution to give feedback. Outputs a JSON that
+    Analyze the source text of the user's solution without touching the filesystem.
 
-    conforms to https://github.com/exercism/docs/blob/main/building/tooling/analyzers/interface.md#output-format
+    `in_path` only names the module for pylint; nothing is read or written.
+    With `general_recommendations`, a solution pylint has nothing to say about
+    gets the general recommendations instead.
     """
 
     # List of Comment objects to process
     comments = []
 
-    output_file = out_path.parent.joinpath("analysis.json")
-
-    # input file - if it can't be found, fail and bail
-    try:
-        user_solution = in_path.read_text()
-    except OSError as err:
-        # fail out fast with an ESSENTIAL (required) type comment for the student
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE))
-    finally:
-        if comments:
-            return Analysis.require(comments).dump(output_file)
-
     # AST - if an AST can't be made, fail and bail
     try:
-        tree = ast.parse(user_solution)
+        with span("parse"):
+            tree = parse(user_solution)
     except Exception:
-        # If ast.parse fails, assume malformed code and fail with an ESSENTIAL (required) type comment for the student
+        # If the parse fails, assume malformed code and fail with an ESSENTIAL (required) type comment for the student
         comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE))
     finally:
         if comments:
-            return Analysis.require(comments).dump(output_file)
+            return Analysis.require(comments)
 
     # Generate PyLint comments for additional feedback.
-    comments.extend(generate_pylint_comments(in_path))
+    comments.extend(generate_pylint_comments(in_path, source=user_solution))
+
+    # If there are no comments, add the general recommendations as comments.
+    # Most exercises have this disabled for now, until we can find a better way to present these.
+    if general_recommendations and not comments:
+        comments.append(Comment(type=CommentTypes.INFORMATIVE, params={}, comment=Comments.GENERAL_RECS))
 
-     # If there are no comments, add the general recommendations as comments.
-     # We're disabling this for now, until we can find a better way to present these.
-    # if not comments:
-    #     comments.append(Comment(type=CommentTypes.INFORMATIVE, params={}, comment=Comments.GENERAL_RECS))
+    return Analysis.summarize_comments(comments)
+
+
+def analyze(in_path: Path, out_path: Path, general_recommendations: bool = False):
+    """
+    Analyze the user's solution to give feedback. Outputs a JSON that
+
+    conforms to https://github.com/exercism/docs/blob/main/building/tooling/analyzers/interface.md#output-format
+    """
+
+    output_file = out_path.parent.joinpath("analysis.json")
+
+    # input file - if it can't be found, fail and bail
+    try:
+        user_solution = read_solution(in_path)
+    except OSError:
+        # fail out fast with an ESSENTIAL (required) type comment for the student
+        comments = [Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE)]
+        return Analysis.require(comments).dump(output_file)
 
-    return Analysis.summarize_comments(comments, output_file)
+    return analyze_source(user_solution, in_path, general_recommendations).dump(output_file)
@@ -0,0 +1,121 @@
+"""
+Helpers for describing and running analysis jobs outside of the one-shot CLI.
+"""
+
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import List, NamedTuple
+
+from .deadline import PYLINT_SHARE, budget_seconds
+from .exercise import Exercise, ExerciseError, read_solution
+from .lint_cache import get_lint_cache, lint_key
+from .lint_profiles import profile_for
+from .linter import get_linter
+from .pylint_comments import PYLINTRC, generate_pylint_comments
+
+
+class Job(NamedTuple):
+    """
+    A single request to analyze one solution: `(slug, input dir, output dir)`.
+    """
+
+    exercise: str
+    input: Path
+    output: Path
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        """
+        Build a Job from its JSON representation.
+        """
+        try:
+            return cls(str(data["exercise"]), Path(data["input"]), Path(data["output"]))
+        except (KeyError, TypeError) as err:
+            raise ExerciseError(f"Malformed job {data!r}: missing {err}") from err
+
+    def to_dict(self) -> dict:
+        """
+        The JSON representation of this Job.
+        """
+        return {"exercise": self.exercise, "input": str(self.input), "output": str(self.output)}
+
+
+def run_job(job: Job) -> dict:
+    """
+    Analyze the solution described by `job`, writing its analysis.json.
+
+    Never raises: failures are reported in the returned status record.
+    """
+
+    start = time.perf_counter()
+    result = job.to_dict()
+
+    try:
+        for directory in (job.input, job.output):
+            if not directory.is_dir():
+                raise ExerciseError(f"{directory} must be a directory")
+
+        Exercise.factory(job.exercise, job.input, job.output).analyze()
+    except Exception as err:
+        result.update(status="error", error=f"{type(err).__name__}: {err}")
+    else:
+        result.update(status="ok")
+
+    result["wall_time"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def run_group(jobs: List[Job], runner=run_job) -> List[dict]:
+    """
+    Run several jobs with `runner`, linting all their solutions in one pylint pass first.
+
+    Each job's results are the same as running it alone. Under an analysis
+    budget each solution gets the pylint share of its own budget in the pass.
+    Solutions are linted with their exercise's lint profile, one pass per profile.
+
+    The pass lints in this process, so it is only made for jobs run here by
+    run_job: a runner that isolates each job, like a Zygote's, must not have
+    the untrusted solutions parsed in the process it forks from.
+    """
+
+    if runner is not run_job:
+        return [runner(job) for job in jobs]
+
+    modules = defaultdict(list)
+    cache = get_lint_cache()
+    for job in jobs:
+        try:
+            in_path = Exercise.factory(job.exercise, job.input, job.output).in_path
+            source = read_solution(in_path)
+        except Exception:
+            continue  # run_job reports the problem for this job
+        profile = profile_for(job.exercise)
+        if lint_key(in_path, source, PYLINTRC, profile) not in cache:
+            modules[profile.name].append((str(in_path), source))
+
+    linters = {name: get_linter(profile=name) for name in modules}
+    try:
+        seconds = budget_seconds()
+        for name, linter in linters.items():
+            try:
+                linter.prelint(modules[name], seconds * PYLINT_SHARE if seconds else None)
+            except Exception:
+                pass  # these jobs are linted on their own instead
+        return [runner(job) for job in jobs]
+    finally:
+        for linter in linters.values():
+            linter.prelinted.clear()
+
+
+def warm_up():
+    """
+    Pay the one-time costs of an analysis up front.
+
+    Imports pylint and astroid, loads every analyzer module and lints a
+    throwaway module so the rcfile plugins are imported.
+    """
+    for slug in Exercise.available_analyzers():
+        Exercise(slug, None, None, None).analyzer
+
+    generate_pylint_comments(Path("warm_up.py"), source='"""Warm up."""\n')
@@ -0,0 +1,229 @@
+"""Content-addressed cache of pylint results.
+
+Many submissions are byte-identical (untouched stubs, popular community
+solutions, re-submitted iterations), so pylint's findings are cached by a
+hash of everything that decides them: the source, the module's file name
+and sibling modules, the rcfile contents, the exercise's lint profile and
+the Python, pylint and astroid versions.
+
+There are two tiers: an LRU dict in memory, and optionally a size-capped
+directory of JSON files (e.g. a writable volume next to a read-only image)
+shared by every process pointed at it. The tiers are configured with the
+ANALYZER_LINT_CACHE_* environment variables, so worker and forked processes
+inherit them.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from typing import List, NamedTuple
+
+
+class LintMessage(NamedTuple):
+    """The parts of a pylint Message the analyzer uses."""
+
+    msg_id: str
+    symbol: str
+    msg: str
+    line: int
+    category: str
+
+    @classmethod
+    def from_message(cls, message):
+        return cls(message.msg_id, message.symbol, message.msg, message.line, message.category)
+
+
+def _read_bytes(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _rcfile_bytes(pylint_spec):
+    return _read_bytes(pylint_spec)
+
+
+@functools.lru_cache(maxsize=None)
+def _linter_versions():
+    # From the package metadata, so that a cache hit doesn't import pylint.
+    from importlib.metadata import version
+
+    return sys.version, version('pylint'), version('astroid')
+
+
+def lint_key(in_path, source, pylint_spec, profile=None):
+    """The cache key for linting `source` as the module at `in_path` with the rcfile `pylint_spec`.
+
+        With a lint `profile` (see common.lint_profiles) its overlay is part of the key too.
+    """
+
+    digest = hashlib.sha256()
+
+    def add(*parts):
+        for part in parts:
+            part = part if isinstance(part, bytes) else str(part).encode('utf-8')
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+
+    add(*_linter_versions(), _rcfile_bytes(pylint_spec))
+    if profile is not None and profile.overlay:
+        add(profile.name, json.dumps(profile.overlay, sort_keys=True))
+    add(os.path.basename(in_path), source)
+
+    # Other modules next to the solution can be imported by it and change what pylint infers.
+    directory = os.path.dirname(os.path.abspath(in_path))
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            sibling = os.path.join(directory, name)
+            if name.endswith('.py') and name != os.path.basename(in_path) and os.path.isfile(sibling):
+                add(name, _read_bytes(sibling))
+
+    return digest.hexdigest()
+
+
+class LintCache:
+    """Pylint results by lint_key, in memory and optionally on disk.
+
+        `max_entries` bounds the memory tier (0 turns it off). With a `directory`
+        results are also kept there, evicting the least recently used files once
+        they take up more than `max_bytes`.
+    """
+
+    def __init__(self, max_entries=1024, directory=None, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.disk_bytes = None
+        self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self):
+        """Hit and miss counters of this process."""
+
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'entries': len(self.memory)}
+
+    def __contains__(self, key):
+        return key in self.memory or (self.directory is not None and os.path.isfile(self._path(key)))
+
+    def get(self, key) -> List[LintMessage]:
+        """The cached messages for `key`, or None."""
+
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return list(self.memory[key])
+
+        messages = self._read(key)
+        if messages is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.disk_hits += 1
+        self._remember(key, messages)
+        return list(messages)
+
+    def put(self, key, messages):
+        """Cache the pylint `messages` for `key`."""
+
+        messages = tuple(LintMessage.from_message(message) for message in messages)
+        self._remember(key, messages)
+        self._write(key, messages)
+
+    def _remember(self, key, messages):
+        if not self.max_entries:
+            return
+        self.memory[key] = messages
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f'{key}.json')
+
+    def _read(self, key):
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                messages = tuple(LintMessage(*message) for message in json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        try:
+            os.utime(path)  # most recently used
+        except OSError:
+            pass
+        return messages
+
+    def _write(self, key, messages):
+        if self.directory is None:
+            return
+
+        path = self._path(key)
+        data = json.dumps(messages).encode('utf-8')
+        partial = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle, partial = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(handle, 'wb') as file:
+                file.write(data)
+            os.replace(partial, path)
+        except OSError:
+            # A full or read-only volume only costs us the disk tier.
+            if partial and os.path.exists(partial):
+                os.unlink(partial)
+            return
+
+        if self.disk_bytes is None:
+            self.disk_bytes = self._disk_usage()[0]
+        else:
+            self.disk_bytes += len(data)
+        if self.disk_bytes > self.max_bytes:
+            self.evict()
+
+    def _disk_usage(self):
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except FileNotFoundError:
+                    continue  # evicted by another process
+                files.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+        return sum(size for _, size, _ in files), files
+
+    def evict(self):
+        """Delete the least recently used files until the disk tier is back to 90% of `max_bytes`."""
+
+        total, files = self._disk_usage()
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.disk_bytes = total
+
+
+@functools.lru_cache(maxsize=None)
+def get_lint_cache():
+    """The process-wide LintCache, configured from the environment.
+
+        ANALYZER_LINT_CACHE_ENTRIES  results kept in memory (default 1024, 0 to turn off)
+        ANALYZER_LINT_CACHE_DIR      directory for the disk tier (off if unset)
+        ANALYZER_LINT_CACHE_MB       size cap of the disk tier (default 256)
+    """
+
+    return LintCache(max_entries=int(os.environ.get('ANALYZER_LINT_CACHE_ENTRIES', 1024)),
+                     directory=os.environ.get('ANALYZER_LINT_CACHE_DIR') or None,
+                     max_bytes=int(os.environ.get('ANALYZER_LINT_CACHE_MB', 256)) * 1024 * 1024)
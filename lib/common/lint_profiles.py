@@ -0,0 +1,157 @@
+"""
+Per-exercise pylint configurations, resolved when the image is built.
+
+Every exercise is linted with lib/common/.pylintrc. An exercise's entry in
+analyzers.json may add a "lint" overlay on top of it, of messages to enable
+or disable for that exercise only:
+
+    "two-fer": {"lint": {"disable": ["consider-using-f-string"]}}
+
+bin/build_lint_profiles.py resolves the rcfile and every overlay ahead of
+time into lint_profiles.json: the checkers that have a message enabled, the
+option values pylint ends up with and the state of every message. The
+Linter of a profile is set up from that without parsing the rcfile, and
+checkers without an enabled message are never instantiated (see
+common.linter.load_profile). Without lint_profiles.json the profiles are
+resolved from the sources by each Linter instead.
+
+An analysis lints with the profile of its exercise:
+
+    with selected(slug):
+        generate_pylint_comments(in_path)  # lints with current_profile()
+"""
+
+import functools
+import json
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+LIBRARY = Path(__file__).resolve(strict=True).parent.parent
+
+ANALYZERS_CONFIG = LIBRARY.joinpath("common", "analyzers.json")
+PROFILES = LIBRARY.joinpath("common", "lint_profiles.json")
+
+# The profile of every exercise without an overlay: the rcfile as it is.
+BASE = "base"
+
+
+class LintProfile(NamedTuple):
+    """
+    A named overlay on the rcfile, and what it resolves to once compiled (None until then).
+    """
+
+    name: str
+    overlay: dict
+    compiled: Optional[dict] = None
+
+
+def compile_overlays(config_path: Path = ANALYZERS_CONFIG) -> Dict[str, dict]:
+    """
+    The overlay of every profile: none for BASE, and the "lint" entry of each exercise in analyzers.json that has one.
+    """
+
+    with open(config_path, 'r', encoding='utf-8') as file:
+        config = json.load(file)
+
+    overlays = {BASE: {}}
+    for slug, entry in sorted(config.items()):
+        lint = entry.get("lint")
+        if lint:
+            overlays[slug] = {key: list(lint.get(key, [])) for key in ("enable", "disable")}
+    return overlays
+
+
+def build_profiles(profiles_path: Path = PROFILES, config_path: Path = ANALYZERS_CONFIG) -> int:
+    """
+    Resolve every profile and write them to `profiles_path`, returning the number of profiles.
+    """
+
+    # Resolving a profile takes a fully configured PyLinter.
+    from common.linter import compile_profile
+
+    profiles = {name: {"overlay": overlay, **compile_profile(overlay)}
+                for name, overlay in compile_overlays(config_path).items()}
+    with open(profiles_path, 'w', encoding='utf-8') as file:
+        json.dump(profiles, file, indent=1, sort_keys=True)
+    return len(profiles)
+
+
+def load_profiles(profiles_path: Path = PROFILES) -> Dict[str, LintProfile]:
+    """
+    Read every profile by name, compiled if lint_profiles.json has been built.
+    """
+
+    try:
+        with open(profiles_path, 'r', encoding='utf-8') as file:
+            profiles = json.load(file)
+    except FileNotFoundError:
+        return {name: LintProfile(name, overlay) for name, overlay in compile_overlays().items()}
+
+    return {name: LintProfile(name, entry["overlay"], entry) for name, entry in profiles.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_lint_profiles() -> Dict[str, LintProfile]:
+    """
+    The profiles, loaded on first use.
+    """
+    return load_profiles()
+
+
+def profile_for(slug: str) -> LintProfile:
+    """
+    The profile an exercise is linted with.
+    """
+    profiles = get_lint_profiles()
+    return profiles.get(slug, profiles[BASE])
+
+
+# The slugs of the analyses running, innermost last.
+_selected = []
+
+
+@contextmanager
+def selected(slug: str):
+    """
+    Lint with the profile of the exercise `slug` in this block.
+    """
+    _selected.append(slug)
+    try:
+        yield
+    finally:
+        _selected.pop()
+
+
+def current_profile() -> LintProfile:
+    """
+    The profile of the innermost running analysis, or BASE outside of one.
+    """
+    return profile_for(_selected[-1] if _selected else BASE)
+
+
+def encode_option(value):
+    """
+    An option value of pylint's as JSON: patterns and tuples become tagged objects.
+    """
+    if isinstance(value, re.Pattern):
+        return {"pattern": value.pattern, "flags": value.flags}
+    if isinstance(value, tuple):
+        return {"tuple": [encode_option(item) for item in value]}
+    if isinstance(value, list):
+        return [encode_option(item) for item in value]
+    return value
+
+
+def decode_option(value):
+    """
+    The option value `encode_option` turned into `value`.
+    """
+    if isinstance(value, dict):
+        if "pattern" in value:
+            return re.compile(value["pattern"], value["flags"])
+        return tuple(decode_option(item) for item in value["tuple"])
+    if isinstance(value, list):
+        return [decode_option(item) for item in value]
+    return value
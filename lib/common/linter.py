@@ -0,0 +1,478 @@
+"""The configured PyLinter the analyzer reuses for every module it lints.
+
+Importing this module imports pylint and astroid, so common.pylint_comments
+only does so once a solution actually has to be linted.
+
+The Linter drives pylint and astroid through their internals (the module
+checker, the per-file check, message states, astroid's builder), which
+change between releases: requirements.txt pins both to the versions it is
+written against, and test_lint_profiles checks the installed ones match.
+"""
+
+import ast
+import contextlib
+import copy
+import functools
+import importlib
+import os
+import sys
+import sysconfig
+import time
+from pathlib import Path
+
+import astroid
+from astroid import MANAGER
+from astroid._ast import get_parser_module
+from astroid.builder import AstroidBuilder
+from astroid.context import _invalidate_cache
+from astroid.inference_tip import clear_inference_tip_cache
+from astroid.interpreter.objectmodel import ObjectModel
+from astroid.nodes import ClassDef
+from astroid.nodes._base_nodes import LookupMixIn
+from astroid.rebuilder import TreeRebuilder
+from pylint.checkers import BaseChecker
+from pylint.checkers.clear_lru_cache import clear_lru_caches
+from pylint.config.config_initialization import _config_initialization
+from pylint.lint import PyLinter
+from pylint.lint.expand_modules import discover_package_path
+from pylint.lint.utils import augmented_sys_path
+from pylint.reporters import CollectingReporter
+from pylint.typing import FileItem
+
+from common.checker_gates import CheckerGates, features
+from common.deadline import DeadlineExceeded, alarm
+from common.lint_profiles import BASE, decode_option, encode_option, get_lint_profiles
+from common.parsing import parse_source
+from common.pylint_comments import PYLINTRC
+from common.rules import hosted_run, hosting
+
+
+class SharedTreeRebuilder(TreeRebuilder):
+    """A TreeRebuilder that leaves the `ast` tree it builds from as it found it.
+
+        astroid takes the docstrings out of the bodies of the tree; these
+        trees are shared with the analyzer, so it does so on a copy.
+        Given a `sources` dict, it also records which `ast` node each
+        astroid node was built from.
+    """
+
+    def __init__(self, manager, parser_module, data, sources=None):
+        super().__init__(manager, parser_module, data)
+        self.sources = sources
+
+    def visit(self, node, parent):
+        built = super().visit(node, parent)
+        if self.sources is not None and built is not None:
+            self.sources[built] = node
+        return built
+
+    def visit_module(self, node, modname, modpath, package):
+        module = super().visit_module(node, modname, modpath, package)
+        if self.sources is not None:
+            self.sources[module] = node
+        return module
+
+    def _get_doc(self, node):
+        return super()._get_doc(copy.copy(node))
+
+
+class RuleChecker(BaseChecker):
+    """Runs an exercise's rules (common.rules) on the nodes pylint walks, so both share one traversal.
+
+        pylint walks astroid nodes and the rules expect `ast` ones: every
+        astroid node is handed over as the `ast` node it was built from,
+        together with the `ast` nodes under it that pylint won't walk as its
+        children: those astroid has no node of its own for (operators,
+        expression contexts) and those it keeps aside (docstrings, a class's
+        metaclass keyword). Once pylint has left the module, the rules have
+        seen all of it. It emits no pylint messages; the rules record their
+        Comments in their findings as usual.
+    """
+
+    name = 'exercise-rules'
+    msgs = {}
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self.run = None
+        self.sources = {}
+
+    def start(self, run, sources):
+        """Hand the nodes of the module built from `sources` to the RuleRun `run`."""
+
+        self.run = run
+        self.sources = sources
+
+    def stop(self):
+        self.run = None
+        self.sources = {}
+
+    def visit_default(self, node):
+        source = self.sources.get(node)
+        if source is None:
+            return
+
+        # Everything under `source` but what pylint walks next, as the children of `node`.
+        walked = {self.sources.get(child) for child in node.get_children()}
+        pending = [source]
+        while pending:
+            current = pending.pop()
+            if self.run.visit(current):
+                pending.extend(reversed([child for child in ast.iter_child_nodes(current) if child not in walked]))
+
+    def leave_module(self, node):
+        if self.run is not None and node in self.sources:
+            self.run.complete = True
+
+
+class PartialLint(list):
+    """The Messages of a module whose lint ran out of time, as far as it got."""
+
+
+STDLIB = sysconfig.get_paths()['stdlib'] + os.sep
+SITE_PACKAGES = sysconfig.get_paths()['purelib'] + os.sep
+
+
+class Linter:
+    """A configured PyLinter, built once and reused for every module it lints.
+
+        Reading the rcfile (or loading a compiled lint profile), registering
+        the checkers and loading the plugins happens here, once. Between
+        modules only per-run state is reset.
+    """
+
+    def __init__(self, pylint_spec=PYLINTRC, lint_profile=None):
+        self.reporter = CollectingReporter()
+        if lint_profile is not None and lint_profile.compiled is not None:
+            self.linter = load_profile(lint_profile.compiled, self.reporter)
+        else:
+            self.linter = configure(pylint_spec, self.reporter, lint_profile.overlay if lint_profile else None)
+
+        # Modules astroid needs before any student code is seen (ie builtins).
+        astroid.builder.AstroidBuilder(MANAGER)
+        self.baseline_modules = set(MANAGER.astroid_cache)
+
+        # Messages from prelint(), by (in_path, source), until lint() asks for them.
+        self.prelinted = {}
+
+        # A common.checker_profile.CheckerProfile timing every pass, if set.
+        self.profile = None
+
+        # When the module being linted has to be done by (time.perf_counter()), if ever.
+        self.deadline = None
+
+        # Walks the rules of an analysis hosted over the module being linted (see common.rules).
+        self.rule_checker = RuleChecker(self.linter)
+
+        # Whether modules are linted without the checkers they can't need (see common.checker_gates),
+        # and the CheckerGates of the pass running.
+        self.gating = True
+        self.gates = None
+
+    @staticmethod
+    def module_name(path):
+        """The module name pylint gives the file at `path`."""
+
+        try:
+            return '.'.join(astroid.modutils.modpath_from_file(str(path)))
+        except ImportError:
+            return os.path.splitext(os.path.basename(path))[0]
+
+    def lint(self, in_path, source=None, timeout=None):
+        """Lint one module and return its pylint Messages.
+
+            If `source` is given it is linted from memory, and `in_path` only names the module.
+            With a `timeout` in seconds the lint may be cut short (see lint_many).
+        """
+
+        key = (str(in_path), source)
+        if key in self.prelinted:
+            return self.prelinted.pop(key)
+
+        return self.lint_many([key], timeout)[0]
+
+    def lint_many(self, modules, timeout=None):
+        """Lint several `(in_path, source)` modules in one pylint pass.
+
+            Returns one list of Messages per module, in order, each the same
+            as linting that module alone. Checkers that look across modules
+            (duplicate-code, cyclic-import) are closed and reopened between
+            modules, so nothing is compared between students.
+
+            With a `timeout`, a module whose lint takes longer than that many
+            seconds is stopped, and its result is a PartialLint of the messages
+            emitted until then. The pass is abandoned with it and the modules
+            after it are linted in a fresh one.
+        """
+
+        modules = list(modules)
+        results = []
+        while len(results) < len(modules):
+            results.extend(self._lint_pass(modules[len(results):], timeout))
+        return results
+
+    def _lint_pass(self, modules, timeout):
+        results = []
+        self.reporter.reset()
+        self.linter.initialize()
+        project_checkers = [checker for checker in self.linter.prepare_checkers()
+                            if type(checker).close is not BaseChecker.close]
+
+        try:
+            with self.linter._astroid_module_checker() as check_astroid_module:
+                if hosting():
+                    check_astroid_module.keywords['walker'].add_checker(self.rule_checker)
+                if self.gating:
+                    self.gates = CheckerGates(**check_astroid_module.keywords)
+                if self.profile is not None:
+                    self.profile.instrument(**check_astroid_module.keywords)
+                if timeout is not None:
+                    self._check_deadline(check_astroid_module.keywords['walker'])
+
+                for in_path, source in modules:
+                    filepath = str(in_path)
+                    file_item = FileItem(self.module_name(filepath), filepath, filepath)
+                    get_ast = functools.partial(self.get_ast, data=source)
+                    first_message = len(self.reporter.messages)
+                    start = time.perf_counter()
+                    self.deadline = start + timeout if timeout is not None else None
+
+                    self.forget_shadowed(os.path.dirname(os.path.abspath(filepath)))
+                    try:
+                        with alarm(self.deadline) if timeout is not None else contextlib.nullcontext():
+                            with augmented_sys_path([discover_package_path(filepath, self.linter.config.source_roots)]):
+                                self.linter._check_file(get_ast, check_astroid_module, file_item)
+                        for checker in project_checkers:
+                            checker.close()
+                            checker.open()
+                    except DeadlineExceeded:
+                        # The checkers were stopped halfway through: start afresh for the next module.
+                        results.append(PartialLint(self.reporter.messages[first_message:]))
+                        return results
+                    finally:
+                        self.rule_checker.stop()
+                        if self.gates is not None:
+                            self.gates.reset()
+                        self.forget()
+
+                    results.append(self.reporter.messages[first_message:])
+                    if self.profile is not None:
+                        self.profile.count(results[-1], time.perf_counter() - start)
+        finally:
+            self.deadline = None
+            self.gates = None
+            self.reset()
+
+        return results
+
+    def _check_deadline(self, walker):
+        """Stop the pass at the next checker callback once the module's deadline has passed."""
+
+        clock = time.perf_counter
+
+        def checked(callback):
+            def checked_callback(node):
+                if self.deadline is not None and clock() > self.deadline:
+                    raise DeadlineExceeded()
+                return callback(node)
+
+            return checked_callback
+
+        for events in (walker.visit_events, walker.leave_events):
+            for callbacks in events.values():
+                callbacks[:] = [checked(callback) for callback in callbacks]
+
+    def get_ast(self, filepath, modname, data=None):
+        """The astroid module pylint checks, built from the tree the analyzer shares (see common.parsing).
+
+            Anything that doesn't parse or build that way is left to pylint's
+            own get_ast, which reports it as a syntax-error or astroid-error.
+            The checkers the tree has nothing for are left out of its walk.
+        """
+
+        if data is None:
+            return self.linter.get_ast(filepath, modname)
+
+        try:
+            parsed = parse_source(data)
+            run = hosted_run(parsed.tree)
+            sources = {} if run is not None else None
+            module = self.build_module(parsed, data, modname, filepath, sources)
+        except Exception:
+            return self.linter.get_ast(filepath, modname, data)
+
+        if run is not None:
+            self.rule_checker.start(run, sources)
+        if self.gates is not None:
+            self.gates.apply(features(parsed.tree, data))
+        return module
+
+    @staticmethod
+    def build_module(parsed, data, modname, path, sources=None):
+        """astroid's AstroidBuilder.string_build, from an `ast` tree that is already parsed.
+
+            With `sources`, it is filled with the `ast` node of every astroid node built.
+        """
+
+        builder = AstroidBuilder(MANAGER)
+        rebuilder = SharedTreeRebuilder(MANAGER, get_parser_module(type_comments=parsed.type_comments), data, sources)
+
+        package = modname.endswith('.__init__') or os.path.splitext(os.path.basename(path))[0] == '__init__'
+        if modname.endswith('.__init__'):
+            modname = modname[:-len('.__init__')]
+
+        module = rebuilder.visit_module(parsed.tree, modname, os.path.abspath(path), package)
+        module.file_bytes = data.encode('utf-8')
+        return builder._post_build(module, rebuilder, 'utf-8')
+
+    def prelint(self, modules, timeout=None):
+        """Lint `(in_path, source)` modules in one pass, keeping the Messages for `lint` to hand out."""
+
+        for key, messages in zip(modules, self.lint_many(modules, timeout)):
+            self.prelinted[key] = messages
+
+    @staticmethod
+    def is_stdlib(module):
+        """Whether `module` comes from the standard library, which student code can't change."""
+
+        if not module.file:
+            return module.name in sys.builtin_module_names
+        return module.file.startswith(STDLIB) and not module.file.startswith(SITE_PACKAGES)
+
+    def forget_shadowed(self, directory):
+        """Drop kept standard library modules that a file in `directory` would shadow."""
+
+        if not os.path.isdir(directory):
+            return
+
+        local_names = {os.path.splitext(name)[0] for name in os.listdir(directory)}
+        for name in set(MANAGER.astroid_cache) - self.baseline_modules:
+            if name.partition('.')[0] in local_names:
+                del MANAGER.astroid_cache[name]
+
+    def forget(self):
+        """Forget everything astroid learned from the last module.
+
+            Unlike astroid's MANAGER.clear_cache() this doesn't rebuild builtins
+            or reload the brain plugins, which costs more than linting a solution.
+            Standard library modules are kept too: only the student's own modules
+            (and anything else outside the stdlib) are parsed afresh next time.
+        """
+
+        for name in set(MANAGER.astroid_cache) - self.baseline_modules:
+            if not self.is_stdlib(MANAGER.astroid_cache[name]):
+                del MANAGER.astroid_cache[name]
+
+        clear_lru_caches()
+        clear_inference_tip_cache()
+        _invalidate_cache()
+        for node_cache in (LookupMixIn.lookup, ObjectModel.attributes, ClassDef._metaclass_lookup_attribute):
+            node_cache.cache_clear()
+
+    def reset(self):
+        """Forget everything learned from the last run, keeping the warm configuration."""
+
+        self.forget()
+        self.linter.stats = type(self.linter.stats)()
+
+
+def configure(pylint_spec, reporter, overlay=None):
+    """A PyLinter with every checker, configured by the rcfile `pylint_spec` and a lint profile's `overlay`."""
+
+    linter = PyLinter()
+    linter.load_default_plugins()
+
+    # A single module gains nothing from pylint's process pool, which also
+    # re-registers plugin checkers in its workers and so repeats their messages.
+    _config_initialization(linter, ["--score=n", "--jobs=1"], reporter=reporter, config_file=pylint_spec)
+
+    for message in (overlay or {}).get("enable", ()):
+        linter.enable(message)
+    for message in (overlay or {}).get("disable", ()):
+        linter.disable(message)
+    return linter
+
+
+def _class_path(checker_class):
+    return [checker_class.__module__, checker_class.__qualname__]
+
+
+def _checker_class(path):
+    module, qualname = path
+    return functools.reduce(getattr, qualname.split('.'), importlib.import_module(module))
+
+
+def _lean_linter(checkers, unused):
+    """A PyLinter with the checker classes `checkers`, in order, instantiating only those not in `unused`."""
+
+    linter = PyLinter()
+    for checker_class in checkers:
+        if checker_class not in unused:
+            linter.register_checker(checker_class(linter))
+            continue
+
+        # Pragmas may still name an unused checker or its messages: they stay known by name,
+        # as a bare instance that is never initialized and, without a message enabled, never walked.
+        checker = checker_class.__new__(checker_class)
+        linter._checkers[checker.name].append(checker)
+        for report_id, title, callback in checker.reports:
+            linter.register_report(report_id, title, callback, checker)
+        linter.msgs_store.register_messages_from_checker(checker)
+    return linter
+
+
+def compile_profile(overlay, pylint_spec=PYLINTRC):
+    """The lint profile (see common.lint_profiles) of the rcfile `pylint_spec` with `overlay` on top, as JSON.
+
+        Lists the checker classes in the order they are registered, those
+        without a message enabled, the option values that differ from a
+        PyLinter where only the others are instantiated, and the state of
+        every message.
+    """
+
+    linter = configure(pylint_spec, CollectingReporter(), overlay)
+    needed = {id(checker) for checker in linter.prepare_checkers()}
+    registered = [checker for checkers in linter._checkers.values() for checker in checkers if checker is not linter]
+    checkers = [type(checker) for checker in registered]
+    unused = {type(checker) for checker in registered if id(checker) not in needed}
+
+    lean = vars(_lean_linter(checkers, unused).config)
+    options = {name: encode_option(value) for name, value in vars(linter.config).items()
+               if name not in lean or lean[name] != value}
+
+    return {"checkers": [_class_path(checker_class) for checker_class in checkers],
+            "unused": sorted(_class_path(checker_class) for checker_class in unused),
+            "options": options,
+            "messages": dict(linter._msgs_state)}
+
+
+def load_profile(profile, reporter):
+    """A PyLinter set up from a compiled lint profile, as compile_profile describes it, with no rcfile to parse."""
+
+    linter = _lean_linter([_checker_class(path) for path in profile["checkers"]],
+                          {_checker_class(path) for path in profile["unused"]})
+    for name, value in profile["options"].items():
+        setattr(linter.config, name, decode_option(value))
+    linter._msgs_state = dict(profile["messages"])
+
+    linter.set_reporter(reporter)
+    linter._directory_namespaces[Path().resolve()] = (linter.config, {})
+    return linter
+
+
+def get_linter(pylint_spec=PYLINTRC, profile=None):
+    """The shared Linter for an rcfile, built on first use.
+
+        The bundled rcfile is linted with one of its lint profiles (see
+        common.lint_profiles), by name: BASE unless `profile` says otherwise.
+    """
+
+    # One Linter per rcfile however it is named, so that get_linter() and
+    # get_linter(PYLINTRC) share one, and so its prelinted modules.
+    pylint_spec = os.path.abspath(pylint_spec)
+    return _linter_for(pylint_spec, (profile or BASE) if pylint_spec == PYLINTRC else None)
+
+
+@functools.lru_cache(maxsize=None)
+def _linter_for(pylint_spec, profile):
+    return Linter(pylint_spec, get_lint_profiles()[profile] if profile is not None else None)
@@ -0,0 +1,104 @@
+"""Extended feedback for pylint messages, compiled into one SQLite bundle.
+
+The bad/good examples and notes under pylint_data/messages/<symbol>/ are
+hundreds of small files. `build_bundle` packs them into one read-only SQLite
+file at image build time, so an analysis opens a single file (once per
+process) instead of four per pylint message.
+"""
+
+import functools
+import os
+import sqlite3
+from pathlib import Path
+
+
+PYLINT_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pylint_data')
+MESSAGES_PATH = os.path.join(PYLINT_DATA, 'messages')
+BUNDLE_PATH = os.path.join(PYLINT_DATA, 'messages.sqlite')
+
+# The files kept for each message, in the order details are returned.
+DETAIL_FILES = ('bad.py', 'good.py', 'related.md', 'details.md')
+
+
+def find_pylint_rule_details(path):
+    """Find Pylint extended feedback by rule."""
+
+    file_path = Path(path)
+
+    try:
+        with open(file_path, 'r') as file:
+            content = file.read()
+    except FileNotFoundError:
+        return None
+
+    return content
+
+
+def build_bundle(messages_path=MESSAGES_PATH, bundle_path=BUNDLE_PATH):
+    """Compile the details of every message under `messages_path` into the bundle at `bundle_path`.
+
+        Returns the number of messages written.
+    """
+
+    bundle = Path(bundle_path)
+    partial = bundle.with_name(bundle.name + '.tmp')
+    if partial.exists():
+        partial.unlink()
+
+    symbols = sorted(entry.name for entry in os.scandir(messages_path) if entry.is_dir())
+
+    connection = sqlite3.connect(partial)
+    try:
+        with connection:
+            connection.execute('CREATE TABLE details (symbol TEXT PRIMARY KEY, bad TEXT, good TEXT, '
+                               'related TEXT, details TEXT) WITHOUT ROWID')
+            connection.executemany('INSERT INTO details VALUES (?, ?, ?, ?, ?)',
+                                   ((symbol, *(find_pylint_rule_details(os.path.join(messages_path, symbol, name))
+                                               for name in DETAIL_FILES))
+                                    for symbol in symbols))
+    finally:
+        connection.close()
+
+    os.replace(partial, bundle)
+    return len(symbols)
+
+
+class MessageDetails:
+    """Looks up the extended feedback for a pylint symbol.
+
+        Reads the compiled bundle when there is one, or the loose files otherwise
+        (e.g. in a checkout where the bundle hasn't been built).
+    """
+
+    def __init__(self, bundle_path=BUNDLE_PATH, messages_path=MESSAGES_PATH):
+        self.bundle_path = bundle_path
+        self.messages_path = messages_path
+        self.connection = None
+        self.pid = None
+
+    def _connect(self):
+        # SQLite connections must not be shared with forked children.
+        if self.connection is None or self.pid != os.getpid():
+            uri = f'{Path(self.bundle_path).resolve().as_uri()}?mode=ro&immutable=1'
+            self.connection = sqlite3.connect(uri, uri=True)
+            self.pid = os.getpid()
+        return self.connection
+
+    @functools.lru_cache(maxsize=None)
+    def lookup(self, symbol):
+        """The (bad, good, related, details) texts for `symbol`, each None if missing."""
+
+        if not os.path.isfile(self.bundle_path):
+            return tuple(find_pylint_rule_details(os.path.join(self.messages_path, symbol, name))
+                         for name in DETAIL_FILES)
+
+        row = self._connect().execute('SELECT bad, good, related, details FROM details WHERE symbol = ?',
+                                      (symbol,)).fetchone()
+        return tuple(row) if row else (None,) * len(DETAIL_FILES)
+
+
+@functools.lru_cache(maxsize=None)
+def get_message_details(bundle_path=BUNDLE_PATH, messages_path=MESSAGES_PATH):
+    """The shared MessageDetails for a bundle, opened on first lookup."""
+
+    return MessageDetails(bundle_path, messages_path)
@@ -0,0 +1,75 @@
+"""
+One parse of a solution, shared by the exercise analyzer and pylint.
+
+The analyzers' rules work on the `ast` tree of a solution, and astroid
+builds its own tree for pylint from the same `ast` parse. `parse_source()`
+parses the way astroid does and keeps the last few trees by source text, so
+whichever comes first (the analyzer, or a batch's lint pass) parses the
+solution and the other reuses the tree. `parse()`, for the analyzers, falls
+back to a plain `ast.parse` of what astroid would reject.
+
+The trees are shared: treat them as read-only.
+"""
+
+import ast
+import re
+from collections import OrderedDict
+from typing import NamedTuple
+
+# Solutions kept, enough for a batch group (common.batch.GROUP_SIZE) with room to spare.
+MAX_ENTRIES = 32
+
+# How astroid tells a misplaced type comment from any other syntax error.
+TYPE_COMMENT = re.compile(r"#\s+type:")
+
+
+class Parsed(NamedTuple):
+    """
+    The tree of a source text, and whether it was parsed with type comments.
+    """
+
+    tree: ast.Module
+    type_comments: bool
+
+
+_parsed = OrderedDict()
+
+
+def parse_source(source: str) -> Parsed:
+    """
+    Parse `source` as astroid would, reusing the tree of an identical recent source.
+
+    Raises SyntaxError (or ValueError, for null bytes) like `ast.parse`.
+    """
+    parsed = _parsed.get(source)
+    if parsed is not None:
+        _parsed.move_to_end(source)
+        return parsed
+
+    try:
+        parsed = Parsed(ast.parse(source + "\n", type_comments=True), True)
+    except SyntaxError as err:
+        # Like astroid, give misplaced type comments a second chance as plain comments.
+        if not TYPE_COMMENT.search(err.text or ""):
+            raise
+        parsed = Parsed(ast.parse(source + "\n"), False)
+
+    _parsed[source] = parsed
+    while len(_parsed) > MAX_ENTRIES:
+        _parsed.popitem(last=False)
+    return parsed
+
+
+def parse(source: str) -> ast.Module:
+    """
+    The `ast` tree of `source`, shared with pylint when astroid can parse it too.
+
+    Raises SyntaxError (or ValueError, for null bytes) like `ast.parse`, only
+    for source that isn't valid Python: what astroid alone rejects (a type
+    comment out of place, ie `if x:  #type: bool`) is parsed without type
+    comments, and pylint reports it as it would.
+    """
+    try:
+        return parse_source(source).tree
+    except SyntaxError:
+        return ast.parse(source)
@@ -0,0 +1,157 @@
+"""
+Multi-process executor for batch analysis.
+
+Long-lived pylint processes grow: astroid caches, the analyzer modules added
+to `sys.modules` and pylint's per-run state all accumulate. Workers here are
+recycled after a number of tasks or once their resident memory passes a
+ceiling, and a worker that crashes is replaced without losing the rest of
+the batch.
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Iterable, Iterator
+
+from .batch import GROUP_SIZE, group_jobs
+from .jobs import run_group, run_job, warm_up
+
+
+def current_rss() -> int:
+    """
+    Resident set size of this process in bytes (peak RSS where /proc is unavailable).
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _worker(conn, max_tasks: int, max_rss: int, warm: bool):
+    """
+    Run groups of jobs received on `conn` until told to stop or it is time to retire.
+    """
+    if warm:
+        warm_up()
+
+    tasks = 0
+    while True:
+        group = conn.recv()
+        if group is None:
+            break
+
+        results = run_group(group, run_job)
+        tasks += len(group)
+        retire = (max_tasks and tasks >= max_tasks) or (max_rss and current_rss() > max_rss)
+        conn.send((results, bool(retire)))
+        if retire:
+            break
+
+    conn.close()
+
+
+class WorkerPool:
+    """
+    Spreads jobs over `workers` processes, each running one group of jobs at a time.
+
+    A group is up to `group_size` jobs for the same exercise, linted in one pylint pass.
+    When a worker dies running a group, each of its jobs is run again as a group
+    of its own, so that only the job that crashed is reported as failed.
+    """
+
+    def __init__(self, workers: int = None, max_tasks: int = 100, max_rss_mb: int = None,
+                 group_size: int = GROUP_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_tasks = max_tasks
+        self.group_size = group_size
+        self.max_rss = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.context = multiprocessing.get_context()
+
+        # Forked workers inherit a warm parent; spawned workers warm themselves.
+        self.warm_parent = self.context.get_start_method() == "fork"
+        self.started = 0
+
+    def _start_worker(self):
+        parent_conn, child_conn = self.context.Pipe()
+
+        # Not a daemon: pylint's own `jobs` option may need to start child processes.
+        process = self.context.Process(target=_worker,
+                                       args=(child_conn, self.max_tasks, self.max_rss, not self.warm_parent))
+        process.start()
+        child_conn.close()
+        self.started += 1
+        return parent_conn, process
+
+    @staticmethod
+    def _stop_worker(conn, process, graceful: bool = True):
+        if graceful and process.is_alive():
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        else:
+            process.terminate()
+        process.join()
+        conn.close()
+
+    def run(self, jobs: Iterable) -> Iterator[dict]:
+        """
+        Run `jobs`, yielding one status record per job in completion order.
+
+        Entries of `jobs` that are not Jobs (e.g. manifest errors) are passed through.
+        """
+        if self.warm_parent:
+            warm_up()
+
+        pending = group_jobs(jobs, self.group_size)
+        # The jobs of crashed groups, to run one at a time before anything else.
+        retry = deque()
+        busy = {}
+        idle = []
+
+        try:
+            while True:
+                # Hand out work until every worker is busy or the jobs run out.
+                while len(busy) < self.workers:
+                    group = retry.popleft() if retry else next(pending, None)
+                    if group is None:
+                        break
+                    if not isinstance(group, list):
+                        yield group
+                        continue
+                    conn, process = idle.pop() if idle else self._start_worker()
+                    conn.send(group)
+                    busy[conn] = (process, group)
+
+                if not busy:
+                    break
+
+                for conn in wait(list(busy)):
+                    process, group = busy.pop(conn)
+                    try:
+                        results, retire = conn.recv()
+                    except (EOFError, OSError):
+                        process.join()
+                        results, retire = [], True
+                        if len(group) > 1:
+                            retry.extend([job] for job in group)
+                        else:
+                            results = [dict(group[0].to_dict(), status="error",
+                                            error=f"worker crashed with exit code {process.exitcode}")]
+
+                    yield from results
+
+                    if retire:
+                        self._stop_worker(conn, process)
+                    else:
+                        idle.append((conn, process))
+        finally:
+            for conn, process in idle:
+                self._stop_worker(conn, process)
+            for conn, (process, _) in busy.items():
+                self._stop_worker(conn, process, graceful=False)
@@ -1,84 +1,108 @@
 """Functions for providing PyLint feedback.."""
 
+import os
 from common.comment import Comment, CommentTypes
-from io import StringIO
-from pylint.lint import Run
-from pylint import run_pylint
-from pathlib import Path
-from pylint.reporters.text import TextReporter
+from common.deadline import PYLINT_SHARE, current_budget
+from common.lint_cache import get_lint_cache, lint_key
+from common.lint_profiles import current_profile
+from common.message_details import get_message_details
+from common.timing import span
 
 
-def find_pylint_rule_details(path):
-    """Find Pylint extended feedback by rule."""
+PYLINTRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.pylintrc')
 
-    file_path = Path(path)
 
-    try:
-        with open(file_path, 'r') as file:
-            content = file.read()
-    except FileNotFoundError:
+STATUS_MAPPING = {
+    'informational': CommentTypes.INFORMATIVE,
+    'refactor' :  CommentTypes.ACTIONABLE,
+    'convention' : CommentTypes.ACTIONABLE,
+    'warning' : CommentTypes.ESSENTIAL,
+    'error' : CommentTypes.ESSENTIAL,
+    'fatal' : CommentTypes.ESSENTIAL
+}
+
+# Messages never shown to students.
+SKIPPED_SYMBOLS = {'line-too-long'}
+
+# Messages shown as informational, whatever their pylint category.
+INFORMATIONAL_SYMBOLS = {'missing-module-docstring',
+                         'missing-function-docstring',
+                         'missing-final-newline'}
+
+
+def pylint_comment(message):
+    """Turn a pylint Message into a Comment, or None if it is not shown to students."""
+
+    rule_name = message.symbol
+    if rule_name in SKIPPED_SYMBOLS:
         return None
 
-    return content
+    bad, good, related, details = get_message_details().lookup(rule_name)
+
+    if rule_name in INFORMATIONAL_SYMBOLS:
+        status_type = STATUS_MAPPING['informational']
+    else:
+        status_type = STATUS_MAPPING[message.category]
+
+    return Comment(type=status_type,
+                   params={'lineno': str(message.line),
+                           'code': f'{message.msg_id} {message.symbol}',
+                           'message': message.msg,
+                           'bad_code': f'Instead of: \n```python\n{bad}```\n\n' if bad else None,
+                           'good_code': f'Try: \n```python\n{good}```\n\n' if good else None,
+                           'related_info': related,
+                           'details': details},
+                   comment=f'python.pylint.{message.category}')
+
+
+def lint_messages(in_path, pylint_spec=PYLINTRC, source=None):
+    """The pylint messages for a module, from the lint cache when the same module was linted before.
+
+        The bundled rcfile lints with the profile of the exercise being analyzed (see common.lint_profiles).
+        Within an analysis budget pylint is stopped once its share is used up: the
+        messages it emitted until then are returned (and not cached), and the
+        budget is marked partial.
+    """
+
+    if source is None:
+        with open(in_path, 'r') as file:
+            source = file.read()
+
+    profile = current_profile() if os.path.abspath(pylint_spec) == PYLINTRC else None
+
+    with span('pylint'):
+        cache = get_lint_cache()
+        key = lint_key(in_path, source, pylint_spec, profile)
+        messages = cache.get(key)
 
+        if messages is None:
+            # pylint and astroid are only imported once something has to be linted.
+            from common.linter import PartialLint, get_linter
+
+            linter = get_linter(pylint_spec, profile.name if profile else None)
+            budget = current_budget()
+            timeout = budget.remaining(PYLINT_SHARE) if budget else None
+            messages = linter.lint(in_path, source, timeout)
+
+            if isinstance(messages, PartialLint):
+                if budget:
+                    budget.partial = True
+            else:
+                cache.put(key, messages)
 
-def generate_pylint_comments(in_path, pylint_spec='/opt/analyzer/lib/common/.pylintrc'):
+    return messages
+
+
+def generate_pylint_comments(in_path, pylint_spec=PYLINTRC, source=None):
     """Use Pylint to generate additional feedback comments for code.
 
         e.g. if code follows PEP8 Style Convention
+
+        If `source` is given it is linted from memory, and `in_path` only names the module.
     """
 
-    status_mapping = {
-        'informational': CommentTypes.INFORMATIVE,
-        'refactor' :  CommentTypes.ACTIONABLE,
-        'convention' : CommentTypes.ACTIONABLE,
-        'warning' : CommentTypes.ESSENTIAL,
-        'error' : CommentTypes.ESSENTIAL,
-        'fatal' : CommentTypes.ESSENTIAL
-    }
-
-    pylint_output = StringIO()
-    reporter = TextReporter(pylint_output)
-    template = '--msg-template="{category}, {line}, {msg_id} {symbol}, {msg}"'
-    rcfile = f'--rcfile={pylint_spec}'
-    cmnd_line_options = [f"{str(in_path)}", rcfile, "--score=n", f"{template}"]
-    messages_path = '/opt/analyzer/lib/common/pylint_data/messages'
-
-    Run(cmnd_line_options, reporter=reporter, exit=False)
-
-    cleaned_pylint_output = (tuple(item.strip('" ').split(', '))
-                             for item in pylint_output.getvalue().splitlines()
-                             if '**' not in item)
-
-    pylint_comments = []
-
-    for line in cleaned_pylint_output:
-        if line[0]:
-            rule_name = line[2][6:]
-            bad = find_pylint_rule_details(path=f"{messages_path}/{rule_name}/bad.py")
-            good = find_pylint_rule_details(path=f"{messages_path}/{rule_name}/good.py")
-            related = find_pylint_rule_details(path=f"{messages_path}/{rule_name}/related.md")
-            details = find_pylint_rule_details(path=f"{messages_path}/{rule_name}/details.md")
-
-            if not line[2] or line[2] == "C0301 line-too-long":
-                continue
-
-            if line[2] in {"C0114 missing-module-docstring",
-                           "C0116 missing-function-docstring",
-                           "C0304 missing-final-newline"}:
-
-                status_type = status_mapping['informational']
-            else:
-                status_type = status_mapping[line[0]]
-
-            pylint_comments.append(Comment(type=status_type,
-                                           params={'lineno': line[1],
-                                                   'code': line[2],
-                                                   'message': ', '.join(line[3:]),
-                                                   'bad_code': f'Instead of: \n```python\n{bad}```\n\n' if bad else None,
-                                                   'good_code': f'Try: \n```python\n{good}```\n\n' if good else None,
-                                                   'related_info': related,
-                                                   'details': details},
-                                           comment=f'python.pylint.{line[0]}'))
-
-    return pylint_comments
+    messages = lint_messages(in_path, pylint_spec, source)
+
+    with span('details'):
+        pylint_comments = (pylint_comment(message) for message in messages)
+        return [comment for comment in pylint_comments if comment]
@@ -0,0 +1,136 @@
+"""
+Registry mapping exercise slugs to shared analyzer implementations.
+
+Most exercises only get pylint feedback and share the generic analyzer;
+a few have an analyzer of their own. Each exercise's entry in
+analyzers.json names its implementation (relative to lib/, the generic
+analyzer by default) and the options passed to it, such as whether the
+general recommendations are given when pylint has nothing to say. (An
+entry's "lint" overlay on the rcfile is common.lint_profiles' concern.)
+Every exercise in exercise-names.txt gets the generic analyzer unless
+analyzers.json says otherwise.
+
+Both files are compiled into one manifest, registry.json, when the image
+is built (see bin/build_registry.py). Nothing is read until the first
+lookup, and without a manifest the sources are read instead.
+
+Implementation modules are loaded once per file, however many slugs use them.
+"""
+
+import functools
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+LIBRARY = Path(__file__).resolve(strict=True).parent.parent
+
+GENERIC_ANALYZER = "common/generic_analyzer/analyzer.py"
+EXERCISE_NAMES = LIBRARY.joinpath("common", "exercise-names.txt")
+ANALYZERS_CONFIG = LIBRARY.joinpath("common", "analyzers.json")
+MANIFEST = LIBRARY.joinpath("common", "registry.json")
+
+
+class AnalyzerConfig(NamedTuple):
+    """
+    Which implementation analyzes an exercise, and with which options.
+
+    `kind` is "generic" for the shared pylint-only analyzer, "custom" otherwise.
+    """
+
+    implementation: Path
+    kind: str
+    options: dict
+
+
+class ExerciseAnalyzer(NamedTuple):
+    """
+    An analyzer implementation bound to the options of one exercise.
+    """
+
+    module: object
+    options: dict
+
+    @property
+    def Comments(self):
+        return self.module.Comments
+
+    def analyze(self, in_path: Path, out_path: Path):
+        return self.module.analyze(in_path, out_path, **self.options)
+
+    def analyze_source(self, user_solution: str, in_path: Path):
+        return self.module.analyze_source(user_solution, in_path, **self.options)
+
+
+def compile_registry(names_path: Path = EXERCISE_NAMES, config_path: Path = ANALYZERS_CONFIG) -> Dict[str, dict]:
+    """
+    Combine exercise-names.txt and analyzers.json into manifest entries, with paths relative to lib/.
+    """
+
+    with open(config_path, 'r', encoding='utf-8') as file:
+        config = json.load(file)
+
+    with open(names_path, 'r') as file:
+        slugs = file.read().splitlines()
+
+    manifest = {}
+    for slug in sorted(set(slugs) | set(config)):
+        entry = config.get(slug, {})
+        analyzer = entry.get("analyzer", GENERIC_ANALYZER)
+        manifest[slug] = {"analyzer": analyzer,
+                          "kind": "generic" if analyzer == GENERIC_ANALYZER else "custom",
+                          "options": entry.get("options", {})}
+    return manifest
+
+
+def build_manifest(manifest_path: Path = MANIFEST, names_path: Path = EXERCISE_NAMES,
+                   config_path: Path = ANALYZERS_CONFIG) -> int:
+    """
+    Write the compiled registry to `manifest_path`, returning the number of exercises.
+    """
+
+    manifest = compile_registry(names_path, config_path)
+    with open(manifest_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    return len(manifest)
+
+
+def load_registry(manifest_path: Path = MANIFEST) -> Dict[str, AnalyzerConfig]:
+    """
+    Read the analyzer config of every known exercise, from the manifest if it has been built.
+    """
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        manifest = compile_registry()
+
+    return {slug: AnalyzerConfig(LIBRARY.joinpath(entry["analyzer"]), entry["kind"], entry["options"])
+            for slug, entry in manifest.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_registry() -> Dict[str, AnalyzerConfig]:
+    """
+    The registry, loaded on first use.
+    """
+    return load_registry()
+
+
+@functools.lru_cache(maxsize=None)
+def load_implementation(path: Path):
+    """
+    Import the analyzer module at `path`, once per process.
+    """
+
+    name = path.parent.name.replace("-", "_")
+    module_name = name if name.endswith("_analyzer") else f"{name}_analyzer"
+
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        analyzer = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(analyzer)
+        sys.modules[module_name] = analyzer
+    return sys.modules[module_name]
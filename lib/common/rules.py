@@ -0,0 +1,253 @@
+"""
+Single-pass rule engine for exercise analyzers.
+
+An analyzer declares rules against AST node types, optionally narrowed by the
+type of a node's fields (ie `ast.BinOp` whose `op` is `ast.Add`), and checks
+that run once the whole tree has been seen:
+
+    RULES = RuleEngine()
+
+    @RULES.on(ast.BinOp, op=ast.Add)
+    def concatenation(node, findings):
+        ...
+
+    @RULES.after
+    def missing_return(findings):
+        ...
+
+    RULES.run(tree, findings)
+
+The node types are resolved into a dispatch table once per concrete node
+class, and the tree is walked once (in `ast.walk` order) for all rules.
+
+The rules can also ride along with pylint's walk of the same tree instead
+(see common.linter.RuleChecker), so that one traversal serves both:
+
+    with RULES.hosted(tree, findings):
+        comments = generate_pylint_comments(in_path, source=source)
+
+Each node is still visited once, but in the order of pylint's walk, so
+hosted rules must not depend on the order they see nodes in: they record
+what they found, and leave putting it in order to the post-traversal
+checks. Whatever pylint didn't visit (a cached lint, a lint cut short by
+the deadline) is visited when the block ends, before those checks.
+"""
+
+import ast
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .timing import span
+
+
+class Rule(NamedTuple):
+    """
+    A check run on every node of `node_types` whose `fields` have the given types.
+    """
+
+    name: str
+    node_types: Tuple[type, ...]
+    fields: Tuple[Tuple[str, type], ...]
+    check: Callable
+
+    def matches(self, node: ast.AST) -> bool:
+        return all(isinstance(getattr(node, field, None), field_type) for field, field_type in self.fields)
+
+
+class RuleStats:
+    """
+    How many nodes a rule inspected and how long it spent on them.
+    """
+
+    __slots__ = ("nodes", "seconds")
+
+    def __init__(self, nodes: int = 0, seconds: float = 0.0):
+        self.nodes = nodes
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(nodes={self.nodes}, seconds={self.seconds:.6f})"
+
+
+def _shared(node: ast.AST) -> bool:
+    """
+    Whether `node` is one of the operator or context instances the parser reuses (ie `ast.Load()`).
+    """
+
+    return not node._fields and not node._attributes
+
+
+# The RuleRuns waiting for pylint to walk their trees, innermost last.
+_hosted = []
+
+
+def hosted_run(tree: ast.AST) -> Optional["RuleRun"]:
+    """
+    The innermost RuleRun hosted over `tree` (the very same object), if any.
+    """
+
+    for run in reversed(_hosted):
+        if run.tree is tree:
+            return run
+    return None
+
+
+def hosting() -> bool:
+    """
+    Whether any RuleRun is waiting for pylint to walk its tree.
+    """
+
+    return bool(_hosted)
+
+
+class RuleEngine:
+    """
+    The rules of one analyzer, run over a tree in a single pass.
+    """
+
+    def __init__(self):
+        self.rules: List[Rule] = []
+        self.finishers: List[Callable] = []
+        self.dispatch: Dict[type, List[Rule]] = {}
+
+        # Totals over every run of this engine, by rule name.
+        self.stats: Dict[str, RuleStats] = {}
+
+    def on(self, *node_types: type, **fields: type):
+        """
+        Decorator registering `check(node, context)` for nodes of `node_types`.
+
+        Keyword arguments narrow the match by the type of a node's field,
+        ie `on(ast.BinOp, op=ast.Add)`.
+        """
+
+        def register(check):
+            self.rules.append(Rule(check.__name__, node_types, tuple(fields.items()), check))
+            self.dispatch.clear()
+            return check
+
+        return register
+
+    def after(self, check):
+        """
+        Decorator registering `check(context)` to run once the whole tree has been visited.
+        """
+        self.finishers.append(check)
+        return check
+
+    def _rules_for(self, node_class: type) -> List[Rule]:
+        rules = self.dispatch.get(node_class)
+        if rules is None:
+            rules = self.dispatch[node_class] = [rule for rule in self.rules
+                                                 if issubclass(node_class, rule.node_types)]
+        return rules
+
+    def run(self, tree: ast.AST, context) -> Dict[str, RuleStats]:
+        """
+        Visit every node of `tree` once, then run the post-traversal checks.
+
+        Rules receive `context` to record their findings in. Returns the
+        nodes inspected and time spent by each rule during this run.
+        """
+
+        return RuleRun(self, tree, context).finish()
+
+    @contextmanager
+    def hosted(self, tree: ast.AST, context) -> Iterator["RuleRun"]:
+        """
+        Run the rules over `tree` as pylint walks it within the block.
+
+        Yields the RuleRun, whose `stats` are complete once the block is done.
+        """
+
+        run = RuleRun(self, tree, context)
+        _hosted.append(run)
+        try:
+            yield run
+        finally:
+            _hosted.remove(run)
+        run.finish()
+
+
+class RuleRun:
+    """
+    One run of an engine's rules over a tree, fed one node at a time.
+    """
+
+    def __init__(self, engine: RuleEngine, tree: ast.AST, context):
+        self.engine = engine
+        self.tree = tree
+        self.context = context
+        self.stats = {rule.name: RuleStats() for rule in engine.rules}
+        self.stats.update((check.__name__, RuleStats()) for check in engine.finishers)
+
+        # ids of the nodes a host has visited, so that finish() only visits the rest.
+        # Operators and expression contexts are shared instances all over the
+        # tree: each occurrence counts as seen along with its parent instead.
+        self.seen = set()
+
+        # Set by a host that has visited every node of the tree, so there is no rest.
+        self.complete = False
+
+    def dispatch(self, node: ast.AST):
+        """
+        Run the rules matching `node` on it.
+        """
+
+        clock = time.perf_counter
+        for rule in self.engine._rules_for(type(node)):
+            stats = self.stats[rule.name]
+            start = clock()
+            if rule.matches(node):
+                rule.check(node, self.context)
+            stats.seconds += clock() - start
+            stats.nodes += 1
+
+    def visit(self, node: ast.AST) -> bool:
+        """
+        Run the rules matching `node` on it, on behalf of a host walking the tree.
+
+        Returns False if `node` had been visited already, and so had the shared
+        nodes right under it.
+        """
+
+        if _shared(node):
+            self.dispatch(node)
+        elif id(node) not in self.seen:
+            self.dispatch(node)
+            self.seen.add(id(node))
+        else:
+            return False
+        return True
+
+    def finish(self) -> Dict[str, RuleStats]:
+        """
+        Visit the nodes no host did, run the post-traversal checks and add this run to the engine's totals.
+        """
+
+        clock = time.perf_counter
+
+        with span("rules"):
+            # ast.walk's order, knowing whether each node's parent was seen.
+            pending = deque([] if self.complete else [(self.tree, False)])
+            while pending:
+                node, parent_seen = pending.popleft()
+                seen = parent_seen if _shared(node) else id(node) in self.seen
+                if not seen:
+                    self.dispatch(node)
+                pending.extend((child, seen) for child in ast.iter_child_nodes(node))
+
+            for check in self.engine.finishers:
+                stats = self.stats[check.__name__]
+                start = clock()
+                check(self.context)
+                stats.seconds += clock() - start
+
+        for name, stats in self.stats.items():
+            total = self.engine.stats.setdefault(name, RuleStats())
+            total.nodes += stats.nodes
+            total.seconds += stats.seconds
+
+        return self.stats
@@ -0,0 +1,119 @@
+"""
+Long-running analyzer daemon.
+
+Pays for importing pylint, astroid and every analyzer once, then serves
+analysis jobs over a Unix socket (one JSON object per line) or over a local
+HTTP endpoint (`POST /analyze`). Each job produces the same analysis.json
+the one-shot CLI would.
+"""
+
+import json
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+from .jobs import Job, run_job, warm_up
+from .lint_cache import get_lint_cache
+
+
+def handle_payload(payload: bytes, runner=run_job) -> dict:
+    """
+    Decode one JSON job request and run it with `runner`.
+    """
+    try:
+        job = Job.from_dict(json.loads(payload))
+    except Exception as err:
+        return {"status": "error", "error": f"{type(err).__name__}: {err}"}
+    return runner(job)
+
+
+class UnixJobHandler(socketserver.StreamRequestHandler):
+    """
+    Reads newline-delimited JSON jobs and answers each with one JSON line.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            result = handle_payload(line, self.server.runner)
+            self.wfile.write(json.dumps(result).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class HTTPJobHandler(BaseHTTPRequestHandler):
+    """
+    Minimal HTTP stand-in for the orchestrator: `POST /analyze` with a JSON job.
+    """
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self.send_error(404)
+        self._reply(200, {"status": "ok", "lint_cache": get_lint_cache().stats()})
+
+    def do_POST(self):
+        if self.path != "/analyze":
+            return self.send_error(404)
+        length = int(self.headers.get("Content-Length", 0))
+        result = handle_payload(self.rfile.read(length), self.server.runner)
+        self._reply(200 if result["status"] == "ok" else 400, result)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, code: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class UnixAnalyzerServer(socketserver.UnixStreamServer):
+    """
+    Serves jobs on a Unix socket, one at a time (pylint keeps global state).
+    """
+
+    def __init__(self, socket_path: Path, runner=run_job):
+        self.runner = runner
+        self.socket_path = Path(socket_path)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), UnixJobHandler)
+
+    def server_close(self):
+        super().server_close()
+        if self.socket_path.exists():
+            os.unlink(self.socket_path)
+
+
+class HTTPAnalyzerServer(HTTPServer):
+    """
+    Serves jobs over HTTP on localhost, one at a time.
+    """
+
+    def __init__(self, port: int, runner=run_job, host: str = "127.0.0.1"):
+        self.runner = runner
+        super().__init__((host, port), HTTPJobHandler)
+
+
+def serve(socket_path: Path = None, port: int = None, runner=None):
+    """
+    Serve jobs until interrupted.
+
+    Without a custom `runner`, jobs run in this process after warming it up.
+    """
+
+    if runner is None:
+        warm_up()
+        runner = run_job
+
+    server = UnixAnalyzerServer(socket_path, runner) if socket_path else HTTPAnalyzerServer(port, runner)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
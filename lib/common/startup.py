@@ -0,0 +1,96 @@
+"""
+Start-up profiling for `bin/run.py --profile-startup`.
+
+The CLI runs itself again under `python -X importtime`, then prints the
+import tree of that run and the time from launching it to the end of its
+first analysis.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Iterable, Iterator, List, NamedTuple
+
+# Set by the profiler to its launch time, for the profiled run to report against.
+T0_VARIABLE = "ANALYZER_STARTUP_T0"
+
+FIRST_ANALYSIS = "first analysis after"
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    """
+    One line of `-X importtime` output, in microseconds.
+    """
+
+    self_us: int
+    cumulative_us: int
+    depth: int
+    name: str
+
+
+def parse_import_times(lines: Iterable[str]) -> List[ImportTime]:
+    """
+    The modules listed in `-X importtime` output, in the order Python reported them.
+    """
+    entries = []
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append(ImportTime(int(self_us), int(cumulative_us), len(indent) // 2, name))
+    return entries
+
+
+def render_tree(entries: List[ImportTime], min_ms: float = 1.0) -> Iterator[str]:
+    """
+    Lines of the import tree, skipping modules that took less than `min_ms` in total.
+    """
+    yield f"{'cumulative':>12} {'self':>10}  module"
+
+    # Python lists a module after everything it imported; reversed, parents come first.
+    for entry in reversed(entries):
+        if entry.cumulative_us >= min_ms * 1000:
+            yield (f"{entry.cumulative_us / 1000:9.1f} ms {entry.self_us / 1000:7.1f} ms  "
+                   f"{'  ' * entry.depth}{entry.name}")
+
+
+def report_first_analysis():
+    """
+    Called by the profiled run once its first analysis is written.
+    """
+    start = os.environ.get(T0_VARIABLE)
+    if start:
+        print(f"{FIRST_ANALYSIS} {(time.time() - float(start)) * 1000:.1f} ms", file=sys.stderr)
+
+
+def profile_startup(argv: List[str], min_ms: float = 1.0) -> int:
+    """
+    Run the CLI `argv` under `-X importtime` and print its start-up profile.
+
+    Returns the exit code of the profiled run.
+    """
+    env = dict(os.environ, **{T0_VARIABLE: repr(time.time())})
+    run = subprocess.run([sys.executable, "-X", "importtime", *argv],
+                         env=env, stderr=subprocess.PIPE, text=True)
+
+    lines = run.stderr.splitlines()
+    entries = parse_import_times(lines)
+    first_analysis = None
+
+    for line in lines:
+        if line.startswith(FIRST_ANALYSIS):
+            first_analysis = line
+        elif not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+
+    for line in render_tree(entries, min_ms):
+        print(line)
+
+    print(f"\n{len(entries)} modules imported in {sum(entry.self_us for entry in entries) / 1000:.1f} ms")
+    print(first_analysis or "no analysis was completed")
+
+    return run.returncode
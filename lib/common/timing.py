@@ -0,0 +1,148 @@
+"""
+Per-phase timing of an analysis.
+
+The analysis code marks its phases with `span`:
+
+    with span("parse"):
+        tree = ast.parse(source)
+
+Spans cost next to nothing unless a `record()` block is active, in which
+case each phase's time is added up in the active Timings:
+
+    with record() as timings:
+        exercise.analyze()
+    timings.phases  # ie {"read": 0.0001, "parse": 0.0004, "pylint": 0.21, ...}
+
+Setting ANALYZER_TIMING (or `bin/run.py --timing`) records every
+`Exercise.analyze()` and emits its spans: with `file` to a timing.json next
+to analysis.json, with `log` as one JSON line on stderr. analysis.json itself
+is the same either way.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple
+
+# The phases of an analysis, in the order they happen. Exercise rules hosted by
+# pylint's walk (see common.rules) count towards "pylint"; the nodes pylint
+# didn't walk and the post-traversal checks, towards "rules" after it.
+PHASES = ("read", "parse", "pylint", "details", "rules", "dump")
+
+# Where recorded analyses emit their timings: "file", "log" or unset for nowhere.
+TIMING_VARIABLE = "ANALYZER_TIMING"
+TIMING_MODES = ("file", "log")
+TIMING_FILE = "timing.json"
+
+
+def peak_rss() -> int:
+    """
+    The high-water mark of this process's resident memory, in KiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Span(NamedTuple):
+    """
+    One phase run: its start from the beginning of the recording, its
+    duration (both in seconds) and the process's peak RSS (KiB) at its end.
+    """
+
+    phase: str
+    start: float
+    seconds: float
+    peak_rss: int
+
+
+class Timings:
+    """
+    Seconds spent in each phase while recording, and the spans they were spent in.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.spans: List[Span] = []
+        self.start = time.perf_counter()
+        self.total = None
+
+    def add(self, phase: str, seconds: float, start: float = None):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        if start is not None:
+            self.spans.append(Span(phase, start - self.start, seconds, peak_rss()))
+
+    def to_dict(self) -> dict:
+        """
+        The JSON representation of these timings, in milliseconds.
+        """
+        return {
+            "total_ms": round(self.total * 1000, 3) if self.total is not None else None,
+            "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in self.phases.items()},
+            "spans": [{"phase": span.phase,
+                       "start_ms": round(span.start * 1000, 3),
+                       "duration_ms": round(span.seconds * 1000, 3),
+                       "peak_rss_kib": span.peak_rss} for span in self.spans],
+            "peak_rss_kib": peak_rss(),
+        }
+
+
+# The Timings being recorded into, innermost last.
+_recording = []
+
+
+@contextmanager
+def record() -> Iterator[Timings]:
+    """
+    Record the spans run inside this block into a new Timings.
+    """
+    timings = Timings()
+    _recording.append(timings)
+    try:
+        yield timings
+    finally:
+        _recording.remove(timings)
+        timings.total = time.perf_counter() - timings.start
+
+
+@contextmanager
+def span(phase: str):
+    """
+    Count the time spent in this block towards `phase` of the recording analysis, if any.
+    """
+    if not _recording:
+        yield
+        return
+
+    timings = _recording[-1]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start, start)
+
+
+def timing_mode():
+    """
+    Where recorded analyses emit their timings, from ANALYZER_TIMING: "file", "log" or None.
+    """
+    mode = os.environ.get(TIMING_VARIABLE, "").strip().lower()
+    return mode if mode in TIMING_MODES else None
+
+
+def emit(timings: Timings, mode: str, out_directory: Path, **context):
+    """
+    Write `timings` to timing.json in `out_directory` ("file"), or as a JSON line on stderr ("log").
+
+    `context` (ie the exercise) is added to the record.
+    """
+    data = {**context, **timings.to_dict()}
+
+    if mode == "file":
+        with open(Path(out_directory).joinpath(TIMING_FILE), "w") as dst:
+            json.dump(data, dst, indent=4)
+    elif mode == "log":
+        print(json.dumps({"event": "analysis_timing", **data}), file=sys.stderr, flush=True)
@@ -2,14 +2,17 @@
 Analyzer for the `two-fer` exercise.
 """
 import ast
-from io import StringIO
-from pylint.lint import Run
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
 from common import Analysis, BaseFeedback, Summary
 from common.comment import Comment, CommentTypes
+from common.exercise import read_solution
+from common.parsing import parse
 from common.pylint_comments import generate_pylint_comments
+from common.timing import span
+from common.rules import RuleEngine
 
 
 
@@ -26,118 +29,172 @@ class Comments(BaseFeedback):
 
 
 
-def analyze(in_path: Path, out_path: Path):
+@dataclass
+class Findings:
     """
-    Analyze the user's Two Fer solution to give feedback. Outputs a JSON that
+    What the rules have found in a Two Fer solution so far.
 
-    conforms to https://github.com/exercism/docs/blob/main/building/tooling/analyzers/interface.md#output-format
+    The rules may see the nodes in any order (see common.rules), so they
+    record where each comment was called for, and the comments are put in
+    source order once the whole tree has been seen.
     """
 
     # List of Comment objects to process
-    comments = []
-
-    output_file = out_path.parent.joinpath("analysis.json")
-
-    # input file - if it can't be found, fail and bail
-    try:
-        user_solution = in_path.read_text()
-    except OSError as err:
-        # fail out fast with an ESSENTIAL (required) type comment for the student
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE))
-    finally:
-        if comments:
-            return Analysis.require(comments).dump(output_file)
-
+    comments: list = field(default_factory=list)
 
-    # AST - if an AST can't be made, fail and bail
-    try:
-        tree = ast.parse(user_solution)
-    except Exception:
-        # If ast.parse fails, assume malformed code and fail with an ESSENTIAL (required) type comment for the student
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE))
-    finally:
-        if comments:
-            return Analysis.require(comments).dump(output_file)
+    # (position, Comment) of every comment the rules call for
+    located: list = field(default_factory=list)
 
     # Does the solution have a method called two_fer?
-    has_method = False
+    has_method: bool = False
 
     # Does the solution correctly use a default argument?
-    uses_def_arg = False
+    uses_def_arg: bool = False
 
     # Does the solution have a return value?
-    has_return = False
+    has_return: bool = False
 
     # Does the solution use str.format?
-    uses_format = False
+    uses_format: bool = False
 
     # Does the solution use f-strings?
-    uses_f_string = False
-
-    for node in ast.walk(tree):
-
-        # Check for method called two_fer
-        if isinstance(node, ast.FunctionDef):
-            has_method = node.name == "two_fer"
-
-        # Check for the use of string concatenation with + operator
-        elif isinstance(node, ast.Add) and Comments.SIMPLE_CONCAT not in comments:
-            comments.append(Comment(type=CommentTypes.ACTIONABLE, params={}, comment=Comments.SIMPLE_CONCAT))
-
-        # Check for use of default arguments
-        elif isinstance(node, ast.arguments):
-            if node.defaults:
-                uses_def_arg = True
-                # Check if the default argument use is correct
-                try:
-                    if (node.defaults[0].s != "you" and Comments.WRONG_DEF_ARG not in comments):
-                        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.WRONG_DEF_ARG))
-                except Exception:
-                    if Comments.WRONG_DEF_ARG not in comments:
-                        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.WRONG_DEF_ARG))
-
-        # Check for use of unnecessary conditionals
-        elif isinstance(node, ast.If) and Comments.CONDITIONALS not in comments:
-            comments.append(Comment(type=CommentTypes.ACTIONABLE, params={}, comment=Comments.CONDITIONALS))
-
-        # Check for use of %-formatting
-        elif isinstance(node, ast.Mod) and Comments.PERCENT_FORMATTING not in comments:
-            comments.append(Comment(type=CommentTypes.ACTIONABLE, params={}, comment=Comments.PERCENT_FORMATTING))
-
-        # Check for a return statement
-        elif isinstance(node, ast.Return):
-            has_return = True
-
-        # Search for use of str.format
-        elif isinstance(node, ast.Call):
-            try:
-                uses_format = node.func.attr == "format"
-            except Exception:
-                pass
-
-        # Search for use of f-strings
+    uses_f_string: bool = False
+
+    def comment_on(self, node, comment_type, comment):
+        # Outermost first among nodes starting at the same place, as in the source.
+        position = (node.lineno, node.col_offset, -node.end_lineno, -node.end_col_offset)
+        self.located.append((position, Comment(type=comment_type, params={}, comment=comment)))
+
+
+RULES = RuleEngine()
+
+
+# Check for method called two_fer
+@RULES.on(ast.FunctionDef)
+def method_name(node, findings):
+    if node.name == "two_fer":
+        findings.has_method = True
+
+
+# Check for the use of string concatenation with + operator
+@RULES.on(ast.BinOp, ast.AugAssign, op=ast.Add)
+def simple_concat(node, findings):
+    findings.comment_on(node, CommentTypes.ACTIONABLE, Comments.SIMPLE_CONCAT)
+
+
+# Check for use of default arguments
+@RULES.on(ast.arguments)
+def default_argument(node, findings):
+    if node.defaults:
+        findings.uses_def_arg = True
+        # Check if the default argument use is correct
         try:
-            if isinstance(node, ast.FormattedValue):
-                uses_f_string = True
-        except AttributeError:
-            pass  # Fail if python version is too low
+            if node.defaults[0].s != "you":
+                findings.comment_on(node.defaults[0], CommentTypes.ESSENTIAL, Comments.WRONG_DEF_ARG)
+        except Exception:
+            findings.comment_on(node.defaults[0], CommentTypes.ESSENTIAL, Comments.WRONG_DEF_ARG)
+
+
+# Check for use of unnecessary conditionals
+@RULES.on(ast.If)
+def conditionals(node, findings):
+    findings.comment_on(node, CommentTypes.ACTIONABLE, Comments.CONDITIONALS)
+
+
+# Check for use of %-formatting
+@RULES.on(ast.BinOp, ast.AugAssign, op=ast.Mod)
+def percent_formatting(node, findings):
+    findings.comment_on(node, CommentTypes.ACTIONABLE, Comments.PERCENT_FORMATTING)
+
+
+# Check for a return statement
+@RULES.on(ast.Return)
+def return_statement(node, findings):
+    findings.has_return = True
+
+
+# Search for use of str.format
+@RULES.on(ast.Call, func=ast.Attribute)
+def format_call(node, findings):
+    if node.func.attr == "format":
+        findings.uses_format = True
+
 
-    if not has_method:
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_METHOD))
+# Search for use of f-strings
+@RULES.on(ast.FormattedValue)
+def f_string(node, findings):
+    findings.uses_f_string = True
 
-    if not uses_def_arg:
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_DEF_ARG))
 
-    if not has_return:
-        comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_RETURN))
+@RULES.after
+def in_source_order(findings):
+    findings.comments.extend(comment for _, comment in sorted(findings.located, key=lambda located: located[0]))
 
 
-    # Generate PyLint comments for additional feedback.
-    comments.extend(generate_pylint_comments(in_path))
+@RULES.after
+def no_method(findings):
+    if not findings.has_method:
+        findings.comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_METHOD))
 
 
-    # Process all comments and write out feedback.
-    if uses_format or uses_f_string:
-        return Analysis.summarize_comments(comments, output_file, ideal=True)
+@RULES.after
+def no_def_arg(findings):
+    if not findings.uses_def_arg:
+        findings.comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_DEF_ARG))
+
+
+@RULES.after
+def no_return(findings):
+    if not findings.has_return:
+        findings.comments.append(Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.NO_RETURN))
+
+
+def analyze_source(user_solution: str, in_path: Path) -> Analysis:
+    """
+    Analyze the source text of the user's Two Fer solution without touching the filesystem.
+
+    `in_path` only names the module for pylint; nothing is read or written.
+    """
+
+    # AST - if an AST can't be made, fail and bail
+    try:
+        with span("parse"):
+            tree = parse(user_solution)
+    except Exception:
+        # If the parse fails, assume malformed code and fail with an ESSENTIAL (required) type comment for the student
+        return Analysis.require([Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE)])
+
+    # Generate PyLint comments for additional feedback, running the exercise rules on the same walk.
+    findings = Findings()
+    with RULES.hosted(tree, findings):
+        pylint_comments = generate_pylint_comments(in_path, source=user_solution)
+
+    comments = findings.comments
+    comments.extend(pylint_comments)
+
+
+    # Process all comments into feedback.
+    if findings.uses_format or findings.uses_f_string:
+        return Analysis.summarize_comments(comments, ideal=True)
     else:
-        return Analysis.summarize_comments(comments, output_file)
+        return Analysis.summarize_comments(comments)
+
+
+def analyze(in_path: Path, out_path: Path):
+    """
+    Analyze the user's Two Fer solution to give feedback. Outputs a JSON that
+
+    conforms to https://github.com/exercism/docs/blob/main/building/tooling/analyzers/interface.md#output-format
+    """
+
+    output_file = out_path.parent.joinpath("analysis.json")
+
+    # input file - if it can't be found, fail and bail
+    try:
+        user_solution = read_solution(in_path)
+    except OSError:
+        # fail out fast with an ESSENTIAL (required) type comment for the student
+        comments = [Comment(type=CommentTypes.ESSENTIAL, params={}, comment=Comments.MALFORMED_CODE)]
+        return Analysis.require(comments).dump(output_file)
+
+    return analyze_source(user_solution, in_path).dump(output_file)
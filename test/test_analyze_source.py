@@ -0,0 +1,54 @@
+"""
+Run tests on the in-memory analysis API.
+"""
+
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import Exercise, ExerciseError, Summary, analyze_source
+from common.analysis import AnalysisEncoder
+
+
+GOLDEN = sorted(ROOT.glob("*/analysis.json"))
+
+
+@pytest.mark.parametrize("golden_path", GOLDEN, ids=(path.parent.name for path in GOLDEN))
+def test_source_analysis_matches_golden_file(golden_path):
+    """
+    Analyzing the source text gives the same result as the file-based CLI.
+    """
+    exercise = Exercise.factory(golden_path.parent.name, golden_path.parent, golden_path.parent)
+    source = exercise.in_path.read_text()
+
+    analysis = analyze_source(exercise.slug, source, exercise.in_path.name)
+
+    assert json.loads(json.dumps(analysis, cls=AnalysisEncoder)) == json.loads(golden_path.read_text())
+
+
+def test_malformed_source_requires_changes():
+    """
+    Source that can't be parsed is reported without reaching pylint.
+    """
+    analysis = analyze_source("two-fer", "fed test();")
+
+    assert analysis.summary is Summary.REQUIRE
+    assert [str(item.comment) for item in analysis.comment] == ["python.general.malformed_code"]
+
+
+def test_unknown_exercise():
+    """
+    An unknown slug is an ExerciseError, as with Exercise.factory.
+    """
+    with pytest.raises(ExerciseError):
+        analyze_source("no-such-exercise", "pass\n")
@@ -0,0 +1,52 @@
+"""
+Run tests on the batch manifest mode.
+"""
+
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.batch import run_manifest
+
+
+EXERCISES = ["two-fer", "black-jack", "yacht"]
+
+
+def test_batch_matches_golden_files_and_survives_failures():
+    """
+    Every good job matches its golden file; bad jobs are reported, not fatal.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        tmp = Path(tmp_dir)
+        jobs = []
+
+        for exercise in EXERCISES:
+            tmp.joinpath(exercise).mkdir()
+            jobs.append({"exercise": exercise, "input": str(ROOT.joinpath(exercise)), "output": str(tmp.joinpath(exercise))})
+
+        jobs.insert(1, {"exercise": "two-fer", "input": str(tmp.joinpath("missing")), "output": tmp_dir})
+        manifest = tmp.joinpath("jobs.jsonl")
+        manifest.write_text("\n".join(json.dumps(job) for job in jobs) + "\nnot json\n")
+        summary = tmp.joinpath("summary.jsonl")
+
+        totals = run_manifest(manifest, summary)
+        records = [json.loads(line) for line in summary.read_text().splitlines()]
+
+        for exercise in EXERCISES:
+            analysis = json.loads(tmp.joinpath(exercise, "analysis.json").read_text())
+            golden = json.loads(ROOT.joinpath(exercise, "analysis.json").read_text())
+            assert analysis == golden, f"{exercise} results must match the golden file"
+
+    assert totals == {"ok": 3, "error": 2}
+    # Manifest errors are reported straight away, then each exercise's group in manifest order.
+    assert [record["status"] for record in records] == ["error", "ok", "error", "ok", "ok"]
+    assert all("wall_time" in record for record in records[1:])
@@ -0,0 +1,35 @@
+"""
+Run tests on the precompiled bytecode tree.
+"""
+
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+REPO = ROOT.parent
+
+
+def test_analysis_runs_from_precompiled_bytecode():
+    """
+    A run using only the prebuilt tree gives the golden analysis, and lib/ is in the tree.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests") as tmp_dir:
+        bytecode = Path(tmp_dir, "bytecode")
+        subprocess.run([sys.executable, str(REPO.joinpath("bin", "build_bytecode.py")), "--output", str(bytecode)],
+                       check=True, capture_output=True)
+
+        compiled = {path.name.split(".")[0] for path in bytecode.rglob("*.pyc")}
+        assert {"exercise", "linter", "analyzer", "pylinter", "argparse"} <= compiled
+
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONPYCACHEPREFIX=str(bytecode))
+        subprocess.run([sys.executable, str(REPO.joinpath("bin", "run.py")), "two-fer",
+                        str(ROOT.joinpath("two-fer")), tmp_dir], env=env, check=True, capture_output=True)
+
+        analysis = json.loads(Path(tmp_dir, "analysis.json").read_text())
+
+    assert analysis == json.loads(ROOT.joinpath("two-fer", "analysis.json").read_text())
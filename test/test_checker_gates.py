@@ -0,0 +1,108 @@
+"""
+Run tests on leaving the checkers a module can't need out of its lint.
+"""
+
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import Exercise
+from common.checker_gates import ATTRIBUTE_ASSIGNMENT, PRIVATE_ATTRIBUTE, UNUSUAL_TEXT, features
+from common.checker_profile import CheckerProfile
+from common.exercise import read_solution
+from common.linter import get_linter
+from common.parsing import parse
+
+
+SOLUTIONS = [Exercise.factory(path.parent.name, path.parent, path.parent).in_path
+             for path in sorted(ROOT.glob("*/analysis.json"))]
+
+# Each sets off a checker that is gated, and is linted alongside a solution that doesn't.
+GATED = {
+    "protected.py": '"""P."""\n\n\ndef peek(thing):\n    """D."""\n    return thing._secret\n',
+    "unicode.py": '"""U."""\n\nNAME = "abc‮def"\nOTHER = "a\x1bb"\n',
+    "coding.py": '# -*- coding: latin-1 -*-\n"""C."""\n\nNAME = 1\n',
+    "raise.py": '"""R."""\n\n\ndef fail():\n    """D."""\n    raise NotImplemented\n',
+    "imports.py": '"""I."""\nVALUE = 1\nimport os, sys\n',
+    "methods.py": '"""M."""\n\n\nclass Thing:\n    """T."""\n\n    def method(x):\n        return 1\n',
+}
+
+PLAIN = '"""Plain."""\n\n\ndef double(number):\n    """D."""\n    return number * 2\n'
+
+
+def formatted(messages):
+    return [message.format("{line}:{column} {symbol} {msg}") for message in messages]
+
+
+def lint_both_ways(modules):
+    linter = get_linter()
+    try:
+        linter.gating = False
+        every = [formatted(messages) for messages in linter.lint_many(modules)]
+    finally:
+        linter.gating = True
+    return every, [formatted(messages) for messages in linter.lint_many(modules)]
+
+
+def test_features_find_the_constructs_of_a_module():
+    """
+    The scan finds node types, private and assigned attributes, and unusual text.
+    """
+    source = '"""F."""\nimport os\n\n\nclass Thing:\n    """T."""\n'
+    found = features(parse(source), source)
+    assert {"Import", "ClassDef"} <= found
+    assert not found & {PRIVATE_ATTRIBUTE, ATTRIBUTE_ASSIGNMENT, UNUSUAL_TEXT, "Try"}
+
+    source = 'thing.value = other._hidden\n'
+    assert {PRIVATE_ATTRIBUTE, ATTRIBUTE_ASSIGNMENT} <= features(parse(source), source)
+
+    for source in ('NAME = "café"\n', 'NAME = 1\r\n', '# coding: latin-1\nNAME = 1\n'):
+        assert UNUSUAL_TEXT in features(parse(source), source)
+
+
+def test_gated_checkers_are_left_out_only_where_they_have_nothing_to_check():
+    """
+    A module without imports doesn't run the imports checker; one with them does.
+    """
+    linter = get_linter()
+    linter.profile = profile = CheckerProfile()
+    try:
+        linter.lint_many([("plain.py", PLAIN)])
+        calls = {total["checker"]: total["calls"] for total in profile.by_checker()}
+        assert not calls.get("imports") and not calls.get("similarities") and not calls.get("unicode_checker")
+        assert calls["basic"]
+
+        linter.lint_many([("imports.py", GATED["imports.py"]), ("unicode.py", GATED["unicode.py"])])
+        calls = {total["checker"]: total["calls"] for total in profile.by_checker()}
+        assert calls["imports"] and calls["unicode_checker"]
+    finally:
+        linter.profile = None
+
+
+def test_gated_messages_are_still_reported():
+    """
+    Whatever a gated checker reports, it reports with the gates in place, whichever modules share the pass.
+    """
+    modules = [(name, source) for gated in GATED.items() for name, source in (gated, ("plain.py", PLAIN))]
+    every, gated = lint_both_ways(modules)
+
+    assert gated == every
+    assert all(messages for (name, _), messages in zip(modules, gated) if name != "plain.py")
+
+
+@pytest.mark.parametrize("solution", SOLUTIONS, ids=(path.parent.name for path in SOLUTIONS))
+def test_the_gates_leave_the_messages_of_a_solution_unchanged(solution):
+    """
+    Linting a solution with the gates gives the same messages as with every checker.
+    """
+    every, gated = lint_both_ways([(solution, read_solution(solution))])
+    assert gated == every
@@ -0,0 +1,81 @@
+"""
+Run tests on the per-checker profile of pylint.
+"""
+
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.checker_profile import CheckerProfile
+from common.linter import get_linter
+
+
+SOURCE = '''"""Module docstring."""
+import os
+
+
+def sign(number):
+    if number < 0:
+        return -1
+    elif number > 0:
+        return 1
+    return 0
+'''
+
+
+def symbols(messages):
+    return [(message.symbol, message.line) for message in messages]
+
+
+def test_profiling_leaves_the_messages_unchanged():
+    """
+    A profiled pass reports the same messages, and counts them and the checkers it timed.
+    """
+    linter = get_linter()
+    modules = [("profiled.py", SOURCE), ("other.py", '"""Empty."""\n')]
+    plain = [symbols(messages) for messages in linter.lint_many(modules)]
+
+    linter.profile = profile = CheckerProfile()
+    try:
+        profiled = [symbols(messages) for messages in linter.lint_many(modules)]
+    finally:
+        linter.profile = None
+
+    assert profiled == plain
+    assert profile.modules == 2
+    assert profile.emitted["unused-import"] == 1
+
+    checkers = {total["checker"]: total for total in profile.by_checker()}
+    assert checkers["variables"]["calls"] > 0
+    assert checkers["format"]["calls"] > 0  # a token checker
+    assert sum(total["seconds"] for total in checkers.values()) <= profile.seconds
+
+    messages = {total["message"]: total for total in profile.by_message()}
+    assert messages["no-else-return"]["emitted"] == 1
+    assert messages["no-else-return"]["calls"] > 0
+
+
+def test_the_report_ranks_the_costliest_first():
+    """
+    Checkers are listed slowest first, and the next pass is no longer profiled.
+    """
+    linter = get_linter()
+    linter.profile = profile = CheckerProfile()
+    try:
+        linter.lint_many([("ranked.py", SOURCE)])
+    finally:
+        linter.profile = None
+
+    times = [total["seconds"] for total in profile.by_checker()]
+    assert times == sorted(times, reverse=True)
+    assert any("variables" in line for line in profile.report())
+
+    linter.lint_many([("ranked.py", SOURCE)])
+    assert profile.modules == 1
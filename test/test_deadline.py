@@ -0,0 +1,105 @@
+"""
+Run tests on the time budget of an analysis.
+"""
+
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import analyze_source
+from common.deadline import DEADLINE_VARIABLE, budget, budget_seconds
+from common.lint_cache import get_lint_cache, lint_key
+from common.linter import PartialLint, get_linter
+from common.pylint_comments import PYLINTRC
+
+
+FUNCTIONS = 8
+
+# Every function is badly named, and each invalid-name is emitted as pylint visits it.
+def badly_named(functions, docstring="Many functions."):
+    return f'"""{docstring}"""\n' + "".join(
+        f'\n\ndef BadName{index}():\n    """Doc."""\n    return {index}\n' for index in range(functions))
+
+
+SOURCE = badly_named(FUNCTIONS)
+
+
+@pytest.fixture
+def slow_functions(monkeypatch):
+    """
+    Make pylint take a tenth of a second over every function.
+    """
+    checker = next(checker for checker in get_linter().linter.get_checkers() if checker.name == "basic")
+
+    def visit_functiondef(node):
+        time.sleep(0.1)
+
+    monkeypatch.setattr(checker, "visit_functiondef", visit_functiondef, raising=False)
+
+
+def invalid_names(messages):
+    return [message.line for message in messages if message.symbol == "invalid-name"]
+
+
+def test_a_lint_out_of_time_keeps_what_it_found(slow_functions):
+    """
+    A module is cut short at its timeout, and the next one is linted in full.
+    """
+    linter = get_linter()
+
+    start = time.perf_counter()
+    partial, complete = linter.lint_many([("slow.py", SOURCE), ("quick.py", badly_named(2))], timeout=0.35)
+
+    assert isinstance(partial, PartialLint)
+    assert 0 < len(invalid_names(partial)) < FUNCTIONS
+    assert not isinstance(complete, PartialLint)
+    assert len(invalid_names(complete)) == 2
+    assert time.perf_counter() - start < FUNCTIONS * 0.1
+
+
+def test_a_budget_of_nothing_stops_pylint_at_once():
+    """
+    Without any time left, pylint reports nothing instead of starting.
+    """
+    assert get_linter().lint("instant.py", SOURCE, timeout=0) == []
+
+
+def test_the_analysis_is_marked_partial_and_not_cached(slow_functions):
+    """
+    Running out of time still gives an analysis, flagged partial, whose lint isn't cached.
+    """
+    source = badly_named(FUNCTIONS, "Analyzed under a budget.")
+
+    with budget(0.4):
+        analysis = analyze_source("acronym", source)
+
+    assert analysis["partial"] is True
+    assert analysis["comments"]
+    assert lint_key(Path("acronym.py"), source, PYLINTRC) not in get_lint_cache()
+
+    assert "partial" not in analyze_source("acronym", badly_named(2, "In time."))
+
+
+def test_the_budget_comes_from_the_environment(monkeypatch):
+    """
+    ANALYZER_DEADLINE_MS sets the budget; unset, empty or zero means no limit.
+    """
+    monkeypatch.setenv(DEADLINE_VARIABLE, "1500")
+    assert budget_seconds() == 1.5
+
+    for value in ("", "0", "soon"):
+        monkeypatch.setenv(DEADLINE_VARIABLE, value)
+        assert budget_seconds() is None
+
+    with budget() as unlimited:
+        assert unlimited is None
@@ -0,0 +1,96 @@
+"""
+Run tests on the content-addressed pylint result cache.
+"""
+
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import lint_cache, pylint_comments
+from common.lint_cache import LintCache, LintMessage, lint_key
+from common.pylint_comments import PYLINTRC, generate_pylint_comments
+
+
+SOURCE = '''def sign(number):
+    if number < 0:
+        return -1
+    elif number > 0:
+        return 1
+    return 0
+'''
+
+
+def test_hit_returns_the_comments_of_a_fresh_lint(monkeypatch):
+    """
+    The second lint of the same module is served from memory, and is identical.
+    """
+    cache = LintCache()
+    monkeypatch.setattr(pylint_comments, "get_lint_cache", lambda: cache)
+
+    fresh = generate_pylint_comments(Path("sign.py"), source=SOURCE)
+    cached = generate_pylint_comments(Path("sign.py"), source=SOURCE)
+
+    assert fresh and cached == fresh
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "entries": 1}
+
+
+def test_key_covers_source_name_and_rcfile():
+    """
+    Changing the source, the module name or the rcfile contents changes the key.
+    """
+    key = lint_key("sign.py", SOURCE, PYLINTRC)
+
+    assert key == lint_key("sign.py", SOURCE, PYLINTRC)
+    assert key != lint_key("sign.py", SOURCE + "\n", PYLINTRC)
+    assert key != lint_key("other.py", SOURCE, PYLINTRC)
+
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests") as tmp_dir:
+        rcfile = Path(tmp_dir, "pylintrc")
+        rcfile.write_bytes(Path(PYLINTRC).read_bytes() + b"\n# changed\n")
+        assert key != lint_key("sign.py", SOURCE, str(rcfile))
+
+
+def test_disk_tier_is_shared_and_capped():
+    """
+    Results written by one cache are read by another, and old files are evicted past the cap.
+    """
+    message = LintMessage("R1705", "no-else-return", "Unnecessary elif", 2, "refactor")
+
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests") as tmp_dir:
+        writer = LintCache(directory=tmp_dir, max_bytes=1000)
+        writer.put("aa01", [message])
+
+        reader = LintCache(directory=tmp_dir)
+        assert reader.get("aa01") == [message]
+        assert reader.stats()["disk_hits"] == 1
+        assert reader.get("bb02") is None
+
+        os.utime(writer._path("aa01"), (0, 0))
+        for number in range(20):
+            writer.put(f"cc{number:02}", [message] * 2)
+
+        sizes = [os.path.getsize(os.path.join(root, name))
+                 for root, _, names in os.walk(tmp_dir) for name in names]
+        assert sum(sizes) <= 1000
+        assert not os.path.exists(writer._path("aa01"))
+
+
+def test_read_only_disk_tier_is_skipped():
+    """
+    A cache directory that can't be written to doesn't break linting.
+    """
+    cache = LintCache(directory="/proc/no-such-cache")
+    message = LintMessage("C0116", "missing-function-docstring", "Missing docstring", 1, "convention")
+
+    cache.put("dd03", [message])
+
+    assert cache.get("dd03") == [message]
@@ -0,0 +1,150 @@
+"""
+Run tests on the per-exercise lint profiles.
+"""
+
+
+import json
+import sys
+from importlib.metadata import version
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from pylint.checkers.raw_metrics import RawMetricsChecker
+
+import common.linter
+import common.lint_profiles
+from common import Exercise, analyze_source
+from common.exercise import read_solution
+from common.lint_cache import lint_key
+from common.lint_profiles import (BASE, LintProfile, build_profiles, current_profile, load_profiles,
+                                  profile_for, selected)
+from common.linter import Linter, compile_profile
+from common.pylint_comments import PYLINTRC
+
+
+SOLUTIONS = [Exercise.factory(path.parent.name, path.parent, path.parent).in_path
+             for path in sorted(ROOT.glob("*/analysis.json"))]
+
+# Pragmas naming a checker, or a message of one, that no message enabled leaves unused.
+PRAGMAS = ['"""Pragmas."""\n# pylint: disable=miscellaneous,metrics\nvalue = 1\n',
+           '"""Pragmas."""\nif True:\n    pass  # pylint: disable=unnecessary-pass\n',
+           '"""Pragmas."""\n# pylint: disable=fixme\nvalue = 1  # TODO later\n']
+
+UNDOCUMENTED = 'def leap_year(year):\n    return year % 4 == 0\n'
+
+OVERLAY = {"enable": [], "disable": ["missing-module-docstring"]}
+
+
+def pinned():
+    """
+    The version requirements.txt pins each package to.
+    """
+    requirements = ROOT.parent.joinpath("requirements.txt").read_text().splitlines()
+    return dict(line.replace(" ", "").split("==") for line in requirements if "==" in line)
+
+
+def formatted(messages):
+    return [message.format("{line}:{column} {msg_id} {symbol} {msg}") for message in messages]
+
+
+def symbols(analysis):
+    return [item.params["code"].split()[1] for item in analysis["comments"] if "code" in (item.params or {})]
+
+
+@pytest.fixture(scope="module")
+def linters():
+    """
+    A Linter configured by the rcfile, and one loaded from the compiled base profile, through JSON.
+    """
+    compiled = json.loads(json.dumps(compile_profile({})))
+    return Linter(PYLINTRC), Linter(PYLINTRC, LintProfile(BASE, {}, compiled))
+
+
+@pytest.mark.parametrize("module", [(str(path), read_solution(path)) for path in SOLUTIONS]
+                         + [(f"pragmas_{index}.py", source) for index, source in enumerate(PRAGMAS)],
+                         ids=[path.parent.name for path in SOLUTIONS] + [f"pragmas-{index}" for index in range(3)])
+def test_a_compiled_profile_lints_like_the_rcfile(linters, module):
+    """
+    The Linter of the compiled profile is configured the same and reports the same, in the same order.
+    """
+    configured, loaded = linters
+
+    assert vars(loaded.linter.config) == vars(configured.linter.config)
+    assert formatted(loaded.lint(*module)) == formatted(configured.lint(*module))
+
+
+def test_unused_checkers_are_not_instantiated(monkeypatch):
+    """
+    A checker without an enabled message is never initialized, nor walked.
+    """
+    compiled = compile_profile({})
+    assert ["pylint.checkers.raw_metrics", "RawMetricsChecker"] in compiled["unused"]
+
+    def refuse(self, linter):
+        raise AssertionError("RawMetricsChecker was instantiated")
+
+    monkeypatch.setattr(RawMetricsChecker, "__init__", refuse)
+    linter = Linter(PYLINTRC, LintProfile(BASE, {}, compiled))
+
+    assert not any(isinstance(checker, RawMetricsChecker) for checker in linter.linter.prepare_checkers())
+    assert linter.lint("unused.py", UNDOCUMENTED)
+
+
+def test_overlays_are_compiled_per_exercise(tmp_path):
+    """
+    An exercise's overlay becomes a profile of its own; the others share the base one.
+    """
+    config = tmp_path / "analyzers.json"
+    config.write_text(json.dumps({"leap": {"lint": {"disable": OVERLAY["disable"]}},
+                                  "black-jack": {"options": {"general_recommendations": True}}}))
+    profiles_path = tmp_path / "lint_profiles.json"
+
+    assert build_profiles(profiles_path, config) == 2
+    profiles = load_profiles(profiles_path)
+    assert sorted(profiles) == ["base", "leap"]
+    assert profiles["leap"].overlay == OVERLAY
+
+    base, leap = (Linter(PYLINTRC, profiles[name]) for name in (BASE, "leap"))
+    assert "missing-module-docstring" in [message.symbol for message in base.lint("leap.py", UNDOCUMENTED)]
+    assert "missing-module-docstring" not in [message.symbol for message in leap.lint("leap.py", UNDOCUMENTED)]
+
+    # Unbuilt, a profile is resolved from the rcfile and its overlay by the Linter.
+    assert load_profiles(tmp_path / "missing.json")[BASE] == LintProfile(BASE, {})
+
+
+def test_an_analysis_lints_with_the_profile_of_its_exercise(monkeypatch):
+    """
+    Only the exercise with the overlay is linted with it, and its lint is cached apart.
+    """
+    profiles = {BASE: LintProfile(BASE, {}), "leap": LintProfile("leap", OVERLAY)}
+    for module in (common.lint_profiles, common.linter):
+        monkeypatch.setattr(module, "get_lint_profiles", lambda: profiles)
+
+    with selected("leap"):
+        assert current_profile() is profiles["leap"]
+    assert current_profile() is profile_for("isogram") is profiles[BASE]
+
+    assert "missing-module-docstring" not in symbols(analyze_source("leap", UNDOCUMENTED))
+    assert "missing-module-docstring" in symbols(analyze_source("isogram", UNDOCUMENTED))
+
+    path = Path("leap.py")
+    assert lint_key(path, UNDOCUMENTED, PYLINTRC, profiles[BASE]) == lint_key(path, UNDOCUMENTED, PYLINTRC)
+    assert lint_key(path, UNDOCUMENTED, PYLINTRC, profiles["leap"]) != lint_key(path, UNDOCUMENTED, PYLINTRC)
+
+
+def test_pylint_and_astroid_are_the_pinned_versions():
+    """
+    The Linter relies on pylint's and astroid's internals, so it runs on exactly the versions it is written against.
+    """
+    pins = pinned()
+
+    assert sorted(pins) == ["astroid", "pylint"]
+    assert all(version(package) == pin for package, pin in pins.items())
@@ -0,0 +1,39 @@
+"""
+Run tests on the compiled pylint message details.
+"""
+
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.message_details import MessageDetails, build_bundle
+
+
+MESSAGES = LIBRARY.joinpath("common", "pylint_data", "messages")
+
+
+def test_bundle_matches_loose_files():
+    """
+    Every message reads the same from the bundle as from its own files.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests") as tmp_dir:
+        bundle = Path(tmp_dir, "messages.sqlite")
+        count = build_bundle(MESSAGES, bundle)
+
+        bundled = MessageDetails(bundle, MESSAGES)
+        loose = MessageDetails(Path(tmp_dir, "missing.sqlite"), MESSAGES)
+        symbols = sorted(entry.name for entry in os.scandir(MESSAGES) if entry.is_dir())
+
+        assert count == len(symbols)
+        for symbol in symbols:
+            assert bundled.lookup(symbol) == loose.lookup(symbol), symbol
+        assert bundled.lookup("no-such-message") == (None, None, None, None)
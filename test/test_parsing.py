@@ -0,0 +1,90 @@
+"""
+Run tests on the parse shared by the analyzers and pylint.
+"""
+
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import Exercise, analyze_source
+from common.exercise import read_solution
+from common.linter import get_linter
+from common.parsing import parse, parse_source
+
+
+SOLUTIONS = [Exercise.factory(path.parent.name, path.parent, path.parent).in_path
+             for path in sorted(ROOT.glob("*/analysis.json"))]
+
+
+def formatted(messages):
+    return [message.format("{line}:{column} {symbol} {msg}") for message in messages]
+
+
+def test_a_source_is_parsed_once():
+    """
+    The same text gives the same tree back, and a misplaced type comment is only a comment.
+    """
+    source = '"""Parsed once."""\n\nvalue = 1\n'
+    assert parse(source) is parse(source)
+
+    misplaced = 'if True:  # type: int\n    pass\n'
+    parsed = parse_source(misplaced)
+    assert not parsed.type_comments
+    assert isinstance(parsed.tree.body[0], ast.If)
+
+    with pytest.raises(SyntaxError):
+        parse("def broken(:\n")
+
+
+def test_linting_leaves_the_shared_tree_untouched():
+    """
+    Building astroid's module from the tree doesn't take its docstrings away from the analyzer.
+    """
+    source = '"""Module."""\n\n\nclass Thing:\n    """Class."""\n\n    def method(self):\n        """Method."""\n'
+    before = ast.dump(parse(source))
+
+    get_linter().lint("untouched.py", source)
+
+    assert ast.dump(parse(source)) == before
+
+
+@pytest.mark.parametrize("solution", SOLUTIONS, ids=(path.parent.name for path in SOLUTIONS))
+def test_the_shared_parse_gives_the_messages_of_pylints_own(solution, monkeypatch):
+    """
+    pylint reports the same from the shared tree as from parsing the solution itself.
+    """
+    linter = get_linter()
+    source = read_solution(solution)
+    parse(source)
+
+    shared = formatted(linter.lint(solution, source))
+    monkeypatch.setattr(linter, "get_ast", linter.linter.get_ast)
+    own = formatted(linter.lint(solution, source))
+
+    assert shared == own
+
+
+def test_what_only_astroid_rejects_is_still_analyzed():
+    """
+    A type comment astroid can't place (no space after the #) is valid Python: analyzed and linted, not malformed.
+    """
+    source = '"""Module."""\n\nX = True\nif X:  #type: bool\n    X = False\n'
+
+    with pytest.raises(SyntaxError):
+        parse_source(source)
+    assert isinstance(parse(source).body[2], ast.If)
+
+    analysis = analyze_source("two-fer", source)
+    comments = [str(item.comment) for item in analysis["comments"]]
+    assert "python.general.malformed_code" not in comments
+    assert any(comment.startswith("python.pylint.") for comment in comments)
@@ -0,0 +1,107 @@
+"""
+Run tests on the multi-process batch executor.
+"""
+
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import pool
+from common.jobs import Job
+
+
+EXERCISES = ["two-fer", "black-jack", "yacht"]
+
+needs_fork = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="patching the worker requires the fork start method")
+
+
+def make_jobs(tmp: Path):
+    jobs = []
+    for exercise in EXERCISES:
+        tmp.joinpath(exercise).mkdir()
+        jobs.append(Job(exercise, ROOT.joinpath(exercise), tmp.joinpath(exercise)))
+    return jobs
+
+
+def assert_matches_golden(tmp: Path):
+    for exercise in EXERCISES:
+        analysis = json.loads(tmp.joinpath(exercise, "analysis.json").read_text())
+        golden = json.loads(ROOT.joinpath(exercise, "analysis.json").read_text())
+        assert analysis == golden, f"{exercise} results must match the golden file"
+
+
+def test_workers_are_recycled():
+    """
+    Workers retire after max_tasks jobs and every job still matches its golden file.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        executor = pool.WorkerPool(workers=2, max_tasks=1)
+        results = list(executor.run(make_jobs(Path(tmp_dir))))
+        assert_matches_golden(Path(tmp_dir))
+
+    assert sorted(result["exercise"] for result in results) == sorted(EXERCISES)
+    assert all(result["status"] == "ok" for result in results)
+    assert executor.started == len(EXERCISES)
+
+
+@needs_fork
+def test_crashed_worker_is_replaced(monkeypatch):
+    """
+    A worker dying mid-job fails only that job; the rest of the batch completes.
+    """
+    real_run_job = pool.run_job
+
+    def crashing_run_job(job):
+        if job.exercise == "black-jack":
+            os._exit(3)
+        return real_run_job(job)
+
+    monkeypatch.setattr(pool, "run_job", crashing_run_job)
+
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        results = {result["exercise"]: result for result in pool.WorkerPool(workers=1).run(make_jobs(Path(tmp_dir)))}
+
+    assert results["black-jack"]["status"] == "error"
+    assert "exit code 3" in results["black-jack"]["error"]
+    assert results["two-fer"]["status"] == results["yacht"]["status"] == "ok"
+
+
+@needs_fork
+def test_a_crash_fails_only_its_own_job_in_a_group(monkeypatch):
+    """
+    A worker dying in a group of jobs for the same exercise fails the job that crashed, not the group.
+    """
+    real_run_job = pool.run_job
+
+    def crashing_run_job(job):
+        if job.output.name == "crasher":
+            os._exit(3)
+        return real_run_job(job)
+
+    monkeypatch.setattr(pool, "run_job", crashing_run_job)
+
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        jobs = []
+        for name in ("first", "crasher", "last"):
+            Path(tmp_dir, name).mkdir()
+            jobs.append(Job("two-fer", ROOT.joinpath("two-fer"), Path(tmp_dir, name)))
+        results = {Path(result["output"]).name: result for result in pool.WorkerPool(workers=1).run(jobs)}
+
+    assert sorted(results) == ["crasher", "first", "last"]
+    assert results["crasher"]["status"] == "error"
+    assert "exit code 3" in results["crasher"]["error"]
+    assert results["first"]["status"] == results["last"]["status"] == "ok"
@@ -0,0 +1,127 @@
+"""
+Run tests on the mapping of pylint messages to comments.
+"""
+
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.comment import CommentTypes
+from common.exercise import Exercise
+from common.linter import get_linter
+from common.pylint_comments import generate_pylint_comments
+
+
+ELIF_AFTER_RETURN = '''"""Module docstring."""
+
+
+def sign(number):
+    """Return the sign of number."""
+    if number < 0:
+        return -1
+    elif number > 0:
+        return 1
+    return 0
+'''
+
+NO_DOCSTRING = '''"""Module docstring."""
+
+
+def describe(number):
+    if number < 0:
+        return "negative"
+    if number > 0:
+        return "positive"
+    return "zero"
+'''
+
+DISABLED_DOCSTRING = '''"""Module docstring."""
+# pylint: disable=missing-function-docstring
+
+
+def describe(number):
+    if number < 0:
+        return "negative"
+    if number > 0:
+        return "positive"
+    return "zero"
+'''
+
+
+def test_message_fields_are_kept_intact():
+    """
+    Messages containing ", " and ending in a quote survive unchanged.
+    """
+    comments = generate_pylint_comments(Path("sign.py"), source=ELIF_AFTER_RETURN)
+
+    assert len(comments) == 1
+    assert comments[0].comment == "python.pylint.refactor"
+    assert comments[0].type is CommentTypes.ACTIONABLE
+    assert comments[0].params["lineno"] == "6"
+    assert comments[0].params["code"] == "R1705 no-else-return"
+    assert comments[0].params["message"] == ('Unnecessary "elif" after "return", '
+                                             'remove the leading "el" from "elif"')
+
+
+def test_missing_docstrings_are_informative():
+    """
+    Missing docstrings keep their pylint category but are only informative.
+    """
+    comments = generate_pylint_comments(Path("describe.py"), source=NO_DOCSTRING)
+
+    assert [comment.params["code"] for comment in comments] == ["C0116 missing-function-docstring"]
+    assert comments[0].comment == "python.pylint.convention"
+    assert comments[0].type is CommentTypes.INFORMATIVE
+
+
+def test_nothing_leaks_between_modules():
+    """
+    The reused linter starts each module afresh: pragmas and astroid trees don't carry over.
+    """
+    assert generate_pylint_comments(Path("describe.py"), source=DISABLED_DOCSTRING) == []
+
+    comments = generate_pylint_comments(Path("describe.py"), source=NO_DOCSTRING)
+
+    assert [comment.params["code"] for comment in comments] == ["C0116 missing-function-docstring"]
+
+
+def test_one_pass_matches_linting_alone():
+    """
+    Linting many modules in one pass gives each the messages it gets alone, and none across modules.
+    """
+    solutions = [Exercise.factory(path.parent.name, path.parent, path.parent).in_path
+                 for path in sorted(ROOT.glob("*/analysis.json"))]
+    # The same solution twice must not be reported as duplicate-code.
+    modules = [(str(path), path.read_text()) for path in solutions + solutions[-1:]]
+    linter = get_linter()
+
+    alone = [[message.format("{line} {symbol} {msg}") for message in linter.lint(*module)]
+             for module in modules]
+    results = linter.lint_many(modules)
+    together = [[message.format("{line} {symbol} {msg}") for message in messages] for messages in results]
+
+    assert together == alone
+    # Nothing was reported for the pass as a whole, e.g. duplicate-code at the end.
+    assert sum(len(messages) for messages in results) == len(linter.reporter.messages)
+
+
+def test_prelinted_modules_are_handed_to_lint_messages():
+    """
+    A module prelinted through get_linter() is what the comments are made from, without linting it again.
+    """
+    source = '"""Prelinted."""\n\nimport os\n'
+    get_linter().prelint([("prelinted.py", source)])
+
+    try:
+        comments = generate_pylint_comments("prelinted.py", source=source)
+        assert [comment.params["code"] for comment in comments] == ["W0611 unused-import"]
+        assert not get_linter().prelinted
+    finally:
+        get_linter().prelinted.clear()
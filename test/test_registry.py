@@ -0,0 +1,69 @@
+"""
+Run tests on the analyzer registry.
+"""
+
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import Exercise, analyze_source
+from common.registry import build_manifest, load_implementation, load_registry
+
+
+CLEAN_SOLUTION = '"""Nothing for pylint to say."""\n'
+
+
+def test_implementations_are_loaded_once():
+    """
+    Every known exercise resolves to an analyzer, sharing one module per implementation file.
+    """
+    analyzers = {slug: Exercise(slug, None, None, None).analyzer for slug in Exercise.available_analyzers()}
+
+    assert len(analyzers) >= 163
+    assert {id(analyzer.module) for analyzer in analyzers.values()} == {
+        id(load_implementation(config.implementation)) for config in Exercise.available_analyzers().values()}
+    assert len({id(analyzer.module) for analyzer in analyzers.values()}) == 2
+    assert analyzers["black-jack"].module is analyzers["leap"].module
+
+
+def test_general_recommendations_are_per_exercise():
+    """
+    Only exercises configured for them get the general recommendations.
+    """
+    with_recs = analyze_source("black-jack", CLEAN_SOLUTION)
+    without_recs = analyze_source("log-levels", CLEAN_SOLUTION)
+
+    assert [str(item.comment) for item in with_recs.comment] == ["python.general.general_recommendations"]
+    assert without_recs.comment == []
+
+
+def test_manifest_matches_sources():
+    """
+    The prebuilt manifest gives the same registry as reading the sources, with relative paths.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests") as tmp_dir:
+        manifest = Path(tmp_dir, "registry.json")
+        build_manifest(manifest)
+
+        assert str(LIBRARY) not in manifest.read_text()
+        assert load_registry(manifest) == load_registry(Path(tmp_dir, "missing.json"))
+
+
+def test_import_does_not_load_the_registry():
+    """
+    Importing common reads nothing; the registry is loaded on first lookup.
+    """
+    check = ("import common, common.registry as registry;"
+             "assert registry.get_registry.cache_info().currsize == 0;"
+             "assert 'two-fer' in common.Exercise.available_analyzers()")
+
+    subprocess.run([sys.executable, "-c", check], cwd=LIBRARY, check=True)
@@ -0,0 +1,186 @@
+"""
+Run tests on the single-pass rule engine.
+"""
+
+
+import ast
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import analyze_source, pylint_comments
+from common.analysis import AnalysisEncoder
+from common.lint_cache import LintCache
+from common.registry import get_registry, load_implementation
+from common.rules import RuleEngine, RuleRun
+
+
+# The two_fer function comes neither first nor last, in pylint's walk as in ast.walk's.
+NESTED_TWO_FER = '''def outer(name="you"):
+    def two_fer(name="you"):
+        return "One for " + name + ", one for me." % ()
+    return two_fer(name)
+
+
+def helper():
+    return "x".format()
+'''
+
+SOURCE = '''
+def greet(name="you"):
+    if not name:
+        return "One for " + name
+    return f"One for {name}" + "."
+'''
+
+
+def test_rules_dispatch_on_node_and_field_types():
+    """
+    Rules see only their node types, narrowed by field types, in ast.walk order.
+    """
+    engine = RuleEngine()
+    seen = []
+
+    @engine.on(ast.BinOp, op=ast.Add)
+    def concatenation(node, found):
+        found.append(("concatenation", node.lineno))
+
+    @engine.on(ast.Return, ast.If)
+    def flow(node, found):
+        found.append((type(node).__name__, node.lineno))
+
+    @engine.on(ast.expr, ast.stmt)
+    def everything(node, found):
+        pass
+
+    @engine.after
+    def done(found):
+        found.append("done")
+
+    stats = engine.run(ast.parse(SOURCE), seen)
+    walked = list(ast.walk(ast.parse(SOURCE)))
+
+    assert seen == [("If", 3), ("Return", 5), ("Return", 4), ("concatenation", 5), ("concatenation", 4), "done"]
+    assert stats["concatenation"].nodes == sum(isinstance(node, ast.BinOp) for node in walked)
+    assert stats["flow"].nodes == 3
+    assert stats["everything"].nodes == sum(isinstance(node, (ast.expr, ast.stmt)) for node in walked)
+    assert all(rule_stats.seconds >= 0 for rule_stats in stats.values())
+
+
+def test_stats_accumulate_over_runs():
+    """
+    The engine keeps running totals besides the per-run stats.
+    """
+    engine = RuleEngine()
+    engine.on(ast.Name)(lambda node, found: None)
+
+    engine.run(ast.parse("a = b"), None)
+    engine.run(ast.parse("c = d + e"), None)
+
+    assert engine.stats["<lambda>"].nodes == 5
+
+
+def counting_engine():
+    engine = RuleEngine()
+
+    @engine.on(ast.AST)
+    def every(node, found):
+        found.append(node)
+
+    return engine
+
+
+def test_hosted_rules_ride_along_with_pylint():
+    """
+    Hosted over pylint's walk, the rules see every node during that one traversal, and none again after it.
+    """
+    from common.linter import get_linter
+    from common.parsing import parse
+
+    tree = parse(SOURCE)
+    found = []
+
+    with counting_engine().hosted(tree, found) as run:
+        get_linter().lint_many([("hosted.py", SOURCE)])
+        assert run.complete
+        during = list(found)
+
+    assert found == during
+    assert sorted(map(id, found)) == sorted(map(id, ast.walk(tree)))
+    assert run.stats["every"].nodes == len(found)
+
+
+def test_hosted_rules_see_what_pylint_does_not_walk():
+    """
+    Docstrings and a class's keywords are left out of pylint's walk, but still handed to the rules during it.
+    """
+    from common.linter import get_linter
+    from common.parsing import parse
+
+    source = '"""Module."""\n\n\nclass Meta(type, metaclass=type):\n    """Class."""\n'
+    tree = parse(source)
+    found = []
+
+    with counting_engine().hosted(tree, found) as run:
+        get_linter().lint_many([("hosted.py", source)])
+        during = list(found)
+
+    assert run.complete
+    assert sorted(map(id, during)) == sorted(map(id, ast.walk(tree)))
+
+
+def test_hosted_rules_run_on_their_own_without_a_lint():
+    """
+    When pylint never walks the tree (ie its messages were cached) the rules still run, in ast.walk order.
+    """
+    tree = ast.parse(SOURCE)
+    found = []
+
+    with counting_engine().hosted(tree, found) as run:
+        pass
+
+    assert found == list(ast.walk(tree))
+    assert not run.complete
+
+
+def test_hosted_rules_are_the_same_cold_and_cached(monkeypatch):
+    """
+    An exercise's rules find the same, in the same order, whether pylint walks the solution or its lint is cached.
+    """
+    cache = LintCache()
+    monkeypatch.setattr(pylint_comments, "get_lint_cache", lambda: cache)
+
+    cold = json.dumps(analyze_source("two-fer", NESTED_TWO_FER), cls=AnalysisEncoder)
+    cached = json.dumps(analyze_source("two-fer", NESTED_TWO_FER), cls=AnalysisEncoder)
+
+    assert cache.stats()["hits"] == 1
+    assert cold == cached
+    assert "python.two-fer.no_method" not in cold
+
+
+def test_two_fer_rules_do_not_depend_on_visit_order():
+    """
+    The two-fer rules find the same whichever order the nodes come in.
+    """
+    two_fer = load_implementation(get_registry()["two-fer"].implementation)
+    tree = ast.parse(NESTED_TWO_FER + "\n\ndef two_fer_alias(name):\n    if name:\n        return name % ()\n")
+
+    forward, backward = two_fer.Findings(), two_fer.Findings()
+    for findings, nodes in ((forward, list(ast.walk(tree))), (backward, list(reversed(list(ast.walk(tree)))))):
+        run = RuleRun(two_fer.RULES, tree, findings)
+        for node in nodes:
+            run.visit(node)
+        run.complete = True
+        run.finish()
+
+    # All but `located`, where the rules record as they go.
+    assert replace(forward, located=[]) == replace(backward, located=[])
+    assert forward.comments and forward.has_method and forward.uses_format
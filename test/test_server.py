@@ -0,0 +1,105 @@
+"""
+Run tests on the analyzer daemon.
+"""
+
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common.server import HTTPAnalyzerServer, UnixAnalyzerServer
+
+
+EXERCISES = ["two-fer", "black-jack"]
+
+
+@pytest.fixture
+def unix_server():
+    """
+    A Unix socket daemon running in a background thread.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        server = UnixAnalyzerServer(Path(tmp_dir).joinpath("analyzer.sock"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def http_server():
+    """
+    An HTTP daemon running in a background thread on a free port.
+    """
+    server = HTTPAnalyzerServer(0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("exercise", EXERCISES)
+def test_unix_socket_matches_golden_file(unix_server, exercise):
+    """
+    Jobs sent over the Unix socket produce the golden analysis.json.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        job = {"exercise": exercise, "input": str(ROOT.joinpath(exercise)), "output": tmp_dir}
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(unix_server.socket_path))
+            client.sendall(json.dumps(job).encode("utf-8") + b"\n")
+            result = json.loads(client.makefile("rb").readline())
+
+        analysis = json.loads(Path(tmp_dir).joinpath("analysis.json").read_text())
+        golden = json.loads(ROOT.joinpath(exercise, "analysis.json").read_text())
+
+    assert result["status"] == "ok", result
+    assert analysis == golden, "results must match the golden file"
+
+
+def test_http_matches_golden_file(http_server):
+    """
+    Jobs posted over HTTP produce the golden analysis.json.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        job = {"exercise": "two-fer", "input": str(ROOT.joinpath("two-fer")), "output": tmp_dir}
+        request = urllib.request.Request(f"http://127.0.0.1:{http_server.server_port}/analyze",
+                                         data=json.dumps(job).encode("utf-8"),
+                                         headers={"Content-Type": "application/json"})
+
+        with urllib.request.urlopen(request) as response:
+            result = json.loads(response.read())
+
+        analysis = json.loads(Path(tmp_dir).joinpath("analysis.json").read_text())
+        golden = json.loads(ROOT.joinpath("two-fer", "analysis.json").read_text())
+
+    assert result["status"] == "ok", result
+    assert analysis == golden, "results must match the golden file"
+
+
+def test_bad_job_is_reported(unix_server):
+    """
+    A malformed job is answered with an error instead of killing the daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(unix_server.socket_path))
+        client.sendall(b'{"exercise": "two-fer"}\n')
+        result = json.loads(client.makefile("rb").readline())
+
+    assert result["status"] == "error"
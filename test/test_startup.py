@@ -0,0 +1,43 @@
+"""
+Run tests on start-up costs: lazy imports and --profile-startup.
+"""
+
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+REPO = ROOT.parent
+LIBRARY = REPO.joinpath("lib").resolve(strict=True)
+
+
+def test_malformed_code_never_imports_pylint():
+    """
+    A solution that doesn't parse is answered without importing pylint or astroid.
+    """
+    check = ("import sys, common;"
+             "analysis = common.analyze_source('two-fer', 'fed test();');"
+             "assert str(analysis.summary) == str(common.Summary.REQUIRE), analysis;"
+             "assert 'pylint' not in sys.modules and 'astroid' not in sys.modules")
+
+    subprocess.run([sys.executable, "-c", check], cwd=LIBRARY, check=True)
+
+
+def test_profile_startup_prints_import_tree():
+    """
+    --profile-startup analyzes as usual and reports the import tree and time to first analysis.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        run = subprocess.run([sys.executable, str(REPO.joinpath("bin", "run.py")), "two-fer",
+                              str(ROOT.joinpath("two-fer")), tmp_dir, "--profile-startup"],
+                             capture_output=True, text=True, check=True)
+
+        assert Path(tmp_dir, "analysis.json").is_file()
+
+    lines = run.stdout.splitlines()
+    assert lines[0].split() == ["cumulative", "self", "module"]
+    assert any(line.endswith("  common.linter") for line in lines)
+    assert lines[-1].startswith("first analysis after ")
+    assert "import time:" not in run.stderr
@@ -0,0 +1,98 @@
+"""
+Run tests on the per-phase timing of an analysis.
+"""
+
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import Exercise
+from common.timing import PHASES, TIMING_VARIABLE, record, span
+
+
+def test_spans_outside_a_recording_are_ignored():
+    """
+    Spans run with nothing recording neither fail nor leak into a later recording.
+    """
+    with span("parse"):
+        pass
+
+    with record() as timings:
+        pass
+
+    assert timings.phases == {}
+    assert timings.total >= 0
+
+
+def test_spans_add_up_in_the_innermost_recording():
+    """
+    Repeated spans of a phase are summed, and nested recordings don't share spans.
+    """
+    with record() as outer:
+        with span("parse"):
+            pass
+        with record() as inner:
+            with span("rules"):
+                pass
+        with span("parse"):
+            pass
+
+    assert set(outer.phases) == {"parse"}
+    assert set(inner.phases) == {"rules"}
+    assert outer.total >= inner.total
+
+
+def test_an_analysis_records_every_phase(tmp_path):
+    """
+    A two-fer analysis goes through all the phases, which fit in its total time.
+    """
+    exercise = Exercise.factory("two-fer", ROOT.joinpath("two-fer"), tmp_path)
+
+    with record() as timings:
+        exercise.analyze()
+
+    assert set(timings.phases) == set(PHASES)
+    assert sum(timings.phases.values()) <= timings.total
+
+
+def test_timing_file_is_written_next_to_the_analysis(tmp_path, monkeypatch):
+    """
+    With ANALYZER_TIMING=file the spans go to timing.json, and analysis.json is unchanged.
+    """
+    exercise = Exercise.factory("two-fer", ROOT.joinpath("two-fer"), tmp_path)
+
+    exercise.analyze()
+    plain = tmp_path.joinpath("analysis.json").read_text()
+
+    monkeypatch.setenv(TIMING_VARIABLE, "file")
+    exercise.analyze()
+
+    assert tmp_path.joinpath("analysis.json").read_text() == plain
+
+    timing = json.loads(tmp_path.joinpath("timing.json").read_text())
+    assert timing["exercise"] == "two-fer"
+    assert [span["phase"] for span in timing["spans"]] == list(PHASES)
+    starts = [span["start_ms"] for span in timing["spans"]]
+    assert starts == sorted(starts)
+    assert all(span["peak_rss_kib"] <= timing["peak_rss_kib"] for span in timing["spans"])
+
+
+def test_timing_log_is_one_json_line_on_stderr(tmp_path, monkeypatch, capsys):
+    """
+    With ANALYZER_TIMING=log the spans are logged instead of written to a file.
+    """
+    monkeypatch.setenv(TIMING_VARIABLE, "log")
+    Exercise.factory("two-fer", ROOT.joinpath("two-fer"), tmp_path).analyze()
+
+    lines = [line for line in capsys.readouterr().err.splitlines() if "analysis_timing" in line]
+    assert len(lines) == 1
+    assert set(json.loads(lines[0])["phases_ms"]) == set(PHASES)
+    assert not tmp_path.joinpath("timing.json").exists()
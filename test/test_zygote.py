@@ -0,0 +1,77 @@
+"""
+Run tests on the pre-fork (zygote) runner.
+"""
+
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+LIBRARY = ROOT.parent.joinpath("lib").resolve(strict=True)
+
+# add the library to sys.path so common modules can be imported by analyzer
+if str(LIBRARY) not in sys.path:
+    sys.path.insert(0, str(LIBRARY))
+
+from common import zygote
+from common.batch import run_serially
+from common.jobs import Job
+from common.linter import Linter
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+
+
+@pytest.fixture(scope="module")
+def warm_zygote():
+    """
+    One warmed parent shared by every test in this module.
+    """
+    return zygote.Zygote()
+
+
+@pytest.mark.parametrize("exercise", ["two-fer", "card-games"])
+def test_forked_job_matches_golden_file(warm_zygote, exercise):
+    """
+    A job run in a forked child produces the golden analysis.json.
+    """
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        result = warm_zygote.run(Job(exercise, ROOT.joinpath(exercise), Path(tmp_dir)))
+        analysis = json.loads(Path(tmp_dir).joinpath("analysis.json").read_text())
+        golden = json.loads(ROOT.joinpath(exercise, "analysis.json").read_text())
+
+    assert result["status"] == "ok", result
+    assert analysis == golden, "results must match the golden file"
+
+
+def test_crashed_child_is_reported(warm_zygote, monkeypatch):
+    """
+    A child dying mid-job is reported as an error and leaves the parent usable.
+    """
+    monkeypatch.setattr(zygote, "run_job", lambda job: os._exit(7))
+
+    result = warm_zygote.run(Job("two-fer", ROOT.joinpath("two-fer"), ROOT.joinpath("two-fer")))
+
+    assert result["status"] == "error"
+    assert "exit code 7" in result["error"]
+
+
+def test_a_batch_run_by_the_zygote_is_not_linted_in_the_parent(warm_zygote, monkeypatch):
+    """
+    With --fork, no solution of a group is linted in the parent before the children are forked.
+    """
+    prelinted = []
+    monkeypatch.setattr(Linter, "prelint", lambda self, modules, timeout=None: prelinted.extend(modules))
+
+    with tempfile.TemporaryDirectory(prefix="test-analyzer-tests", dir=ROOT) as tmp_dir:
+        jobs = [Job(exercise, ROOT.joinpath(exercise), Path(tmp_dir, exercise)) for exercise in ("two-fer", "card-games")]
+        for job in jobs:
+            job.output.mkdir()
+        results = list(run_serially(jobs, runner=warm_zygote.run))
+
+    assert [result["status"] for result in results] == ["ok", "ok"], results
+    assert prelinted == []